@@ -0,0 +1,129 @@
+# File: scripts/bench_imports.py
+# Coût d'import au démarrage de chaque vue de l'application Streamlit, mesuré
+# par `python -X importtime` dans un interpréteur neuf : ossature (streamlit +
+# app.views.common) puis module de la vue, avec ses imports les plus lourds.
+# Les mesures peuvent être enregistrées (JSON) et comparées à une référence ;
+# au-delà du budget (ossature + vue), le script échoue.
+
+import argparse
+import json
+import os
+import re
+import subprocess
+import sys
+from pathlib import Path
+
+import pandas as pd
+
+SRC = Path(__file__).resolve().parents[1] / "src"
+sys.path.insert(0, str(SRC))
+from app.views import VIEWS  # noqa: E402
+
+SHELL = "app.views.common"
+MARKER = "--homepedia-view--"
+# Budget de démarrage d'une vue, en ms (0 : pas de budget)
+IMPORT_BUDGET_MS = float(os.getenv("HOMEPEDIA_IMPORT_BUDGET_MS", "0"))
+LINE = re.compile(r"^import time:\s+\d+ \|\s+(\d+) \| ( *)(\S+)$")
+
+
+def parse_importtime(lines: list[str]) -> tuple[int, list[tuple[str, int]]]:
+    """
+    Temps cumulé (µs) des imports de premier niveau, et leurs imports
+    directs (module, µs) du plus lourd au plus léger.
+    """
+    total, children = 0, []
+    for line in lines:
+        m = LINE.match(line)
+        if not m:
+            continue
+        us, depth = int(m.group(1)), len(m.group(2)) // 2
+        if depth == 0:
+            total += us
+        elif depth == 1:
+            children.append((m.group(3), us))
+    return total, sorted(children, key=lambda c: -c[1])
+
+
+def measure(module: str) -> dict:
+    """Ossature puis `module`, importés dans un interpréteur neuf."""
+    code = (
+        f"import sys, {SHELL}; sys.stderr.write({MARKER!r} + '\\n'); "
+        f"import {module}"
+    )
+    env = {**os.environ, "PYTHONPATH": str(SRC)}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+    )
+    lines = proc.stderr.splitlines()
+    if proc.returncode != 0:
+        return {"erreur": lines[-1] if lines else f"code {proc.returncode}"}
+    cut = lines.index(MARKER) if MARKER in lines else len(lines)
+    shell_us, _ = parse_importtime(lines[:cut])
+    view_us, deps = parse_importtime(lines[cut + 1 :])
+    return {
+        "ossature_ms": shell_us / 1000,
+        "vue_ms": view_us / 1000,
+        "total_ms": (shell_us + view_us) / 1000,
+        "imports": [(name, us / 1000) for name, us in deps[:3]],
+    }
+
+
+def best_of(module: str, repeat: int) -> dict:
+    """Mesure la plus rapide sur `repeat` interpréteurs (bruit du cache disque)."""
+    runs = [measure(module) for _ in range(repeat)]
+    ok = [r for r in runs if "erreur" not in r]
+    return min(ok, key=lambda r: r["total_ms"]) if ok else runs[0]
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="Coût d'import par vue")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--out", help="enregistre les mesures (JSON)")
+    parser.add_argument("--baseline", help="mesures de référence (JSON)")
+    parser.add_argument(
+        "--budget-ms",
+        type=float,
+        default=IMPORT_BUDGET_MS,
+        help="temps maximal ossature + vue (0 : aucun)",
+    )
+    args = parser.parse_args(argv)
+
+    results = {
+        view: best_of(f"app.views.{module}", args.repeat)
+        for view, module in VIEWS.items()
+    }
+    baseline = {}
+    if args.baseline and os.path.exists(args.baseline):
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+
+    rows = []
+    for view, r in results.items():
+        if "erreur" in r:
+            rows.append({"vue": view, "principaux imports": r["erreur"]})
+            continue
+        row = {k: r[k] for k in ("ossature_ms", "vue_ms", "total_ms")}
+        if "total_ms" in baseline.get(view, {}):
+            row["delta_ms"] = r["total_ms"] - baseline[view]["total_ms"]
+        row["principaux imports"] = ", ".join(f"{n} {ms:.0f}" for n, ms in r["imports"])
+        rows.append({"vue": view, **row})
+    print(pd.DataFrame(rows).round(1).to_string(index=False))
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+
+    over = [
+        view
+        for view, r in results.items()
+        if args.budget_ms and r.get("total_ms", 0) > args.budget_ms
+    ]
+    if over:
+        sys.exit(f"Budget de {args.budget_ms:.0f} ms dépassé : {', '.join(over)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+# File: scripts/bench_sentiment.py
+# Banc d'essai des moteurs de sentiment sur les avis Hotel_Reviews : débit
+# (avis/s sur un cœur) et accord avec le moteur de référence (corrélation,
+# signe identique, écart absolu moyen).
+
+import argparse
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+from backend.comment_store import COMMENTS_DB, CommentStore  # noqa: E402
+from backend.sentiment import ENGINES  # noqa: E402
+
+COMMENTS_CSV = os.path.join("data", "processed", "comments.csv")
+# En deçà (en valeur absolue), un score compte comme neutre
+NEUTRAL = 0.05
+
+
+def load_texts(n: int, store: str, csv: str) -> list[str]:
+    """Échantillon aléatoire du magasin, à défaut les n premières lignes du CSV."""
+    if os.path.exists(store):
+        comments = CommentStore(store, readonly=True)
+        try:
+            return comments.sample(n, seed=0)["commentaire"].tolist()
+        finally:
+            comments.close()
+    return pd.read_csv(csv, nrows=n)["commentaire"].astype(str).tolist()
+
+
+def run(engine: str, texts: list[str], batch: int) -> tuple[np.ndarray, float]:
+    """Scores et durée (s) du moteur, lot par lot dans le processus courant."""
+    score = ENGINES[engine]
+    score(texts[:10])  # chargement du lexique / des modules hors mesure
+    start = time.perf_counter()
+    out = [s for i in range(0, len(texts), batch) for s in score(texts[i : i + batch])]
+    return np.asarray(out), time.perf_counter() - start
+
+
+def agreement(ref: np.ndarray, other: np.ndarray) -> dict[str, float]:
+    sign = np.sign(np.where(np.abs(ref) < NEUTRAL, 0, ref))
+    other_sign = np.sign(np.where(np.abs(other) < NEUTRAL, 0, other))
+    return {
+        "pearson": float(np.corrcoef(ref, other)[0, 1]),
+        "meme_signe": float((sign == other_sign).mean()),
+        "ecart_moyen": float(np.abs(ref - other).mean()),
+    }
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(
+        description="Banc d'essai des moteurs de sentiment"
+    )
+    parser.add_argument("-n", type=int, default=20_000, help="avis évalués")
+    parser.add_argument("--engines", nargs="+", default=["textblob", "lexicon"])
+    parser.add_argument("--batch", type=int, default=2000)
+    parser.add_argument("--store", default=COMMENTS_DB)
+    parser.add_argument("--csv", default=COMMENTS_CSV)
+    args = parser.parse_args(argv)
+
+    texts = load_texts(args.n, args.store, args.csv)
+    print(f"{len(texts):,} avis, lots de {args.batch}")
+    results = {engine: run(engine, texts, args.batch) for engine in args.engines}
+
+    ref_name = args.engines[0]
+    ref = results[ref_name][0]
+    rows = []
+    for engine, (scores, seconds) in results.items():
+        row = {"moteur": engine, "secondes": seconds, "avis/s": len(texts) / seconds}
+        if engine != ref_name:
+            row.update(agreement(ref, scores))
+        rows.append(row)
+    print(f"Référence : {ref_name}")
+    print(pd.DataFrame(rows).round(3).to_string(index=False))
+
+
+if __name__ == "__main__":
+    main()
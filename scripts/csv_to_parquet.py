@@ -1,13 +1,138 @@
+import argparse
+import fnmatch
 import glob
 import os
+from concurrent.futures import ProcessPoolExecutor
 
-import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pv
+import pyarrow.parquet as pq
 
 PROCESSED = os.path.join("data", "processed")
 
-for csv in glob.glob(os.path.join(PROCESSED, "*.csv")):
-    df = pd.read_csv(csv, dtype=str)
-    out = csv.replace(".csv", ".parquet")
-    df.to_parquet(out, compression="snappy")
-    print("→", out)
-print("✅ Conversion terminée.")
+# Codes (département, région…) : chaînes encodées en dictionnaire
+CODE = pa.dictionary(pa.int32(), pa.string())
+
+# Schéma déclaré par jeu de données (motif du nom de fichier → colonnes)
+SCHEMAS = {
+    "unemployment_dept.csv": {
+        "code": CODE,
+        "libelle": pa.string(),
+        "taux_chomage": pa.float64(),
+    },
+    "income_dept.csv": {"code": CODE, "income_median": pa.float64()},
+    "population_dept.csv": {"code": CODE, "population": pa.int64()},
+    "poverty_dept.csv": {"code": CODE, "poverty_rate": pa.float64()},
+    "comments.csv": {"commentaire": pa.string()},
+    "transactions_*.csv": {
+        "date_mutation": pa.date32(),
+        "nature_mutation": CODE,
+        # '123456,78' (format DVF) : lu en texte puis converti, cf. fix_batch
+        "valeur_fonciere": pa.string(),
+        # '75001.0' : lu en texte puis normalisé sur 5 caractères
+        "code_postal": pa.string(),
+        "commune": pa.string(),
+        "type_local": CODE,
+        "surface_reelle_bati": pa.float64(),
+        "nombre_pieces_principales": pa.float64(),
+    },
+}
+
+# Sans schéma déclaré : types inférés, sauf les codes gardés en texte ('01')
+DEFAULT_TYPES = {"code": CODE, "code_region": CODE, "dept": CODE}
+
+# Lignes par row group (statistiques min/max écrites pour chacun)
+ROW_GROUP_SIZE = 128 * 1024
+# Taille des blocs lus par le lecteur CSV en flux
+BLOCK_SIZE = 16 << 20
+
+
+def schema_for(path: str) -> dict | None:
+    name = os.path.basename(path)
+    return next((s for pat, s in SCHEMAS.items() if fnmatch.fnmatch(name, pat)), None)
+
+
+def fix_batch(batch: pa.RecordBatch) -> pa.RecordBatch:
+    """Conversions non couvertes par le lecteur CSV (colonnes transactions)."""
+    cols = dict(zip(batch.schema.names, batch.columns, strict=True))
+    if "valeur_fonciere" in cols:
+        valeur = pc.replace_substring(cols["valeur_fonciere"], " ", "")
+        valeur = pc.replace_substring(valeur, ",", ".")
+        cols["valeur_fonciere"] = pc.cast(valeur, pa.float64())
+    if "code_postal" in cols:
+        cp = pc.replace_substring_regex(cols["code_postal"], r"\.0$", "")
+        cols["code_postal"] = pc.utf8_lpad(cp, 5, "0")
+    if "nombre_pieces_principales" in cols:
+        cols["nombre_pieces_principales"] = pc.cast(
+            cols["nombre_pieces_principales"], pa.int16()
+        )
+    return pa.RecordBatch.from_arrays(list(cols.values()), names=list(cols))
+
+
+def convert(csv: str) -> tuple[str, int]:
+    """Convertit un CSV en Parquet par blocs, sans le charger en entier."""
+    schema = schema_for(csv)
+    convert_options = pv.ConvertOptions(
+        column_types=schema or DEFAULT_TYPES,
+        include_columns=list(schema) if schema else None,
+        strings_can_be_null=True,
+    )
+    reader = pv.open_csv(
+        csv,
+        read_options=pv.ReadOptions(block_size=BLOCK_SIZE),
+        convert_options=convert_options,
+    )
+    out = csv[: -len(".csv")] + ".parquet"
+    tmp = out + ".tmp"
+
+    n_rows = 0
+    pending, n_pending = [], 0
+    writer = None
+    try:
+        for batch in reader:
+            batch = fix_batch(batch)
+            if writer is None:
+                writer = pq.ParquetWriter(
+                    tmp, batch.schema, compression="zstd", write_statistics=True
+                )
+            pending.append(batch)
+            n_pending += batch.num_rows
+            if n_pending >= ROW_GROUP_SIZE:
+                writer.write_table(
+                    pa.Table.from_batches(pending), row_group_size=ROW_GROUP_SIZE
+                )
+                n_rows += n_pending
+                pending, n_pending = [], 0
+        if writer is None:
+            empty = pa.RecordBatch.from_pylist([], schema=reader.schema)
+            writer = pq.ParquetWriter(tmp, fix_batch(empty).schema, compression="zstd")
+        if pending:
+            writer.write_table(pa.Table.from_batches(pending))
+            n_rows += n_pending
+    finally:
+        if writer is not None:
+            writer.close()
+    os.replace(tmp, out)
+    return out, n_rows
+
+
+def main(argv=None) -> None:
+    parser = argparse.ArgumentParser(description="CSV traités → Parquet typé")
+    parser.add_argument("files", nargs="*", help="CSV à convertir (tous par défaut)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count())
+    args = parser.parse_args(argv)
+
+    files = args.files or sorted(glob.glob(os.path.join(PROCESSED, "*.csv")))
+    for csv in files:
+        if schema_for(csv) is None:
+            print("⚠️  Pas de schéma déclaré (types inférés) :", csv)
+
+    with ProcessPoolExecutor(max_workers=args.workers) as pool:
+        for out, n_rows in pool.map(convert, files):
+            print(f"→ {out} ({n_rows} lignes)")
+    print("✅ Conversion terminée.")
+
+
+if __name__ == "__main__":
+    main()
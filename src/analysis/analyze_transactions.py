@@ -13,33 +13,26 @@ DB_PATH = os.path.join("data", "homepedia.db")
 logger.info("Ouverture de la base SQLite : %s", DB_PATH)
 conn = sqlite3.connect(DB_PATH)
 
-# 2. Chargement des données et conversion de la valeur foncière
+# 2. Chargement des données (valeur_fonciere, prix_m2 et dept normalisés au
+#    chargement ; prix_m2 est NULL quand la surface bâtie est nulle)
 query = """
-SELECT
-  *,
-  CAST(REPLACE(REPLACE(valeur_fonciere,' ',''),',','.') AS REAL) AS valeur_fonciere_num
+SELECT *
 FROM transactions
+WHERE prix_m2 IS NOT NULL
 """
 logger.info("Exécution de la requête SQL pour charger les transactions")
 df = pd.read_sql_query(query, conn, parse_dates=["date_mutation"])
 
-# 3. Prétraitements
-logger.info("Prétraitements : casting, filtrage des surfaces > 0 et calcul prix/m²")
-df["surface_reelle_bati"] = pd.to_numeric(df["surface_reelle_bati"], errors="coerce")
-df = df[df["surface_reelle_bati"] > 0]
-df["prix_m2"] = df["valeur_fonciere_num"] / df["surface_reelle_bati"]
-df["dept"] = df["code_postal"].astype(str).str[:2]
-
-# 4. Statistiques de base
+# 3. Statistiques de base
 logger.info("=== Aperçu des données ===\n%s", df.head(5))
 logger.info(
     "=== Statistiques numériques ===\n%s",
     df[
-        ["valeur_fonciere_num", "surface_reelle_bati", "nombre_pieces_principales"]
+        ["valeur_fonciere", "surface_reelle_bati", "nombre_pieces_principales"]
     ].describe(),
 )
 
-# 5. Nombre de transactions par département
+# 4. Nombre de transactions par département
 counts = df["dept"].value_counts().sort_index()
 out_dir = os.path.join("outputs", "figures")
 os.makedirs(out_dir, exist_ok=True)
@@ -54,7 +47,7 @@ plt.savefig(out_counts)
 plt.close()
 logger.info("Graphique sauvegardé : %s", out_counts)
 
-# 6. Prix moyen au m² par département
+# 5. Prix moyen au m² par département
 mean_price = df.groupby("dept")["prix_m2"].mean().sort_index()
 plt.figure()
 mean_price.plot.bar()
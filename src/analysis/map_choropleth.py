@@ -14,14 +14,9 @@ DB_PATH = os.path.join("data", "homepedia.db")
 logger.info("Connexion SQLite : %s", DB_PATH)
 conn = sqlite3.connect(DB_PATH)
 query = """
-SELECT
-  substr(code_postal,1,2) AS dept,
-  AVG(
-    CAST(REPLACE(REPLACE(valeur_fonciere,' ',''),',','.') AS REAL)
-    / surface_reelle_bati
-  ) AS prix_m2_moyen
+SELECT dept, AVG(prix_m2) AS prix_m2_moyen
 FROM transactions
-WHERE surface_reelle_bati > 0
+WHERE prix_m2 IS NOT NULL
 GROUP BY dept
 """
 logger.info("Exécution de la requête pour calculer le prix moyen au m² par département")
@@ -0,0 +1,49 @@
+# File: src/app/geo_assets.py
+# Lecture du magasin de géométries (src/backend/build_geo_assets.py) : GeoJSON
+# déjà simplifiés, quantifiés et sérialisés, passés tels quels à Folium.
+
+import os
+
+import pyarrow.parquet as pq
+
+ASSETS_PATH = os.getenv(
+    "HOMEPEDIA_GEO_ASSETS", os.path.join("data", "processed", "geo_assets.parquet")
+)
+
+# Zoom Leaflet maximal servi par chaque niveau (au-delà : niveau suivant)
+ZOOM_LEVELS = [(6, "low"), (8, "medium")]
+DEFAULT_LEVEL = "high"
+
+
+def load_assets(path: str = ASSETS_PATH) -> dict[tuple[str, str], str]:
+    """{(couche, niveau): GeoJSON}. À charger une fois par processus."""
+    if not os.path.exists(path):
+        raise FileNotFoundError(
+            f"Magasin de géométries absent : {path} "
+            "(lancer src/backend/build_geo_assets.py)"
+        )
+    table = pq.read_table(path, columns=["layer", "level", "geojson"])
+    return {
+        (layer, level): geojson
+        for layer, level, geojson in zip(
+            *(table.column(c).to_pylist() for c in ("layer", "level", "geojson")),
+            strict=True,
+        )
+    }
+
+
+def level_for_zoom(zoom: float) -> str:
+    """Niveau de simplification adapté au zoom de la carte."""
+    for max_zoom, level in ZOOM_LEVELS:
+        if zoom <= max_zoom:
+            return level
+    return DEFAULT_LEVEL
+
+
+def layer_geojson(assets: dict, layer: str, zoom: float) -> str:
+    """GeoJSON de `layer` au niveau du zoom (à défaut, le plus détaillé dispo)."""
+    preferred = level_for_zoom(zoom)
+    for level in (preferred, DEFAULT_LEVEL, "medium", "low"):
+        if (layer, level) in assets:
+            return assets[(layer, level)]
+    raise KeyError(f"Couche absente du magasin de géométries : {layer}")
@@ -0,0 +1,177 @@
+# File: src/app/query_backend.py
+# Moteurs de requêtes analytiques de l'application : SQLite (par défaut) ou
+# DuckDB sur un instantané Parquet de la base (exécution colonnaire et
+# vectorisée). Les vues écrivent un seul SQL (paramètres '?') compris des deux.
+
+import os
+from collections.abc import Iterator
+from pathlib import Path
+
+import pandas as pd
+
+from app.sqlite_pool import SQLitePool
+
+DB_PATH = os.getenv("DB_PATH", os.path.join("data", "homepedia.db"))
+# Instantané produit par src/backend/export_parquet_snapshot.py
+SNAPSHOT_DIR = os.getenv(
+    "HOMEPEDIA_SNAPSHOT_DIR", os.path.join("data", "processed", "snapshot")
+)
+# "sqlite" (par défaut) ou "duckdb"
+QUERY_BACKEND = os.getenv("HOMEPEDIA_QUERY_BACKEND", "sqlite")
+
+
+class SQLiteBackend:
+    """Requêtes sur homepedia.db via un pool de connexions en lecture seule."""
+
+    name = "sqlite"
+
+    def __init__(self, pool: SQLitePool):
+        self.pool = pool
+
+    def query(
+        self, sql: str, params=(), parse_dates: list[str] | None = None
+    ) -> pd.DataFrame:
+        with self.pool.connection() as conn:
+            return pd.read_sql_query(sql, conn, params=params, parse_dates=parse_dates)
+
+    def iter_chunks(
+        self,
+        sql: str,
+        params=(),
+        chunk_rows: int = 50_000,
+        parse_dates: list[str] | None = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Résultat par blocs de `chunk_rows` lignes (connexion gardée jusqu'au bout)."""
+        with self.pool.connection() as conn:
+            yield from pd.read_sql_query(
+                sql, conn, params=params, parse_dates=parse_dates, chunksize=chunk_rows
+            )
+
+    def fetchone(self, sql: str, params=()) -> tuple:
+        with self.pool.connection() as conn:
+            return conn.execute(sql, params).fetchone()
+
+    def fetchall(self, sql: str, params=()) -> list[tuple]:
+        with self.pool.connection() as conn:
+            return conn.execute(sql, params).fetchall()
+
+    def has_table(self, name: str) -> bool:
+        return bool(
+            self.fetchone(
+                "SELECT COUNT(*) FROM sqlite_master WHERE name = ? "
+                "AND type IN ('table', 'view')",
+                [name],
+            )[0]
+        )
+
+    def columns(self, table: str) -> list[tuple[str, str]]:
+        """(nom, type déclaré) des colonnes de `table`."""
+        return [(r[1], r[2]) for r in self.fetchall(f"PRAGMA table_info('{table}')")]
+
+    def stats(self) -> dict:
+        return self.pool.stats()
+
+
+def open_duckdb(snapshot_dir: str = SNAPSHOT_DIR):
+    """
+    Connexion DuckDB sur l'instantané Parquet : chaque fichier <table>.parquet
+    est exposé comme une vue du même nom, lue à la demande (projection et
+    filtres poussés jusqu'aux row groups).
+    """
+    import duckdb
+
+    files = sorted(Path(snapshot_dir).glob("*.parquet"))
+    if not files:
+        raise FileNotFoundError(
+            f"Instantané Parquet absent : {snapshot_dir} "
+            "(lancer src/backend/export_parquet_snapshot.py)"
+        )
+    conn = duckdb.connect()
+    for path in files:
+        conn.execute(f"CREATE VIEW {path.stem} AS SELECT * FROM read_parquet('{path}')")
+    return conn
+
+
+class DuckDBBackend:
+    """Requêtes DuckDB, un curseur par requête sur la connexion partagée."""
+
+    name = "duckdb"
+
+    def __init__(self, conn):
+        self.conn = conn
+
+    def query(
+        self, sql: str, params=(), parse_dates: list[str] | None = None
+    ) -> pd.DataFrame:
+        with self.conn.cursor() as cur:
+            df = cur.execute(sql, list(params)).df()
+        for col in parse_dates or []:
+            df[col] = pd.to_datetime(df[col])
+        return df
+
+    def iter_chunks(
+        self,
+        sql: str,
+        params=(),
+        chunk_rows: int = 50_000,
+        parse_dates: list[str] | None = None,
+    ) -> Iterator[pd.DataFrame]:
+        """Résultat par lots Arrow de `chunk_rows` lignes convertis en pandas."""
+        with self.conn.cursor() as cur:
+            cur.execute(sql, list(params))
+            for batch in cur.to_arrow_reader(chunk_rows):
+                df = batch.to_pandas()
+                for col in parse_dates or []:
+                    df[col] = pd.to_datetime(df[col])
+                yield df
+
+    def fetchone(self, sql: str, params=()) -> tuple:
+        with self.conn.cursor() as cur:
+            return cur.execute(sql, list(params)).fetchone()
+
+    def fetchall(self, sql: str, params=()) -> list[tuple]:
+        with self.conn.cursor() as cur:
+            return cur.execute(sql, list(params)).fetchall()
+
+    def has_table(self, name: str) -> bool:
+        return bool(
+            self.fetchone(
+                "SELECT COUNT(*) FROM information_schema.tables WHERE table_name = ?",
+                [name],
+            )[0]
+        )
+
+    def columns(self, table: str) -> list[tuple[str, str]]:
+        """(nom, type) des colonnes de `table`."""
+        return self.fetchall(
+            "SELECT column_name, data_type FROM information_schema.columns "
+            "WHERE table_name = ? ORDER BY ordinal_position",
+            [table],
+        )
+
+    def stats(self) -> dict:
+        return {}
+
+
+BACKENDS = {"sqlite": SQLiteBackend, "duckdb": DuckDBBackend}
+
+
+def open_resource(name: str | None = None):
+    """
+    Ressource partagée par le processus pour le moteur `name` : pool SQLite
+    ou connexion DuckDB. À mettre en cache (st.cache_resource) côté app.
+    """
+    name = (name or QUERY_BACKEND).lower()
+    if name not in BACKENDS:
+        raise ValueError(
+            f"Moteur de requêtes inconnu : {name!r} (choix : {sorted(BACKENDS)})"
+        )
+    return SQLitePool(DB_PATH) if name == "sqlite" else open_duckdb()
+
+
+def get_backend(name: str | None = None, resource=None):
+    """Moteur choisi (HOMEPEDIA_QUERY_BACKEND par défaut) sur `resource`."""
+    name = (name or QUERY_BACKEND).lower()
+    if resource is None:
+        resource = open_resource(name)
+    return BACKENDS[name](resource)
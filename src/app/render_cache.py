@@ -0,0 +1,122 @@
+# File: src/app/render_cache.py
+# Cache des rendus de l'application : HTML des cartes Folium et images des
+# figures Matplotlib, indexés par une empreinte des données agrégées et des
+# paramètres de style. Un rendu déjà produit est resservi sans reconstruire
+# ni carte ni figure (éviction LRU, taille bornée en octets).
+
+import hashlib
+import io
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+
+import numpy as np
+import pandas as pd
+
+MAX_BYTES = int(os.getenv("HOMEPEDIA_RENDER_CACHE_MB", "64")) * 1024 * 1024
+
+
+def fingerprint(*parts) -> str:
+    """
+    Empreinte blake2b de `parts` : DataFrame / Series (valeurs, index, colonnes
+    et types), tableaux numpy (octets bruts) ou tout autre objet (repr).
+    """
+    h = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        if isinstance(part, pd.DataFrame | pd.Series):
+            h.update(pd.util.hash_pandas_object(part, index=True).to_numpy().tobytes())
+            meta = (
+                part.dtypes.to_dict() if isinstance(part, pd.DataFrame) else part.dtype
+            )
+            h.update(repr((type(part).__name__, meta)).encode())
+        elif isinstance(part, np.ndarray):
+            h.update(repr((part.dtype.str, part.shape)).encode())
+            h.update(np.ascontiguousarray(part).tobytes())
+        else:
+            h.update(repr(part).encode())
+        h.update(b"\x1f")
+    return h.hexdigest()
+
+
+def _size(value: bytes | str) -> int:
+    return len(value) if isinstance(value, bytes) else len(value.encode())
+
+
+class RenderCache:
+    """Rendus (bytes ou str) par empreinte, LRU bornée à `max_bytes`."""
+
+    def __init__(self, max_bytes: int = MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[str, bytes | str] = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = self.misses = self.evictions = 0
+
+    def get(self, key: str) -> bytes | str | None:
+        with self._lock:
+            value = self._entries.get(key)
+            if value is None:
+                self.misses += 1
+            else:
+                self._entries.move_to_end(key)
+                self.hits += 1
+            return value
+
+    def put(self, key: str, value: bytes | str) -> None:
+        size = _size(value)
+        if size > self.max_bytes:
+            return  # plus gros que le cache entier : servi sans être conservé
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= _size(old)
+            self._entries[key] = value
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self._bytes -= _size(evicted)
+                self.evictions += 1
+
+    def get_or_render(self, key: str, render: Callable[[], bytes | str]):
+        """Rendu en cache pour `key`, sinon `render()` (hors verrou) mis en cache."""
+        value = self.get(key)
+        if value is None:
+            value = render()
+            self.put(key, value)
+        return value
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 3) if lookups else None,
+                "evictions": self.evictions,
+                "entries": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+            }
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+
+def figure_bytes(fig, fmt: str = "png", dpi: int = 100) -> bytes:
+    """Image de la figure (png ou svg), puis fermeture de la figure."""
+    import matplotlib.pyplot as plt
+
+    buf = io.BytesIO()
+    try:
+        fig.savefig(buf, format=fmt, dpi=dpi, bbox_inches="tight")
+    finally:
+        plt.close(fig)
+    return buf.getvalue()
+
+
+def map_html(m) -> str:
+    """Document HTML autonome de la carte Folium."""
+    return m.get_root().render()
@@ -0,0 +1,34 @@
+# File: src/app/sections.py
+# Sections d'une vue choisies par un st.radio : une fonction par section,
+# enregistrée sous son libellé ; seule la section choisie est exécutée à
+# chaque rerun (st.tabs exécuterait et enverrait toutes les sections). Sans
+# dépendance à streamlit, la répartition se teste seule.
+
+from collections.abc import Callable
+
+
+class Sections:
+    """Registre ordonné libellé → fonction d'affichage d'une section."""
+
+    def __init__(self):
+        self._funcs: dict[str, Callable] = {}
+
+    def __call__(self, label: str) -> Callable[[Callable], Callable]:
+        """Décorateur : enregistre la fonction comme section `label`."""
+
+        def register(func: Callable) -> Callable:
+            if label in self._funcs:
+                raise ValueError(f"Section déjà enregistrée : {label}")
+            self._funcs[label] = func
+            return func
+
+        return register
+
+    @property
+    def labels(self) -> list[str]:
+        """Libellés dans l'ordre d'enregistrement (options du st.radio)."""
+        return list(self._funcs)
+
+    def run(self, label: str, *args, **kwargs):
+        """Exécute la seule section `label`."""
+        return self._funcs[label](*args, **kwargs)
@@ -0,0 +1,107 @@
+# File: src/app/sqlite_pool.py
+# Pool de connexions SQLite en lecture seule partagé par tout le processus
+# Streamlit : les connexions (cache de pages, requêtes préparées, schéma déjà
+# analysé) survivent aux reruns au lieu d'être rouvertes à chaque interaction.
+
+import os
+import queue
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+POOL_SIZE = int(os.getenv("HOMEPEDIA_SQLITE_POOL_SIZE", "4"))
+# Délai maximal d'attente d'une connexion libre (secondes)
+ACQUIRE_TIMEOUT = float(os.getenv("HOMEPEDIA_SQLITE_POOL_TIMEOUT", "30"))
+
+# PRAGMA appliqués à chaque connexion à l'ouverture
+READ_PRAGMAS = {
+    "mmap_size": 256 * 1024 * 1024,  # lecture via mmap, sans copie dans le cache
+    "cache_size": -64_000,  # en KiB (~64 Mo) par connexion
+    "query_only": "ON",
+    "temp_store": "MEMORY",
+}
+
+
+class SQLitePool:
+    """
+    Au plus `size` connexions `mode=ro`, créées à la demande et prêtées une
+    requête à la fois (une connexion n'est jamais utilisée par deux threads
+    en même temps, d'où check_same_thread=False sans risque).
+    """
+
+    def __init__(self, db_path: str, size: int = POOL_SIZE):
+        self.db_path = db_path
+        self.size = size
+        self._idle: queue.LifoQueue[sqlite3.Connection] = queue.LifoQueue()
+        self._lock = threading.Lock()
+        self._stats = {"created": 0, "acquired": 0, "waited": 0, "wait_ms_max": 0.0}
+        self._in_use = 0
+
+    def _connect(self) -> sqlite3.Connection:
+        uri = f"file:{os.path.abspath(self.db_path)}?mode=ro"
+        conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        for name, value in READ_PRAGMAS.items():
+            conn.execute(f"PRAGMA {name}={value}")
+        return conn
+
+    def acquire(self, timeout: float = ACQUIRE_TIMEOUT) -> sqlite3.Connection:
+        start = time.perf_counter()
+        try:
+            conn = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                create = self._stats["created"] < self.size
+                if create:
+                    self._stats["created"] += 1
+            if create:
+                try:
+                    conn = self._connect()
+                except Exception:
+                    with self._lock:
+                        self._stats["created"] -= 1
+                    raise
+            else:
+                conn = self._idle.get(timeout=timeout)
+                waited_ms = (time.perf_counter() - start) * 1000
+                with self._lock:
+                    self._stats["waited"] += 1
+                    self._stats["wait_ms_max"] = max(
+                        self._stats["wait_ms_max"], waited_ms
+                    )
+        with self._lock:
+            self._stats["acquired"] += 1
+            self._in_use += 1
+        return conn
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        if conn.in_transaction:
+            conn.rollback()
+        with self._lock:
+            self._in_use -= 1
+        self._idle.put(conn)
+
+    @contextmanager
+    def connection(self):
+        conn = self.acquire()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def stats(self) -> dict:
+        """Compteurs du pool : connexions créées, prêtées, attentes, occupation."""
+        with self._lock:
+            return {
+                **self._stats,
+                "in_use": self._in_use,
+                "idle": self._idle.qsize(),
+                "size": self.size,
+            }
+
+    def close(self) -> None:
+        while True:
+            try:
+                self._idle.get_nowait().close()
+            except queue.Empty:
+                break
@@ -0,0 +1,144 @@
+# File: src/app/tx_export.py
+# Export à la demande des transactions filtrées : les lignes sont lues par
+# blocs et écrites au fil de l'eau (CSV gzip ou Parquet zstd) dans un fichier
+# temporaire sur disque, rouvert en lecture binaire (io.BufferedReader, type
+# accepté par st.download_button). Budgets de lignes et d'octets configurables.
+
+import contextlib
+import gzip
+import io
+import os
+import tempfile
+from dataclasses import dataclass
+from typing import IO
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from app.tx_queries import TxFilter
+from backend.export_parquet_snapshot import arrow_type
+
+EXPORT_MAX_ROWS = int(os.getenv("HOMEPEDIA_EXPORT_MAX_ROWS", "2000000"))
+EXPORT_MAX_MB = int(os.getenv("HOMEPEDIA_EXPORT_MAX_MB", "200"))
+EXPORT_CHUNK_ROWS = int(os.getenv("HOMEPEDIA_EXPORT_CHUNK_ROWS", "50000"))
+
+# Format → (extension, type MIME)
+FORMATS = {
+    "csv": ("csv.gz", "application/gzip"),
+    "parquet": ("parquet", "application/vnd.apache.parquet"),
+}
+
+
+class ExportTooLarge(ValueError):
+    """Export au-delà du budget de lignes ou d'octets."""
+
+
+@dataclass
+class Export:
+    file: io.BufferedReader  # positionné au début
+    rows: int
+    size: int
+    file_name: str
+    mime: str
+    path: str  # fichier temporaire, supprimé par close()
+
+    def close(self) -> None:
+        self.file.close()
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self.path)
+
+    def __enter__(self) -> "Export":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class _Budget:
+    def __init__(self, out: IO[bytes], max_bytes: int):
+        self.out, self.max_bytes = out, max_bytes
+
+    def check(self) -> None:
+        if self.out.tell() > self.max_bytes:
+            raise ExportTooLarge(
+                f"Export supérieur à {self.max_bytes / 2**20:.0f} Mo : "
+                "restreindre la période ou les filtres."
+            )
+
+
+def _write_csv(chunks, out: IO[bytes], budget: _Budget) -> int:
+    rows = 0
+    with gzip.GzipFile(fileobj=out, mode="wb", compresslevel=6) as gz:
+        with io.TextIOWrapper(gz, encoding="utf-8", newline="") as text:
+            for chunk in chunks:
+                chunk.to_csv(text, index=False, header=rows == 0)
+                rows += len(chunk)
+                budget.check()
+    return rows
+
+
+def _write_parquet(chunks, out: IO[bytes], budget: _Budget, schema) -> int:
+    rows = 0
+    with pq.ParquetWriter(out, schema, compression="zstd") as writer:
+        for chunk in chunks:
+            writer.write_table(
+                pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+            )
+            rows += len(chunk)
+            budget.check()
+    return rows
+
+
+def export_transactions(
+    db,
+    flt: TxFilter,
+    fmt: str = "csv",
+    max_rows: int = EXPORT_MAX_ROWS,
+    max_bytes: int = EXPORT_MAX_MB * 1024 * 1024,
+    chunk_rows: int = EXPORT_CHUNK_ROWS,
+) -> Export:
+    """
+    Écrit les transactions de `flt` au format `fmt` ('csv' gzip ou 'parquet').
+    Le nombre de lignes est vérifié avant toute lecture ; la taille du fichier
+    après chaque bloc. Lève ExportTooLarge au-delà d'un budget. L'Export
+    retourné est à fermer par l'appelant (`with export:`).
+    """
+    if fmt not in FORMATS:
+        raise ValueError(
+            f"Format d'export inconnu : {fmt!r} (choix : {sorted(FORMATS)})"
+        )
+    where, params = flt.where()
+    (n,) = db.fetchone(f"SELECT COUNT(*) FROM transactions WHERE {where}", params)
+    if n > max_rows:
+        raise ExportTooLarge(
+            f"{n:,} transactions à exporter (maximum {max_rows:,}) : "
+            "restreindre la période ou les filtres."
+        )
+
+    schema = pa.schema(
+        [(name, arrow_type(decl)) for name, decl in db.columns("transactions")]
+    )
+    dates = [f.name for f in schema if pa.types.is_timestamp(f.type)]
+    chunks = db.iter_chunks(
+        f"SELECT * FROM transactions WHERE {where}",
+        params,
+        chunk_rows=chunk_rows,
+        parse_dates=dates,
+    )
+    ext, mime = FORMATS[fmt]
+    tmp = tempfile.NamedTemporaryFile(suffix=f".{ext}", delete=False)
+    try:
+        with tmp as out:
+            budget = _Budget(out, max_bytes)
+            if fmt == "csv":
+                rows = _write_csv(chunks, out, budget)
+            else:
+                rows = _write_parquet(chunks, out, budget, schema)
+            size = out.tell()
+    except BaseException:
+        chunks.close()
+        os.remove(tmp.name)
+        raise
+    return Export(
+        open(tmp.name, "rb"), rows, size, f"transactions_filtrees.{ext}", mime, tmp.name
+    )
@@ -0,0 +1,189 @@
+# File: src/app/tx_queries.py
+# Requêtes agrégées de la vue Standard : KPI, histogramme, quartiles par type,
+# moyenne par département et aperçu sont calculés en SQL ; seuls des résultats
+# compacts remontent vers pandas. Le SQL reste commun à SQLite et DuckDB.
+
+from typing import NamedTuple
+
+import numpy as np
+import pandas as pd
+
+from backend.stats_catalog import CATALOG_TABLE, parse_catalog
+
+HIST_BINS = 50
+PREVIEW_ROWS = 10
+PREVIEW_COLS = [
+    "nature_mutation",
+    "valeur_fonciere",
+    "code_postal",
+    "commune",
+    "type_local",
+    "surface_reelle_bati",
+    "nombre_pieces_principales",
+    "prix_m2",
+    "dept",
+]
+
+
+class TxFilter(NamedTuple):
+    """Filtres de la vue Standard (hachable : clé de st.cache_data)."""
+
+    start: str  # 'YYYY-MM-DD'
+    end: str
+    type_local: str  # "Tous" = pas de filtre
+    pmin: float
+    pmax: float
+
+    def where(self) -> tuple[str, list]:
+        """
+        Clause WHERE (index sur date_mutation / prix_m2) et ses paramètres. La
+        fin est exclusive au lendemain : SQLite stocke les dates en texte
+        'YYYY-MM-DD HH:MM:SS', qu'un BETWEEN sur 'YYYY-MM-DD' écarterait.
+        """
+        end = (pd.Timestamp(self.end) + pd.Timedelta(days=1)).strftime("%Y-%m-%d")
+        sql = "date_mutation >= ? AND date_mutation < ? AND prix_m2 BETWEEN ? AND ?"
+        params = [self.start, end, self.pmin, self.pmax]
+        if self.type_local != "Tous":
+            sql += " AND type_local = ?"
+            params.append(self.type_local)
+        return sql, params
+
+
+def catalog(db) -> dict:
+    """Catalogue de statistiques écrit au chargement ({} s'il est absent)."""
+    if not db.has_table(CATALOG_TABLE):
+        return {}
+    return parse_catalog(db.fetchall(f"SELECT key, value FROM {CATALOG_TABLE}"))
+
+
+def _median(db, where: str, params: list, col: str) -> float:
+    """Médiane (interpolée comme pandas) via COUNT puis LIMIT/OFFSET trié."""
+    (n,) = db.fetchone(f"SELECT COUNT({col}) FROM transactions WHERE {where}", params)
+    if not n:
+        return float("nan")
+    (value,) = db.fetchone(
+        f"SELECT AVG({col}) FROM (SELECT {col} FROM transactions "
+        f"WHERE {where} AND {col} IS NOT NULL ORDER BY {col} LIMIT ? OFFSET ?) s",
+        [*params, 2 - n % 2, (n - 1) // 2],
+    )
+    return float(value)
+
+
+def kpis(db, flt: TxFilter) -> dict:
+    """Nombre de transactions, prix moyen au m² et surface médiane."""
+    where, params = flt.where()
+    n, prix_moyen = db.fetchone(
+        f"SELECT COUNT(*), AVG(prix_m2) FROM transactions WHERE {where}", params
+    )
+    return {
+        "n": n,
+        "prix_m2_moyen": float("nan") if prix_moyen is None else prix_moyen,
+        "surface_mediane": _median(db, where, params, "surface_reelle_bati"),
+    }
+
+
+def histogram(
+    db, flt: TxFilter, bins: int = HIST_BINS
+) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Histogramme de prix_m2 sur [pmin, pmax] : bornes et effectifs. Le numéro
+    de classe est calculé par une expression CASE (bornes en paramètres).
+    """
+    where, params = flt.where()
+    edges = np.linspace(flt.pmin, flt.pmax, bins + 1)
+    case = " ".join(f"WHEN prix_m2 < ? THEN {i}" for i in range(bins - 1))
+    df = db.query(
+        f"SELECT CASE {case} ELSE {bins - 1} END AS bin, COUNT(*) AS n "
+        f"FROM transactions WHERE {where} GROUP BY 1",
+        [*edges[1:-1].tolist(), *params],
+    )
+    counts = np.zeros(bins, dtype=np.int64)
+    counts[df["bin"].astype(int).to_numpy()] = df["n"].to_numpy()
+    return edges, counts
+
+
+def _quantile(values: dict[int, float], n: int, p: float) -> float:
+    """Quantile p à interpolation linéaire (np.percentile) à partir des rangs."""
+    pos = (n - 1) * p
+    lo, hi = int(np.floor(pos)), int(np.ceil(pos))
+    return values[lo] + (values[hi] - values[lo]) * (pos - lo)
+
+
+def type_quartiles(db, flt: TxFilter) -> list[dict]:
+    """
+    Statistiques de boîte à moustaches par type de bien (format Axes.bxp,
+    moustaches à 1,5 IQR, sans valeurs extrêmes). Les quartiles sont lus par
+    rang via ROW_NUMBER() : seules quelques lignes par type remontent.
+    """
+    where, params = flt.where()
+    counts = db.query(
+        f"SELECT type_local, COUNT(*) AS n FROM transactions "
+        f"WHERE {where} AND type_local IS NOT NULL GROUP BY type_local "
+        f"ORDER BY type_local",
+        params,
+    )
+    if counts.empty:
+        return []
+    ranks = set()
+    for n in counts["n"]:
+        for p in (0.25, 0.5, 0.75):
+            pos = (n - 1) * p
+            ranks.update({int(np.floor(pos)), int(np.ceil(pos))})
+    rows = db.query(
+        f"SELECT type_local, rn, prix_m2 FROM ("
+        f"SELECT type_local, prix_m2, ROW_NUMBER() OVER "
+        f"(PARTITION BY type_local ORDER BY prix_m2) - 1 AS rn "
+        f"FROM transactions WHERE {where} AND type_local IS NOT NULL) r "
+        f"WHERE rn IN ({', '.join('?' * len(ranks))})",
+        [*params, *sorted(ranks)],
+    )
+
+    stats = []
+    for type_local, n in counts.itertuples(index=False):
+        sub = rows[rows["type_local"] == type_local]
+        values = dict(zip(sub["rn"].astype(int), sub["prix_m2"], strict=True))
+        q1, med, q3 = (_quantile(values, n, p) for p in (0.25, 0.5, 0.75))
+        iqr = q3 - q1
+        stats.append(
+            {
+                "label": type_local,
+                "q1": q1,
+                "med": med,
+                "q3": q3,
+                "bounds": (q1 - 1.5 * iqr, q3 + 1.5 * iqr),
+            }
+        )
+
+    # Moustaches : valeurs extrêmes dans [Q1 - 1,5 IQR, Q3 + 1,5 IQR]
+    values_sql = ", ".join("(?, ?, ?)" for _ in stats)
+    bounds = [v for s in stats for v in (s["label"], *s["bounds"])]
+    whiskers = db.query(
+        f"WITH b(typ, lo, hi) AS (VALUES {values_sql}) "
+        f"SELECT typ, MIN(prix_m2) AS whislo, MAX(prix_m2) AS whishi "
+        f"FROM transactions JOIN b ON type_local = typ "
+        f"WHERE {where} AND prix_m2 BETWEEN lo AND hi GROUP BY typ",
+        [*bounds, *params],
+    ).set_index("typ")
+    for s in stats:
+        s.pop("bounds")
+        s["whislo"] = whiskers["whislo"].get(s["label"], s["q1"])
+        s["whishi"] = whiskers["whishi"].get(s["label"], s["q3"])
+    return stats
+
+
+def dept_means(db, flt: TxFilter) -> pd.DataFrame:
+    """Prix moyen au m² par département (colonnes code, prix_m2_moyen)."""
+    where, params = flt.where()
+    return db.query(
+        f"SELECT dept AS code, AVG(prix_m2) AS prix_m2_moyen "
+        f"FROM transactions WHERE {where} GROUP BY dept",
+        params,
+    )
+
+
+def preview(db, flt: TxFilter, n: int = PREVIEW_ROWS) -> pd.DataFrame:
+    where, params = flt.where()
+    return db.query(
+        f"SELECT {', '.join(PREVIEW_COLS)} FROM transactions WHERE {where} LIMIT ?",
+        [*params, n],
+    )
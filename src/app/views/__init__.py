@@ -0,0 +1,23 @@
+# File: src/app/views/__init__.py
+# Vues de l'application Streamlit, une par module. Le module d'une vue, et avec
+# lui ses dépendances lourdes (matplotlib, folium, wordcloud…), n'est importé
+# qu'à la première ouverture de la vue dans le processus : l'ossature de
+# l'application n'importe que streamlit, pandas et les modules de requêtes.
+# Coût d'import par vue : scripts/bench_imports.py.
+
+import importlib
+
+# Libellé de la vue → module app.views.<module>
+VIEWS = {
+    "Standard": "standard",
+    "Spark Analysis": "spark",
+    "Text Analysis": "text_analysis",
+    "Indicateurs Socio-éco": "socio_eco",
+    "Région": "region",
+    "Méthodologie": "methodology",
+}
+
+
+def render(view: str) -> None:
+    """Affiche la vue `view` (module importé à la première ouverture)."""
+    importlib.import_module(f"{__name__}.{VIEWS[view]}").render()
@@ -0,0 +1,111 @@
+# File: src/app/views/common.py
+# Ressources et affichages partagés par les vues : moteur de requêtes, magasin
+# de géométries et cache de rendus (un par processus), libellés des colonnes,
+# cartes choroplèthes et figures mises en cache. Import léger : folium n'est
+# chargé qu'au premier tracé d'une carte.
+
+import pandas as pd
+import streamlit as st
+
+from app.query_backend import QUERY_BACKEND, get_backend, open_resource
+from app.render_cache import RenderCache, figure_bytes, fingerprint, map_html
+
+COLS_NICE = {
+    "code": "Département",
+    "dept": "Département",
+    "code_region": "Région",
+    "nb_transactions": "Nombres de transactions",
+    "prix_m2_moyen": "Prix moyen €/m²",
+    "prix_m2": "Prix €/m²",
+    "surface_reelle_bati": "Surface bâtie m²",
+    "valeur_fonciere": "Valeur foncière €",
+    "population": "Population",
+    "income_median": "Revenu médian €",
+    "taux_chomage": "Taux chômage %",
+    "poverty_rate": "Taux pauvreté %",
+    "income": "Revenu médian € ",
+    "unemployment": "Taux chômage % ",
+    "poverty": "Taux pauvreté % ",
+}
+
+# Cartes : centre et zoom initial (curseur de la barre latérale, clé MAP_ZOOM ;
+# le zoom fixe aussi le niveau de détail des géométries)
+MAP_CENTER = [46.6, 2.4]
+MAP_ZOOM = "map_zoom"
+DEFAULT_ZOOM = 5
+
+
+def pretty(df: pd.DataFrame) -> pd.DataFrame:
+    return df.rename(columns={k: v for k, v in COLS_NICE.items() if k in df.columns})
+
+
+def show(df: pd.DataFrame, n: int | None = None):
+    st.dataframe(pretty(df if n is None else df.head(n)))
+
+
+# Moteur de requêtes : SQLite (défaut) ou DuckDB sur l'instantané Parquet
+# (HOMEPEDIA_QUERY_BACKEND=duckdb). Le pool de connexions en lecture seule
+# (ou la connexion DuckDB) est partagé par toutes les sessions du processus.
+@st.cache_resource(show_spinner=False)
+def query_resource(name: str):
+    return open_resource(name)
+
+
+def database():
+    return get_backend(QUERY_BACKEND, query_resource(QUERY_BACKEND))
+
+
+# Géométries pré-simplifiées et sérialisées à l'ETL, chargées une fois par processus
+@st.cache_resource(show_spinner=False)
+def geo_store():
+    from app.geo_assets import load_assets
+
+    return load_assets()
+
+
+# Rendus (HTML des cartes, PNG des figures) partagés par toutes les sessions
+@st.cache_resource(show_spinner=False)
+def render_cache():
+    return RenderCache()
+
+
+def show_choropleth(
+    layer: str, data: pd.DataFrame, columns: list[str], legend: str, **style
+):
+    """
+    Choroplèthe de `data[columns]` sur la couche `layer`. Le HTML est mis en
+    cache par empreinte (données, couche, zoom, légende, style) : une carte
+    déjà vue n'est ni reconstruite ni re-sérialisée.
+    """
+    import streamlit.components.v1 as components
+
+    map_zoom = st.session_state.get(MAP_ZOOM, DEFAULT_ZOOM)
+    values = data[columns].reset_index(drop=True)
+    key = fingerprint("choropleth", layer, map_zoom, values, legend, style)
+
+    def draw() -> str:
+        import folium
+
+        from app.geo_assets import layer_geojson
+
+        m = folium.Map(location=MAP_CENTER, zoom_start=map_zoom)
+        folium.Choropleth(
+            geo_data=layer_geojson(geo_store(), layer, map_zoom),
+            data=values,
+            columns=columns,
+            key_on="feature.properties.code",
+            legend_name=legend,
+            **style,
+        ).add_to(m)
+        return map_html(m)
+
+    components.html(render_cache().get_or_render(key, draw), height=600)
+
+
+def show_figure(draw, *parts):
+    """
+    Affiche la figure renvoyée par `draw()`. Le PNG est mis en cache par
+    empreinte de `parts` (données et paramètres dont dépend le tracé).
+    """
+    key = fingerprint("figure", draw.__module__, draw.__qualname__, *parts)
+    st.image(render_cache().get_or_render(key, lambda: figure_bytes(draw())))
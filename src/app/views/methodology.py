@@ -0,0 +1,44 @@
+# File: src/app/views/methodology.py
+# Vue Méthodologie : texte statique (aucune dépendance lourde).
+
+import streamlit as st
+
+
+def render() -> None:
+    st.header("📚 Méthodologie & Choix techniques")
+
+    st.markdown(
+        """
+    ### Pré-processing des données
+    - **Transactions DVF 2019–2025** : nettoyage des valeurs foncières / surfaces, suppression des valeurs aberrantes, extraction du code département.
+    - **Indicateurs INSEE (revenu, chômage, pauvreté, population)** : filtrage des mesures fiables, conversion numérique, agrégation au niveau départemental.
+    - Tous les scripts sont disponibles dans `src/backend/ingest_*.py`.
+
+    ### Choix des métriques
+    | Métrique | Rôle dans l’analyse |
+    |----------|--------------------|
+    | Prix moyen au m² | Indicateur principal du marché immobilier |
+    | Revenu médian | Pouvoir d’achat local |
+    | Taux de chômage | Dynamique économique |
+    | Taux de pauvreté | Vulnérabilité socio-éco |
+    | Population | Taille du marché |
+
+    ### Librairies data science mises en œuvre
+    - **pandas**, **geopandas** (ETL) : manipulation tabulaire & géospatiale
+    - **matplotlib / seaborn** : visualisation statistique
+    - **PySpark** : agrégations rapides sur ~2 M de lignes DVF
+    - **folium** : cartes choroplèthes interactives
+
+    ### Architecture
+    ```text
+    CSV / Scraping  →  Scripts ETL  →  SQLite (homepedia.db)
+                          │
+                          └─► Streamlit 5 vues  →  Docker
+    ```
+
+    ### Limites & pistes
+    - Ajouter indicateurs démographie/âge
+    - Tests unitaires sur chaque ingestion
+    - Déploiement cloud (railway.app, Render, etc.)
+    """
+    )
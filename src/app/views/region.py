@@ -0,0 +1,156 @@
+# File: src/app/views/region.py
+# Vue Région : indicateurs régionaux, une section calculée par rerun.
+# seaborn n'est importé que pour la matrice de corrélations.
+
+import matplotlib.pyplot as plt
+import matplotlib.ticker as mticker
+import pandas as pd
+import streamlit as st
+
+from app.sections import Sections
+from app.views.common import COLS_NICE, database, show, show_choropleth, show_figure
+
+
+# 1) Chargement en cache des données régionales (`backend` : clé du cache)
+@st.cache_data
+def load_region_df(backend: str) -> pd.DataFrame:
+    df = database().query("SELECT * FROM region_analysis")
+    # zfill sur code_region si nécessaire
+    df["code_region"] = df["code_region"].astype(str).str.zfill(2)
+    return df
+
+
+@st.cache_data
+def compute_region_corr(df: pd.DataFrame) -> pd.DataFrame:
+    features = [
+        "prix_m2_moyen",
+        "population",
+        "income_median",
+        "taux_chomage",
+        "poverty_rate",
+    ]
+    cols = [c for c in features if c in df.columns]
+    return df[cols].corr() if len(cols) > 1 else pd.DataFrame()
+
+
+# 2) Une seule section calculée et envoyée par rerun
+sections = Sections()
+
+
+@sections("Carte")
+def carte(df_region: pd.DataFrame) -> None:
+    # 3) Carte Folium (géométries régionales du magasin, simplifiées à l'ETL)
+    st.subheader("Carte du prix moyen au m² par région")
+    show_choropleth(
+        "regions",
+        df_region,
+        ["code_region", "prix_m2_moyen"],
+        "Prix moyen (€ / m²)",
+        fill_opacity=0.7,
+        line_opacity=0.2,
+        nan_fill_color="white",
+    )
+
+
+@sections("Distribution")
+def distribution(df_region: pd.DataFrame) -> None:
+    # 4) Histogramme prix moyen
+    def draw_region_hist():
+        fig_r, ax_r = plt.subplots()
+        ax_r.hist(df_region["prix_m2_moyen"].dropna(), bins=20, edgecolor="black")
+        ax_r.set_xlabel("Prix moyen (€ / m²)")
+        ax_r.set_ylabel("Nombre de régions")
+        return fig_r
+
+    st.subheader("Distribution du prix moyen par région")
+    show_figure(draw_region_hist, df_region["prix_m2_moyen"])
+
+
+@sections("Population vs prix")
+def population_prix(df_region: pd.DataFrame) -> None:
+    # Slider population (pas 2 M)
+    pop_min = int(df_region["population"].min())
+    pop_max = int(df_region["population"].max())
+    borne_min = (pop_min // 2_000_000) * 2_000_000
+    borne_max = ((pop_max // 2_000_000) + 1) * 2_000_000
+    st.sidebar.subheader("Plage de population (pas 2 M)")
+    x_range = st.sidebar.slider(
+        "Population",
+        min_value=borne_min,
+        max_value=borne_max,
+        value=(borne_min, borne_max),
+        step=2_000_000,
+        format="%d",
+    )
+
+    # 5) Scatter Population vs Prix (avec zoom slider)
+    def draw_region_scatter():
+        fig_sp, ax_sp = plt.subplots()
+        ax_sp.scatter(df_region["population"], df_region["prix_m2_moyen"], alpha=0.7)
+        ax_sp.set_xlim(x_range)
+        ax_sp.set_xlabel("Population")
+        ax_sp.set_ylabel("Prix moyen (€ / m²)")
+
+        # Formateur de ticks en M
+        fmt = mticker.FuncFormatter(lambda x, _: f"{x/1_000_000:.1f} M")
+        ax_sp.xaxis.set_major_formatter(fmt)
+        ax_sp.tick_params(axis="x", rotation=45)
+        return fig_sp
+
+    st.subheader(
+        f"Population vs Prix moyen par région (zoom : {x_range[0]:,} → {x_range[1]:,})"
+    )
+    show_figure(
+        draw_region_scatter, df_region[["population", "prix_m2_moyen"]], x_range
+    )
+
+
+@sections("Corrélations")
+def correlations(df_region: pd.DataFrame) -> None:
+    # 6) Matrice de corrélations
+    st.subheader("Matrice de corrélations régionales")
+    corr_reg = compute_region_corr(df_region)
+
+    if corr_reg.empty:
+        st.info("Corrélation impossible : données socio-économiques manquantes.")
+        return
+
+    def draw_region_corr():
+        import seaborn as sns
+
+        fig, ax = plt.subplots()
+        sns.heatmap(
+            corr_reg,
+            annot=True,
+            fmt=".2f",
+            cmap="coolwarm",
+            vmin=-1,
+            vmax=1,
+            square=True,
+            cbar_kws={"shrink": 0.75},
+            ax=ax,
+        )
+        # Ajustement dynamique de la couleur des annotations
+        for text in ax.texts:
+            val = float(text.get_text())
+            text.set_color("white" if abs(val) > 0.5 else "black")
+        labels_reg = [COLS_NICE.get(c, c) for c in corr_reg.columns]
+        ax.set_xticklabels(labels_reg, rotation=45, ha="right")
+        ax.set_yticklabels(labels_reg)
+        return fig
+
+    show_figure(draw_region_corr, corr_reg)
+
+
+def render() -> None:
+    st.header("🌍 Indicateurs par Région")
+
+    df_region = load_region_df(database().name)
+
+    st.subheader("Aperçu des données régionales")
+    show(df_region)
+
+    section = st.radio(
+        "Section", sections.labels, horizontal=True, key="region_section"
+    )
+    sections.run(section, df_region)
@@ -0,0 +1,172 @@
+# File: src/app/views/socio_eco.py
+# Vue Indicateurs Socio-éco (INSEE) : un indicateur calculé et affiché par
+# rerun. scipy.stats n'est importé que pour tracer la corrélation.
+
+import os
+
+import matplotlib.pyplot as plt
+import matplotlib.ticker as mticker
+import numpy as np
+import pandas as pd
+import streamlit as st
+
+from app.sections import Sections
+from app.views.common import COLS_NICE, show, show_choropleth, show_figure
+
+# Parquet typés par scripts/csv_to_parquet.py : aucune conversion à faire
+SOCIO_PATHS = {
+    "chomage": ("data/processed/unemployment_dept.parquet", "chômage"),
+    "income": ("data/processed/income_dept.parquet", "revenu médian"),
+    "population": ("data/processed/population_dept.parquet", "population"),
+    "poverty": ("data/processed/poverty_dept.parquet", "pauvreté"),
+}
+
+
+@st.cache_data(show_spinner=False)
+def load_df(path: str) -> pd.DataFrame:
+    return pd.read_parquet(path)
+
+
+def socio_df(name: str) -> pd.DataFrame:
+    path, label = SOCIO_PATHS[name]
+    if not os.path.exists(path):
+        st.error(f"Données {label} manquantes ({path}).")
+        st.stop()
+    return load_df(path)
+
+
+# Un seul indicateur calculé et envoyé par rerun (st.tabs exécuterait les six
+# onglets) ; chaque Parquet n'est lu qu'à l'ouverture de son indicateur.
+sections = Sections()
+
+
+def chomage_filtre() -> pd.DataFrame:
+    """Chômage filtré par le curseur (affiché seulement s'il sert)."""
+    df = socio_df("chomage")
+    lo, hi = float(df["taux_chomage"].min()), float(df["taux_chomage"].max())
+    min_c, max_c = st.sidebar.slider(
+        "Taux de chômage (%)", lo, hi, (lo, hi), key="socio_chomage"
+    )
+    return df.query("@min_c <= taux_chomage <= @max_c")
+
+
+@sections("Chômage")
+def chomage() -> None:
+    df_chom = chomage_filtre()
+    st.subheader("Taux de chômage (T1 2025)")
+    show(df_chom)
+    show_choropleth(
+        "departements", df_chom, ["code", "taux_chomage"], "Taux de chômage (%)"
+    )
+
+
+@sections("Revenu médian")
+def revenu() -> None:
+    df_inc = socio_df("income")
+    st.subheader("Revenu médian (2021)")
+    show(df_inc)
+    show_choropleth(
+        "departements", df_inc, ["code", "income_median"], "Revenu médian (€ / an)"
+    )
+
+
+@sections("Population")
+def population() -> None:
+    df_pop = socio_df("population")
+    st.subheader("Population")
+    show(df_pop)
+    show_choropleth("departements", df_pop, ["code", "population"], "Population")
+
+    def draw_pop_hist():
+        fig3, ax3 = plt.subplots()
+        ax3.hist(df_pop["population"].dropna(), bins=30, edgecolor="black")
+        ax3.set_xlabel("Population")
+        ax3.set_ylabel("Nombre de départements")
+        ax3.xaxis.set_major_formatter(
+            mticker.FuncFormatter(lambda x, pos: f"{x/1e6:.1f} M")
+        )
+        ax3.tick_params(axis="x", rotation=45)
+        return fig3
+
+    show_figure(draw_pop_hist, df_pop["population"])
+
+
+@sections("Pauvreté")
+def pauvrete() -> None:
+    df_pov = socio_df("poverty")
+    st.subheader("Taux de pauvreté")
+    show(df_pov)
+    show_choropleth(
+        "departements", df_pov, ["code", "poverty_rate"], "Taux de pauvrété (%)"
+    )
+
+    def draw_pov_hist():
+        fig4, ax4 = plt.subplots()
+        ax4.hist(df_pov["poverty_rate"].dropna(), bins=30, edgecolor="black")
+        ax4.set_xlabel("Taux de pauvreté (%)")
+        ax4.set_ylabel("Nombre de départements")
+        return fig4
+
+    show_figure(draw_pov_hist, df_pov["poverty_rate"])
+
+
+@sections("Corrélation")
+def correlation() -> None:
+    st.subheader("Corrélation chômage ↔ revenu")
+    df_corr = chomage_filtre().merge(socio_df("income"), on="code")[
+        ["income_median", "taux_chomage"]
+    ]
+
+    def draw_corr():
+        from scipy.stats import linregress
+
+        fig5, ax5 = plt.subplots()
+        ax5.scatter(df_corr["income_median"], df_corr["taux_chomage"], alpha=0.7)
+        slope, intercept, r, p, se = linregress(
+            df_corr["income_median"], df_corr["taux_chomage"]
+        )
+        xx = np.linspace(
+            df_corr["income_median"].min(), df_corr["income_median"].max(), 100
+        )
+        ax5.plot(xx, intercept + slope * xx, linestyle="--", label=f"R²={r**2:.2f}")
+        ax5.set_xlabel("Revenu médian (€ / an)")
+        ax5.set_ylabel("Taux de chômage (%)")
+        ax5.legend()
+        return fig5
+
+    show_figure(draw_corr, df_corr)
+
+
+@sections("Matrice corrélations")
+def matrice_correlations() -> None:
+    st.subheader("Matrice de corrélations multiples")
+    df_all = chomage_filtre()
+    for name in ("income", "population", "poverty"):
+        df_all = df_all.merge(socio_df(name), on="code")
+    corr = df_all[
+        ["taux_chomage", "income_median", "population", "poverty_rate"]
+    ].corr()
+
+    def draw_corr_matrix():
+        fig6, ax6 = plt.subplots()
+        cax = ax6.imshow(corr, vmin=-1, vmax=1)
+        ax6.set_xticks(range(len(corr)))
+        labels = [COLS_NICE.get(c, c) for c in corr.columns]
+        ax6.set_xticklabels(labels, rotation=45, ha="right")
+        ax6.set_yticks(range(len(corr)))
+        ax6.set_yticklabels(labels)
+        for i in range(len(corr)):
+            for j in range(len(corr)):
+                val = corr.iat[i, j]
+                color = "white" if abs(val) > 0.5 else "black"
+                ax6.text(j, i, f"{val:.2f}", ha="center", va="center", color=color)
+        fig6.colorbar(cax, ax=ax6, fraction=0.046, pad=0.04)
+        return fig6
+
+    show_figure(draw_corr_matrix, corr)
+
+
+def render() -> None:
+    st.header("📊 Indicateurs Socio-économiques (INSEE)")
+    tab = st.radio("Indicateur", sections.labels, horizontal=True, key="socio_tab")
+    sections.run(tab)
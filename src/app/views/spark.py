@@ -0,0 +1,36 @@
+# File: src/app/views/spark.py
+# Vue Spark Analysis : agrégats par département pré-calculés par Spark.
+
+import math
+
+import matplotlib.pyplot as plt
+import streamlit as st
+
+from app.views.common import database, show, show_figure
+
+
+def render() -> None:
+    st.header("Vue Spark Analysis (pré-agrégation)")
+    df_spark = database().query(
+        "SELECT dept AS code, nb_transactions, prix_m2_moyen FROM spark_dept_analysis"
+    )
+    df_spark["prix_m2_moyen"] = df_spark["prix_m2_moyen"].round(0).astype(int)
+    st.subheader("Résultats Spark par département")
+    show(df_spark)
+    per_page = st.sidebar.slider("Dépts par page", 5, 50, 10, 5)
+    n_pages = math.ceil(len(df_spark) / per_page)
+    page = st.sidebar.number_input("Page", 1, n_pages, 1)
+    start = (page - 1) * per_page
+    df_page = df_spark.iloc[start : start + per_page]
+    st.subheader(f"Page {page}/{n_pages}")
+    show(df_page)
+
+    def draw_spark():
+        fig3, ax3 = plt.subplots()
+        df_page.set_index("code")["prix_m2_moyen"].plot.bar(ax=ax3)
+        ax3.set_xlabel("Département")
+        ax3.set_ylabel("Prix moyen (€ / m²)")
+        ax3.tick_params(axis="x", rotation=45)
+        return fig3
+
+    show_figure(draw_spark, df_page[["code", "prix_m2_moyen"]])
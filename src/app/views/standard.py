@@ -0,0 +1,184 @@
+# File: src/app/views/standard.py
+# Vue Standard : transactions filtrées (agrégats SQL), export à la demande,
+# carte du prix moyen par département et figures de distribution.
+
+import matplotlib.pyplot as plt
+import matplotlib.ticker as mticker
+import pandas as pd
+import streamlit as st
+
+from app import tx_queries
+from app.tx_queries import TxFilter
+from app.views.common import database, show, show_choropleth, show_figure
+
+
+# `backend` ne sert qu'à distinguer les entrées du cache par moteur
+@st.cache_data(show_spinner=False)
+def tx_summary(flt: TxFilter, backend: str) -> dict:
+    db = database()
+    return {
+        "kpis": tx_queries.kpis(db, flt),
+        "hist": tx_queries.histogram(db, flt),
+        "box": tx_queries.type_quartiles(db, flt),
+        "dept": tx_queries.dept_means(db, flt),
+        "preview": tx_queries.preview(db, flt),
+    }
+
+
+def render() -> None:
+    st.header("Transactions immobilières (agrégats SQL)")
+    db = database()
+
+    # --- Bornes des filtres : catalogue écrit au chargement (aucun scan) ---
+    cat = tx_queries.catalog(db)
+    if not cat.get("rows"):
+        st.error(
+            "Catalogue de statistiques absent ou vide : relancer "
+            "src/backend/load_to_sqlite.py (ou src/backend/stats_catalog.py)."
+        )
+        st.stop()
+
+    # --- Période ---
+    st.sidebar.subheader("Filtres Transactions")
+    min_date = pd.to_datetime(cat["date_min"])
+    max_date = pd.to_datetime(cat["date_max"])
+    raw_dates = st.sidebar.date_input(
+        "Période",
+        [min_date.date(), max_date.date()],
+        min_value=min_date.date(),
+        max_value=max_date.date(),
+    )
+
+    if isinstance(raw_dates, tuple):
+        start_date = pd.to_datetime(raw_dates[0])
+        end_date = pd.to_datetime(raw_dates[1] if len(raw_dates) > 1 else raw_dates[0])
+    else:
+        start_date = end_date = pd.to_datetime(raw_dates)
+
+    # --- Type de bien ---
+    type_list = ["Tous"] + cat["distinct_type_local"]
+    choix_type = st.sidebar.selectbox("Type de logement", type_list)
+
+    # --- Min / Max prix_m2 globaux (pour le slider) ---
+    pmin_glob, pmax_glob = cat["prix_m2_min"], cat["prix_m2_max"]
+
+    price_range = st.sidebar.slider(
+        "Prix au m²", int(pmin_glob), int(pmax_glob), (int(pmin_glob), int(pmax_glob))
+    )
+
+    # --- Agrégats filtrés (calculés en SQL, résultats compacts) ---
+    flt = TxFilter(
+        start_date.strftime("%Y-%m-%d"),
+        end_date.strftime("%Y-%m-%d"),
+        choix_type,
+        price_range[0],
+        price_range[1],
+    )
+
+    summary = tx_summary(flt, db.name)
+    kpi = summary["kpis"]
+
+    # --- KPIs & export ---
+    col1, col2, col3 = st.columns(3)
+    col1.metric("Transactions filtrées", f"{kpi['n']:,}")
+    col2.metric("Surface médiane (m²)", f"{kpi['surface_mediane']:.1f}")
+    col3.metric("Prix moyen €/m²", f"{kpi['prix_m2_moyen']:.2f}")
+
+    # Export construit seulement sur demande : lignes lues par blocs, écrites
+    # compressées dans un fichier temporaire, dans les budgets configurés
+    col_fmt, col_btn = st.columns([1, 2])
+    export_fmt = col_fmt.radio(
+        "Format d'export",
+        ["csv", "parquet"],
+        horizontal=True,
+        format_func={"csv": "CSV (gzip)", "parquet": "Parquet"}.get,
+    )
+    if col_btn.button("📥 Préparer l'export"):
+        # pyarrow chargé au premier export seulement
+        from app.tx_export import ExportTooLarge, export_transactions
+
+        try:
+            with st.spinner("Export en cours …"):
+                export = export_transactions(db, flt, export_fmt)
+        except ExportTooLarge as exc:
+            st.warning(str(exc))
+        else:
+            with export:
+                st.download_button(
+                    f"Télécharger {export.rows:,} transactions "
+                    f"({export.size / 2**20:.1f} Mo)",
+                    export.file,
+                    file_name=export.file_name,
+                    mime=export.mime,
+                )
+
+    st.subheader("Aperçu des transactions filtrées")
+    show(summary["preview"])
+
+    # --- Carte choroplèthe ---
+    prix_dept = summary["dept"]
+
+    if st.checkbox("Afficher la carte", value=True):
+        with st.spinner("Création carte …"):
+            st.subheader("Carte du prix moyen au m²")
+            show_choropleth(
+                "departements",
+                prix_dept,
+                ["code", "prix_m2_moyen"],
+                "Prix moyen (€ / m²)",
+                fill_opacity=0.7,
+                line_opacity=0.2,
+                nan_fill_color="white",
+            )
+
+    # --- Histogramme (classes comptées en SQL) ---
+    st.subheader("Distribution des prix au m²")
+    edges, counts = summary["hist"]
+
+    def draw_hist():
+        fig1, ax1 = plt.subplots()
+        ax1.hist(edges[:-1], bins=edges, weights=counts, edgecolor="black")
+        ax1.set_xlim(price_range)
+        ax1.set_xlabel("Prix (€ / m²)")
+        ax1.set_ylabel("Nombre de transactions")
+        return fig1
+
+    show_figure(draw_hist, edges, counts, price_range)
+
+    # --- Box-plot (quartiles calculés en SQL) ---
+    st.subheader("Dispersion prix/m² par type de bien")
+
+    def draw_box():
+        fig_box, ax_box = plt.subplots(figsize=(9, 4))
+        if summary["box"]:
+            ax_box.bxp(summary["box"], showfliers=False)
+        ax_box.set_xlabel("")
+        ax_box.set_ylabel("€ / m²")
+        ax_box.set_title("")
+        ax_box.tick_params(axis="x", labelrotation=45)
+        ax_box.set_xticklabels(
+            [lab.get_text().replace(" ", "\n", 1) for lab in ax_box.get_xticklabels()],
+            ha="right",
+            fontsize=8,
+        )
+        return fig_box
+
+    show_figure(draw_box, summary["box"])
+
+    # --- Scatter population ---
+    pop = db.query("SELECT * FROM population")
+    prix_pop = prix_dept.merge(pop, on="code", how="left")
+
+    st.subheader("Population vs Prix moyen")
+
+    def draw_pop():
+        fig2, ax2 = plt.subplots()
+        ax2.scatter(prix_pop["population"], prix_pop["prix_m2_moyen"], alpha=0.6)
+        ax2.set_xlabel("Population départementale")
+        ax2.set_ylabel("Prix moyen (€ / m²)")
+        ax2.xaxis.set_major_formatter(
+            mticker.FuncFormatter(lambda x, _: f"{x/1e6:.1f} M")
+        )
+        return fig2
+
+    show_figure(draw_pop, prix_pop[["population", "prix_m2_moyen"]])
@@ -0,0 +1,173 @@
+# File: src/app/views/text_analysis.py
+# Vue Text Analysis : avis du magasin de commentaires (pagination par clé ou
+# recherche plein texte), sentiment calculé à l'ingestion et nuage de mots
+# construit depuis les fréquences cumulées. wordcloud n'est importé qu'au
+# premier tracé du nuage.
+
+import html
+import math
+
+import matplotlib.pyplot as plt
+import streamlit as st
+
+from app.views.common import show, show_figure
+from backend.comment_store import HIGHLIGHT, CommentStore
+
+
+# Magasin SQLite en lecture seule : une page ou un échantillon par requête,
+# jamais la collection entière
+@st.cache_resource(show_spinner=False)
+def comment_store() -> CommentStore:
+    return CommentStore(readonly=True)
+
+
+# `path` : clé des caches ci-dessous (un magasin par chemin)
+@st.cache_data(ttl=300, show_spinner=False)
+def comment_stats(path: str, unique: bool):
+    store = comment_store()
+    return store.count(unique), store.id_range()
+
+
+# Recherche plein texte (index FTS5 du magasin) : nombre de résultats lu
+# dans l'index, pages classées par BM25 et mises en cache par requête
+@st.cache_data(ttl=300, show_spinner=False)
+def search_count(path: str, query: str, unique: bool) -> int:
+    return comment_store().search_count(query, unique)
+
+
+@st.cache_data(ttl=300, max_entries=256, show_spinner=False)
+def search_page(path: str, query: str, unique: bool, per_page: int, page_no: int):
+    return comment_store().search(query, per_page, page_no * per_page, unique)
+
+
+def highlight(snippet: str) -> str:
+    """Extrait de recherche en HTML : texte échappé, termes trouvés surlignés."""
+    start, end = HIGHLIGHT
+    return html.escape(snippet).replace(start, "<mark>").replace(end, "</mark>")
+
+
+def goto_search_page(page_no: int):
+    st.session_state["search_page"] = page_no
+
+
+def render() -> None:
+    st.header("Vue Text Analysis (Sentiment & Word Cloud)")
+
+    try:
+        store = comment_store()
+    except FileNotFoundError as exc:
+        st.error(str(exc))
+        st.stop()
+
+    # Quasi-doublons (groupes calculés à l'ingestion) écartés à la lecture
+    unique = st.sidebar.checkbox(
+        "Masquer les quasi-doublons",
+        value=False,
+        disabled=not store.has_clusters(),
+        on_change=goto_search_page,
+        args=(0,),
+    )
+    n_docs, (first_id, _) = comment_stats(store.path, unique)
+    st.sidebar.markdown(f"**Total commentaires :** {n_docs:,}")
+    per_page = st.sidebar.slider("Avis par page", 10, 200, 50, 10)
+
+    query = st.text_input(
+        "Rechercher dans les avis",
+        key="comments_query",
+        placeholder="ex. : breakfast staff, clean*",
+        on_change=goto_search_page,
+        args=(0,),
+    ).strip()
+    if query and not store.has_search():
+        st.warning(
+            "Index plein texte absent du magasin : "
+            "relancer src/backend/ingest_comments.py"
+        )
+        query = ""
+
+    if query:
+        n_hits = search_count(store.path, query, unique)
+        n_pages = max(1, math.ceil(n_hits / per_page))
+        page_no = min(st.session_state.get("search_page", 0), n_pages - 1)
+        df_page = search_page(store.path, query, unique, per_page, page_no)
+
+        col_prev, col_next = st.columns(2)
+        col_prev.button(
+            "⬅ Résultats précédents",
+            on_click=goto_search_page,
+            args=(page_no - 1,),
+            disabled=page_no == 0,
+        )
+        col_next.button(
+            "Résultats suivants ➡",
+            on_click=goto_search_page,
+            args=(page_no + 1,),
+            disabled=page_no >= n_pages - 1,
+        )
+        st.subheader(f"{n_hits:,} avis pour « {query} » (page {page_no + 1}/{n_pages})")
+        for row in df_page.itertuples(index=False):
+            st.markdown(
+                f"**n° {row.id:,}** · sentiment {row.sentiment:+.2f} — "
+                f"{highlight(row.extrait)}",
+                unsafe_allow_html=True,
+            )
+    else:
+        # Pagination par clé : la page commence à l'identifiant mémorisé
+        start_id = st.session_state.get("comments_start", first_id or 0)
+        df_page, has_next = store.page_with_next(start_id, per_page, unique)
+        # page vide (départ au-delà du dernier avis, magasin réingéré…) : le
+        # bouton « précédents » reste affiché pour revenir en arrière
+        page_first = int(df_page["id"].iloc[0]) if len(df_page) else start_id
+        page_last = int(df_page["id"].iloc[-1]) if len(df_page) else start_id
+
+        def next_page(last_id: int):
+            st.session_state["comments_start"] = last_id + 1
+
+        def previous_page(page_first_id: int):
+            prev = store.page_before(page_first_id, per_page, unique)
+            st.session_state["comments_start"] = (
+                int(prev["id"].iloc[0]) if len(prev) else 0
+            )
+
+        col_prev, col_next = st.columns(2)
+        col_prev.button(
+            "⬅ Avis précédents",
+            on_click=previous_page,
+            args=(page_first,),
+            disabled=page_first <= (first_id or 0),
+        )
+        col_next.button(
+            "Avis suivants ➡",
+            on_click=next_page,
+            args=(page_last,),
+            disabled=not has_next,
+        )
+        st.subheader(f"Commentaires (à partir de l'avis n° {start_id:,})")
+        show(df_page)
+    # Scores calculés à l'ingestion (src/backend/ingest_comments.py)
+    st.subheader("Sentiment des avis")
+    st.bar_chart(df_page["sentiment"])
+    # Word Cloud : fréquences de tout le corpus, cumulées à l'ingestion
+    buckets = {"Tous": "all", "Positifs": "pos", "Neutres": "neu", "Négatifs": "neg"}
+    wc_bucket = st.sidebar.selectbox("Avis du Word Cloud", list(buckets))
+    wc_ngrams = (
+        (1, 2) if st.sidebar.checkbox("Inclure les bigrammes", value=False) else (1,)
+    )
+    freqs = store.term_frequencies(buckets[wc_bucket], wc_ngrams, 200, unique)
+    st.subheader(f"Word Cloud ({wc_bucket.lower()}, {len(freqs)} termes)")
+    if not freqs:
+        st.info("Aucun terme pour cette sélection.")
+    else:
+
+        def draw_wc():
+            from wordcloud import WordCloud
+
+            wc = WordCloud(
+                width=800, height=400, background_color="white", random_state=0
+            ).generate_from_frequencies(freqs)
+            fig_wc, ax_wc = plt.subplots(figsize=(10, 5))
+            ax_wc.imshow(wc, interpolation="bilinear")
+            ax_wc.axis("off")
+            return fig_wc
+
+        show_figure(draw_wc, freqs)
@@ -0,0 +1,128 @@
+# File: src/backend/build_geo_assets.py
+# Magasin de géométries construit une fois à l'ETL : couches départements,
+# régions et communes à plusieurs tolérances de simplification, coordonnées
+# quantifiées, GeoJSON déjà sérialisé (propriétés réduites au code et au nom)
+# rangé dans un seul fichier Parquet. L'application le charge une fois par
+# processus et n'a plus à lire ni simplifier de GeoJSON brut.
+
+import argparse
+import json
+import os
+
+import geopandas as gpd
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+import shapely
+from shapely.geometry import mapping
+
+from backend.logging_setup import setup_logging
+
+logger = setup_logging()
+
+GEO_DIR = os.path.join("data", "raw", "geo")
+ASSETS_PATH = os.getenv(
+    "HOMEPEDIA_GEO_ASSETS", os.path.join("data", "processed", "geo_assets.parquet")
+)
+
+# Couche → GeoJSON source (ignorée si absente)
+LAYERS = {
+    "departements": os.path.join(GEO_DIR, "departements_simplifie.geojson"),
+    "regions": os.path.join(GEO_DIR, "regions.geojson"),
+    "communes": os.path.join(GEO_DIR, "communes.geojson"),
+}
+# Niveau → (tolérance de simplification en degrés, décimales conservées)
+LEVELS = {
+    "low": (0.02, 2),  # vue France entière (~1 km)
+    "medium": (0.005, 3),  # région (~100 m)
+    "high": (0.0, 4),  # département / commune (~10 m)
+}
+
+SCHEMA = pa.schema(
+    [
+        ("layer", pa.string()),
+        ("level", pa.string()),
+        ("tolerance", pa.float64()),
+        ("n_features", pa.int32()),
+        ("geojson", pa.large_string()),
+    ]
+)
+
+
+def quantize(geoms: np.ndarray, decimals: int) -> np.ndarray:
+    """Arrondit toutes les coordonnées (GeoJSON plus court, mieux compressé)."""
+    return shapely.transform(geoms, lambda coords: np.round(coords, decimals))
+
+
+def serialize(gdf: gpd.GeoDataFrame, tolerance: float, decimals: int) -> str:
+    """FeatureCollection compacte : propriétés code (+ nom), géométrie simplifiée."""
+    geoms = gdf.geometry.values
+    if tolerance:
+        geoms = gdf.geometry.simplify(tolerance, preserve_topology=True).values
+    geoms = quantize(np.asarray(geoms), decimals)
+    props = [c for c in ("code", "nom") if c in gdf.columns]
+    features = [
+        {
+            "type": "Feature",
+            "properties": {c: row[c] for c in props},
+            "geometry": mapping(geom),
+        }
+        for row, geom in zip(gdf[props].to_dict("records"), geoms, strict=True)
+        if geom is not None and not geom.is_empty
+    ]
+    return json.dumps(
+        {"type": "FeatureCollection", "features": features},
+        ensure_ascii=False,
+        separators=(",", ":"),
+    )
+
+
+def build_layer(layer: str, path: str) -> list[dict]:
+    gdf = gpd.read_file(path).to_crs(4326)
+    gdf["code"] = gdf["code"].astype(str)
+    rows = []
+    for level, (tolerance, decimals) in LEVELS.items():
+        geojson = serialize(gdf, tolerance, decimals)
+        rows.append(
+            {
+                "layer": layer,
+                "level": level,
+                "tolerance": tolerance,
+                "n_features": len(gdf),
+                "geojson": geojson,
+            }
+        )
+        logger.info(
+            "Couche %s / %s : %d entités, %.0f Ko",
+            layer,
+            level,
+            len(gdf),
+            len(geojson.encode()) / 1024,
+        )
+    return rows
+
+
+def build_assets(layers: dict[str, str] = LAYERS, out: str = ASSETS_PATH) -> int:
+    rows = []
+    for layer, path in layers.items():
+        if not os.path.exists(path):
+            logger.warning("GeoJSON absent, couche '%s' ignorée : %s", layer, path)
+            continue
+        rows.extend(build_layer(layer, path))
+    os.makedirs(os.path.dirname(out), exist_ok=True)
+    pq.write_table(pa.Table.from_pylist(rows, schema=SCHEMA), out, compression="zstd")
+    logger.info(
+        "✅ Magasin de géométries écrit : %s (%d couches×niveaux)", out, len(rows)
+    )
+    return len(rows)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Magasin de géométries Homepedia")
+    parser.add_argument("--out", default=ASSETS_PATH)
+    args = parser.parse_args(argv)
+    build_assets(out=args.out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,121 @@
+# File: src/backend/comment_dedup.py
+# Détection des quasi-doublons parmi les avis (formules toutes faites, textes
+# recopiés) par MinHash + LSH : signatures calculées par lots avec numpy,
+# découpage des signatures en bandes dont les valeurs identiques désignent les
+# paires candidates, vérification de chaque candidate contre le premier avis
+# de son groupe, puis regroupement par composantes connexes. Coût linéaire en
+# nombre d'avis : aucune comparaison deux à deux.
+
+import os
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+from scipy.sparse.csgraph import connected_components
+
+from backend.comment_tokens import TOKEN_PATTERN
+
+NUM_PERM = 64
+# 16 bandes de 4 valeurs : une paire à Jaccard 0,8 est candidate à 99,9 %
+BANDS, ROWS = 16, 4
+# Jaccard estimé (part des valeurs MinHash égales) au-delà duquel deux avis
+# sont des quasi-doublons
+DEDUP_THRESHOLD = float(os.getenv("HOMEPEDIA_DEDUP_THRESHOLD", "0.8"))
+# Avis par lot de calcul des signatures (mémoire : ~ lot × 20 shingles × 64 × 8 o)
+DEDUP_BATCH = 10_000
+SEED = 20240601
+
+# Hachages « multiply-shift » : (a·x + b) mod 2⁶⁴, 32 bits de poids fort
+# (a impair) ; le calcul modulo 2⁶⁴ est celui des entiers uint64 de numpy
+_rng = np.random.default_rng(SEED)
+_A = _rng.integers(0, 1 << 63, NUM_PERM, dtype=np.uint64) * np.uint64(2) + np.uint64(1)
+_B = _rng.integers(0, 1 << 63, NUM_PERM, dtype=np.uint64)
+_SHIFT = np.uint64(32)
+# Empreinte d'un bigramme : h(mot 1) × _PAIR_MIX + h(mot 2)
+_PAIR_MIX = np.uint64(0x9E3779B97F4A7C15)
+# Mélange des valeurs d'une bande en une clé 64 bits
+_BAND_MIX = _rng.integers(0, 1 << 63, ROWS, dtype=np.uint64) * np.uint64(2) + np.uint64(
+    1
+)
+
+
+def shingle_hashes(texts: pd.Series) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Empreintes 64 bits des bigrammes de mots de chaque avis, avec la
+    position de l'avis, triées par avis. Un avis de moins de deux mots a
+    pour seul shingle son texte entier. Chaque mot distinct n'est haché
+    qu'une fois ; l'empreinte d'un bigramme combine celles de ses deux mots.
+    """
+    texts = texts.reset_index(drop=True)
+    tokens = texts.str.lower().str.findall(TOKEN_PATTERN).explode().dropna()
+    doc = tokens.index.to_numpy()
+    codes, uniques = pd.factorize(tokens.to_numpy(dtype=object))
+    h = pd.util.hash_array(np.asarray(uniques, dtype=object))[codes]
+    pair = np.roll(doc, -1) == doc
+    if len(pair):
+        pair[-1] = False
+    with np.errstate(over="ignore"):
+        bigrams = h[pair] * _PAIR_MIX + np.roll(h, -1)[pair]
+    short = np.setdiff1d(np.arange(len(texts)), doc[pair])
+    whole = pd.util.hash_array(
+        texts.iloc[short].str.lower().str.strip().to_numpy(dtype=object)
+    )
+    docs = np.concatenate([doc[pair], short])
+    order = np.argsort(docs, kind="stable")
+    return docs[order], np.concatenate([bigrams, whole])[order]
+
+
+def signatures(texts: pd.Series) -> np.ndarray:
+    """Signatures MinHash (avis × NUM_PERM, uint32) des textes, dans l'ordre."""
+    out = np.empty((len(texts), NUM_PERM), dtype=np.uint32)
+    for start in range(0, len(texts), DEDUP_BATCH):
+        doc, h = shingle_hashes(texts.iloc[start : start + DEDUP_BATCH])
+        with np.errstate(over="ignore"):
+            perm = h[:, None] * _A
+            perm += _B
+        perm >>= _SHIFT
+        # un segment de shingles par avis : minimum par segment
+        starts = np.flatnonzero(np.r_[True, np.diff(doc) != 0])
+        out[start : start + len(starts)] = np.minimum.reduceat(perm, starts, axis=0)
+    return out
+
+
+def clusters(sig: np.ndarray, threshold: float = DEDUP_THRESHOLD) -> np.ndarray:
+    """
+    Représentant (plus petite position) du groupe de quasi-doublons de chaque
+    avis ; un avis sans doublon est son propre représentant.
+    """
+    n = len(sig)
+    idx = np.arange(n)
+    src, dst = [], []
+    for band in range(BANDS):
+        cols = sig[:, band * ROWS : (band + 1) * ROWS].astype(np.uint64)
+        with np.errstate(over="ignore"):
+            key = ((cols + np.uint64(1)) * _BAND_MIX).sum(axis=1, dtype=np.uint64)
+        # groupes numérotés dans l'ordre d'apparition : meneur = 1re position
+        group, _ = pd.factorize(key)
+        leader = pd.Series(group).drop_duplicates().index.to_numpy()[group]
+        cand = np.flatnonzero(leader != idx)
+        similar = (sig[cand] == sig[leader[cand]]).mean(axis=1) >= threshold
+        src.append(cand[similar])
+        dst.append(leader[cand[similar]])
+    src, dst = np.concatenate(src), np.concatenate(dst)
+    graph = sparse.coo_matrix((np.ones(len(src), dtype=np.int8), (src, dst)), (n, n))
+    _, labels = connected_components(graph, directed=False)
+    return pd.Series(idx).groupby(labels).transform("min").to_numpy()
+
+
+class NearDuplicates:
+    """Signatures accumulées bloc par bloc pendant l'ingestion, groupées à la fin."""
+
+    def __init__(self, threshold: float = DEDUP_THRESHOLD):
+        self.threshold = threshold
+        self._sigs: list[np.ndarray] = []
+
+    def add(self, texts: pd.Series) -> None:
+        self._sigs.append(signatures(texts))
+
+    def clusters(self) -> np.ndarray:
+        if not self._sigs:
+            return np.empty(0, dtype=np.int64)
+        return clusters(np.concatenate(self._sigs), self.threshold)
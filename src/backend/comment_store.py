@@ -0,0 +1,456 @@
+# File: src/backend/comment_store.py
+# Magasin de commentaires SQLite (remplace le JSON TinyDB) : un avis par ligne
+# sous une clé entière, pagination par clé (WHERE id >= ? LIMIT n, coût
+# proportionnel à la page) et tirage aléatoire par identifiants, sans jamais
+# charger la collection entière. Chaque avis porte son empreinte et son score
+# de sentiment, calculé à l'ingestion ; la table des fréquences de mots
+# (backend.comment_tokens) est cumulée au même moment. Un index plein texte
+# FTS5 (contenu externe : les textes ne sont pas dupliqués) est construit en
+# fin d'ingestion ; la recherche est classée par BM25 et paginée. Chaque avis
+# porte enfin l'identifiant du représentant de son groupe de quasi-doublons
+# (backend.comment_dedup) : les lectures peuvent les écarter à la volée.
+
+import json
+import os
+import re
+import sqlite3
+import threading
+from collections.abc import Iterable, Iterator, Sequence
+
+import numpy as np
+import pandas as pd
+
+from backend.comment_tokens import (
+    ALL_BUCKET,
+    TOKENS_TABLE,
+    UNIQUE_SUFFIX,
+    unique_bucket,
+)
+
+COMMENTS_DB = os.getenv(
+    "HOMEPEDIA_COMMENTS_DB", os.path.join("data", "processed", "comments.db")
+)
+COMMENTS_TABLE = "comments"
+# Colonnes du magasin (hors clé) : texte, empreinte, score de sentiment
+STORE_COLUMNS = ["commentaire", "text_hash", "sentiment"]
+# Métadonnées du magasin (clé → valeur), p. ex. le moteur de sentiment
+META_TABLE = "store_meta"
+# Colonnes renvoyées par les lectures
+READ_COLUMNS = "id, commentaire, sentiment"
+# Avis conservés sans doublons : le représentant de chaque groupe (ou tout
+# avis non groupé)
+UNIQUE_FILTER = "(cluster_id IS NULL OR cluster_id = id)"
+# Lignes par executemany lors des insertions massives
+INSERT_BATCH = 50_000
+# Index plein texte sur commentaire (contenu lu dans COMMENTS_TABLE)
+FTS_TABLE = "comments_fts"
+FTS_TOKENIZE = "unicode61 remove_diacritics 2"
+# Marqueurs des termes trouvés dans les extraits (remplacés à l'affichage)
+HIGHLIGHT = ("\x02", "\x03")
+SNIPPET_TOKENS = 24
+# Longueur minimale d'un préfixe recherché (« cle* ») : au-delà, trop d'avis
+PREFIX_MIN_LEN = 3
+
+
+def fts_query(text: str) -> str:
+    """
+    Requête FTS5 sûre à partir d'une saisie libre : chaque mot devient une
+    chaîne entre guillemets (tous requis), un `*` final cherche le préfixe
+    (PREFIX_MIN_LEN caractères au moins, sinon le mot entier).
+    """
+    terms = []
+    for term in re.findall(r"[\w']+\*?", text):
+        word = term.rstrip("*")
+        prefix = term.endswith("*") and len(word) >= PREFIX_MIN_LEN
+        terms.append(f'"{word}"' + ("*" if prefix else ""))
+    return " ".join(terms)
+
+
+class CommentStore:
+    """
+    Accès au magasin `path`. En lecture seule (`readonly=True`), une seule
+    connexion partagée entre threads, protégée par un verrou.
+    """
+
+    def __init__(self, path: str = COMMENTS_DB, readonly: bool = False):
+        self.path = path
+        self.readonly = readonly
+        if readonly:
+            if not os.path.exists(path):
+                raise FileNotFoundError(
+                    f"Magasin de commentaires absent : {path} "
+                    "(lancer src/backend/ingest_comments.py)"
+                )
+            uri = f"file:{os.path.abspath(path)}?mode=ro"
+            self.conn = sqlite3.connect(uri, uri=True, check_same_thread=False)
+        else:
+            os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+            self.conn = sqlite3.connect(path)
+            self.create()
+        self._lock = threading.Lock()
+
+    def create(self) -> None:
+        with self.conn:
+            self.conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {COMMENTS_TABLE} "
+                "(id INTEGER PRIMARY KEY, commentaire TEXT NOT NULL, "
+                "text_hash TEXT, sentiment REAL, cluster_id INTEGER)"
+            )
+            self.conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {META_TABLE} "
+                "(key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+            )
+            self.conn.execute(
+                f"CREATE TABLE IF NOT EXISTS {TOKENS_TABLE} "
+                "(term TEXT NOT NULL, ngram INTEGER NOT NULL, bucket TEXT NOT NULL, "
+                "n INTEGER NOT NULL, PRIMARY KEY (term, ngram, bucket)) WITHOUT ROWID"
+            )
+            self.conn.execute(
+                f"CREATE VIRTUAL TABLE IF NOT EXISTS {FTS_TABLE} USING fts5("
+                f"commentaire, content='{COMMENTS_TABLE}', content_rowid='id', "
+                f"tokenize='{FTS_TOKENIZE}')"
+            )
+
+    def _query(self, sql: str, params=()) -> pd.DataFrame:
+        with self._lock:
+            return pd.read_sql_query(sql, self.conn, params=params)
+
+    def _fetchone(self, sql: str, params=()) -> tuple:
+        with self._lock:
+            return self.conn.execute(sql, params).fetchone()
+
+    # --- écriture ---
+
+    def truncate(self) -> None:
+        with self.conn:
+            self.conn.execute(f"DELETE FROM {COMMENTS_TABLE}")
+            self.conn.execute(
+                f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('delete-all')"
+            )
+
+    def insert_many(self, texts: Iterable[str], batch: int = INSERT_BATCH) -> int:
+        """Insère les avis par lots (une transaction par lot). Retourne le nombre."""
+        n = 0
+        buf: list[tuple[str]] = []
+        for text in texts:
+            buf.append((text,))
+            if len(buf) >= batch:
+                n += self._insert(buf)
+                buf = []
+        if buf:
+            n += self._insert(buf)
+        return n
+
+    def _insert(self, rows: list[tuple[str]]) -> int:
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT INTO {COMMENTS_TABLE} (commentaire) VALUES (?)", rows
+            )
+        return len(rows)
+
+    def insert_frame(self, df: pd.DataFrame) -> int:
+        """Insère les colonnes de STORE_COLUMNS présentes dans `df` (une transaction)."""
+        cols = [c for c in STORE_COLUMNS if c in df.columns]
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT INTO {COMMENTS_TABLE} ({', '.join(cols)}) "
+                f"VALUES ({', '.join('?' * len(cols))})",
+                df[cols]
+                .astype(object)
+                .where(df[cols].notna(), None)
+                .itertuples(index=False, name=None),
+            )
+        return len(df)
+
+    def set_clusters(self, ids: np.ndarray, cluster_ids: np.ndarray) -> int:
+        """
+        Représentant du groupe de quasi-doublons de chaque avis (lui-même par
+        défaut). Retourne le nombre d'avis rattachés à un autre.
+        """
+        dup = ids != cluster_ids
+        with self.conn:
+            self.conn.execute(f"UPDATE {COMMENTS_TABLE} SET cluster_id = id")
+            self.conn.executemany(
+                f"UPDATE {COMMENTS_TABLE} SET cluster_id = ? WHERE id = ?",
+                zip(cluster_ids[dup].tolist(), ids[dup].tolist(), strict=True),
+            )
+        return int(dup.sum())
+
+    def add_term_counts(self, counts: pd.DataFrame) -> None:
+        """Cumule des occurrences (term, ngram, bucket, n) dans la table."""
+        with self.conn:
+            self.conn.executemany(
+                f"INSERT INTO {TOKENS_TABLE} (term, ngram, bucket, n) "
+                "VALUES (?, ?, ?, ?) "
+                "ON CONFLICT (term, ngram, bucket) DO UPDATE SET n = n + excluded.n",
+                counts[["term", "ngram", "bucket", "n"]]
+                .astype(object)
+                .itertuples(index=False, name=None),
+            )
+
+    def derive_unique_terms(self, duplicate_counts: Iterable[pd.DataFrame]) -> None:
+        """
+        Tranches sans quasi-doublons (suffixe UNIQUE_SUFFIX) : copie des
+        totaux, moins les occurrences des avis doublons.
+        """
+        with self.conn:
+            self.conn.execute(
+                f"INSERT INTO {TOKENS_TABLE} (term, ngram, bucket, n) "
+                f"SELECT term, ngram, bucket || ?, n FROM {TOKENS_TABLE} "
+                "WHERE bucket NOT LIKE ?",
+                (UNIQUE_SUFFIX, f"%{UNIQUE_SUFFIX}"),
+            )
+            for counts in duplicate_counts:
+                self.conn.executemany(
+                    f"UPDATE {TOKENS_TABLE} SET n = n - ? "
+                    "WHERE term = ? AND ngram = ? AND bucket = ?",
+                    zip(
+                        counts["n"].tolist(),
+                        counts["term"].tolist(),
+                        counts["ngram"].tolist(),
+                        counts["bucket"].map(unique_bucket).tolist(),
+                        strict=True,
+                    ),
+                )
+            self.conn.execute(f"DELETE FROM {TOKENS_TABLE} WHERE n <= 0")
+
+    def compact(self) -> None:
+        """
+        Index de lecture et index plein texte reconstruit en une passe sur la
+        table (les insertions ne le tiennent pas à jour), puis fichier réécrit
+        au plus juste (VACUUM).
+        """
+        with self.conn:
+            self.conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{COMMENTS_TABLE}_hash "
+                f"ON {COMMENTS_TABLE}(text_hash)"
+            )
+            # index partiel (doublons seuls) : comptes sans doublons rapides
+            self.conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{COMMENTS_TABLE}_dup "
+                f"ON {COMMENTS_TABLE}(cluster_id) WHERE cluster_id <> id"
+            )
+            self.conn.execute(
+                f"CREATE INDEX IF NOT EXISTS idx_{TOKENS_TABLE}_top "
+                f"ON {TOKENS_TABLE}(bucket, ngram, n DESC)"
+            )
+            self.conn.execute(
+                f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('rebuild')"
+            )
+            self.conn.execute(
+                f"INSERT INTO {FTS_TABLE}({FTS_TABLE}) VALUES ('optimize')"
+            )
+        self.conn.execute("VACUUM")
+
+    def set_meta(self, key: str, value: str) -> None:
+        with self.conn:
+            self.conn.execute(
+                f"INSERT OR REPLACE INTO {META_TABLE} (key, value) VALUES (?, ?)",
+                (key, value),
+            )
+
+    # --- lecture ---
+
+    def get_meta(self, key: str) -> str | None:
+        try:
+            row = self._fetchone(
+                f"SELECT value FROM {META_TABLE} WHERE key = ?", (key,)
+            )
+        except sqlite3.OperationalError:  # magasin sans table de métadonnées
+            return None
+        return row[0] if row else None
+
+    def columns(self) -> list[str]:
+        with self._lock:
+            info = self.conn.execute(f"PRAGMA table_info({COMMENTS_TABLE})")
+            return [row[1] for row in info.fetchall()]
+
+    def known_sentiments(self, hashes: Sequence[str]) -> dict[str, float]:
+        """Scores déjà calculés pour ces empreintes (réingestion incrémentale)."""
+        rows = self._query(
+            f"SELECT text_hash, sentiment FROM {COMMENTS_TABLE} "
+            "WHERE text_hash IN (SELECT value FROM json_each(?)) "
+            "AND sentiment IS NOT NULL GROUP BY text_hash",
+            (json.dumps(list(hashes)),),
+        )
+        return dict(zip(rows["text_hash"], rows["sentiment"], strict=True))
+
+    def term_frequencies(
+        self,
+        bucket: str = ALL_BUCKET,
+        ngrams: Sequence[int] = (1,),
+        limit: int = 200,
+        unique: bool = False,
+    ) -> dict[str, int]:
+        """
+        Les `limit` termes les plus fréquents de la tranche `bucket` (sans
+        quasi-doublons si `unique`) : une lecture d'index bornée par
+        n-gramme, puis fusion.
+        """
+        if not ngrams:
+            return {}
+        if unique:
+            bucket = unique_bucket(bucket)
+        top = pd.concat(
+            [
+                self._query(
+                    f"SELECT term, n FROM {TOKENS_TABLE} "
+                    "WHERE bucket = ? AND ngram = ? ORDER BY n DESC LIMIT ?",
+                    (bucket, ngram, limit),
+                )
+                for ngram in ngrams
+            ]
+        )
+        # concat d'un résultat vide : colonne object, d'où la conversion
+        top = top.astype({"n": "int64"}).nlargest(limit, "n")
+        return dict(zip(top["term"], top["n"].tolist(), strict=True))
+
+    def has_search(self) -> bool:
+        """Index plein texte présent (magasins antérieurs : non)."""
+        row = self._fetchone(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+            (FTS_TABLE,),
+        )
+        return row is not None
+
+    @staticmethod
+    def _fts_unique(unique: bool) -> str:
+        # représentant seul : une lecture par clé primaire par résultat
+        if not unique:
+            return ""
+        return (
+            f"AND EXISTS (SELECT 1 FROM {COMMENTS_TABLE} c "
+            f"WHERE c.id = {FTS_TABLE}.rowid AND {UNIQUE_FILTER}) "
+        )
+
+    def search_count(self, query: str, unique: bool = False) -> int:
+        """
+        Nombre d'avis correspondant à `query`, lu dans l'index seul (plus une
+        lecture par résultat si `unique`).
+        """
+        match = fts_query(query)
+        if not match:
+            return 0
+        return self._fetchone(
+            f"SELECT COUNT(*) FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH ? "
+            + self._fts_unique(unique),
+            (match,),
+        )[0]
+
+    def search(
+        self, query: str, limit: int = 50, offset: int = 0, unique: bool = False
+    ) -> pd.DataFrame:
+        """
+        Avis correspondant à `query`, du plus pertinent au moins pertinent
+        (BM25), page [offset, offset + limit) ; `extrait` encadre les termes
+        trouvés par les marqueurs HIGHLIGHT.
+        """
+        match = fts_query(query)
+        start, end = HIGHLIGHT
+        # Tri et extraits dans FTS5 (extraits des seules lignes de la page),
+        # puis jointure pour le score de sentiment
+        return self._query(
+            f"SELECT s.id, s.extrait, c.sentiment, s.score FROM ("
+            f"SELECT rowid AS id, snippet({FTS_TABLE}, 0, ?, ?, '…', ?) AS extrait, "
+            f"rank AS score FROM {FTS_TABLE} WHERE {FTS_TABLE} MATCH ? "
+            + self._fts_unique(unique)
+            + "ORDER BY rank LIMIT ? OFFSET ?"
+            f") s JOIN {COMMENTS_TABLE} c ON c.id = s.id ORDER BY s.score",
+            (start, end, SNIPPET_TOKENS, match or '""', limit, offset),
+        )
+
+    def has_clusters(self) -> bool:
+        """Groupes de quasi-doublons présents (magasins antérieurs : non)."""
+        return "cluster_id" in self.columns()
+
+    def count(self, unique: bool = False) -> int:
+        if unique:  # total moins les doublons (index partiel)
+            return self._fetchone(
+                f"SELECT (SELECT COUNT(*) FROM {COMMENTS_TABLE}) - "
+                f"(SELECT COUNT(*) FROM {COMMENTS_TABLE} WHERE cluster_id <> id)"
+            )[0]
+        return self._fetchone(f"SELECT COUNT(*) FROM {COMMENTS_TABLE}")[0]
+
+    def id_range(self) -> tuple[int | None, int | None]:
+        """Plus petit et plus grand identifiant (lus sur la clé primaire)."""
+        return self._fetchone(f"SELECT MIN(id), MAX(id) FROM {COMMENTS_TABLE}")
+
+    def page(
+        self, start_id: int = 0, limit: int = 50, unique: bool = False
+    ) -> pd.DataFrame:
+        """
+        `limit` avis à partir de l'identifiant `start_id` inclus (quasi-doublons
+        sautés si `unique`).
+        """
+        return self._query(
+            f"SELECT {READ_COLUMNS} FROM {COMMENTS_TABLE} WHERE id >= ? "
+            + (f"AND {UNIQUE_FILTER} " if unique else "")
+            + "ORDER BY id LIMIT ?",
+            (start_id, limit),
+        )
+
+    def page_with_next(
+        self, start_id: int = 0, limit: int = 50, unique: bool = False
+    ) -> tuple[pd.DataFrame, bool]:
+        """
+        Page de `page()` et présence d'avis au-delà (un avis de plus est lu) :
+        la dernière page pleine n'annonce pas de page suivante vide.
+        """
+        df = self.page(start_id, limit + 1, unique)
+        return df.iloc[:limit], len(df) > limit
+
+    def page_before(
+        self, before_id: int, limit: int = 50, unique: bool = False
+    ) -> pd.DataFrame:
+        """Les `limit` avis qui précèdent `before_id` (page précédente)."""
+        df = self._query(
+            f"SELECT {READ_COLUMNS} FROM {COMMENTS_TABLE} WHERE id < ? "
+            + (f"AND {UNIQUE_FILTER} " if unique else "")
+            + "ORDER BY id DESC LIMIT ?",
+            (before_id, limit),
+        )
+        return df.iloc[::-1].reset_index(drop=True)
+
+    def iter_duplicates(self, batch: int = INSERT_BATCH) -> Iterator[pd.DataFrame]:
+        """Avis doublons (représentant : un autre avis), par pages de clés."""
+        last = 0
+        while True:
+            df = self._query(
+                f"SELECT {READ_COLUMNS} FROM {COMMENTS_TABLE} "
+                "WHERE id > ? AND cluster_id <> id ORDER BY id LIMIT ?",
+                (last, batch),
+            )
+            if df.empty:
+                return
+            yield df
+            last = int(df["id"].iloc[-1])
+
+    def sample(self, n: int, seed: int | None = None) -> pd.DataFrame:
+        """
+        `n` avis tirés sans remise : identifiants aléatoires dans [min, max]
+        lus par la clé primaire ; les trous éventuels sont comblés par de
+        nouveaux tirages.
+        """
+        lo, hi = self.id_range()
+        if lo is None:
+            return self.page(0, 0)
+        rng = np.random.default_rng(seed)
+        n = min(n, self.count())
+        found: list[pd.DataFrame] = []
+        seen: set[int] = set()
+        missing, span = n, hi - lo + 1
+        while missing > 0 and len(seen) < span:
+            drawn = rng.permutation(np.unique(rng.integers(lo, hi + 1, 2 * missing)))
+            ids = [i for i in drawn.tolist() if i not in seen][:missing]
+            seen.update(ids)
+            df = self._query(
+                f"SELECT {READ_COLUMNS} FROM {COMMENTS_TABLE} "
+                "WHERE id IN (SELECT value FROM json_each(?))",
+                (json.dumps(ids),),
+            )
+            found.append(df)
+            missing -= len(df)
+        return pd.concat(found, ignore_index=True) if found else self.page(0, 0)
+
+    def close(self) -> None:
+        self.conn.close()
@@ -0,0 +1,86 @@
+# File: src/backend/comment_tokens.py
+# Fréquences des mots et bigrammes des avis, par tranche de sentiment,
+# comptées à l'ingestion bloc par bloc (opérations pandas vectorisées) et
+# cumulées dans le magasin de commentaires. Le nuage de mots de l'application
+# est construit à partir de cette table, sur tout le corpus.
+
+import numpy as np
+import pandas as pd
+
+# Découpage des avis en mots, partagé par les moteurs de sentiment et la
+# détection des doublons (module léger : importé par l'application)
+TOKEN_PATTERN = r"[a-z]+(?:'[a-z]+)?"
+
+TOKENS_TABLE = "comment_tokens"
+MIN_TOKEN_LEN = 3
+# Tranche de sentiment → bornes du score (tranche "all" : tous les avis)
+BUCKETS = {"neg": (-1.0, -0.05), "neu": (-0.05, 0.05), "pos": (0.05, 1.0)}
+ALL_BUCKET = "all"
+# Suffixe des tranches « sans quasi-doublons » (backend.comment_dedup)
+UNIQUE_SUFFIX = ":uniq"
+
+# Mots vides anglais (d'après la liste de wordcloud) + formules de Hotel_Reviews
+STOPWORDS = frozenset(
+    """
+    a about above after again against all also am an and any are aren't as at
+    be because been before being below between both but by can can't cannot
+    com could couldn't did didn't do does doesn't doing don't down during each
+    else ever few for from further get had hadn't has hasn't have haven't
+    having he he'd he'll he's hence her here here's hers herself him himself
+    his how how's however http i i'd i'll i'm i've if in into is isn't it it's
+    its itself just k let's like me more most mustn't my myself no nor not of
+    off on once only or other otherwise ought our ours ourselves out over own
+    r same shall shan't she she'd she'll she's should shouldn't since so some
+    such than that that's the their theirs them themselves then there there's
+    therefore these they they'd they'll they're they've this those through to
+    too under until up very was wasn't we we'd we'll we're we've were weren't
+    what what's when when's where where's which while who who's whom why why's
+    with won't would wouldn't www you you'd you'll you're you've your yours
+    yourself yourselves
+    negative positive nothing
+    """.split()
+)
+
+
+def sentiment_bucket(scores: pd.Series) -> pd.Series:
+    """Tranche ('neg', 'neu', 'pos') de chaque score."""
+    values = scores.to_numpy(dtype=np.float64)
+    out = np.select(
+        [values < BUCKETS["neu"][0], values > BUCKETS["neu"][1]], ["neg", "pos"], "neu"
+    )
+    return pd.Series(out, index=scores.index)
+
+
+def unique_bucket(bucket: str) -> str:
+    """Tranche comptant un seul avis par groupe de quasi-doublons."""
+    return bucket + UNIQUE_SUFFIX
+
+
+def count_terms(texts: pd.Series, buckets: pd.Series) -> pd.DataFrame:
+    """
+    Occurrences (term, ngram, bucket, n) des mots et bigrammes de `texts`,
+    mots vides et mots courts exclus, par tranche et pour la tranche "all".
+    """
+    texts = texts.reset_index(drop=True)
+    buckets = buckets.reset_index(drop=True).to_numpy(dtype=object)
+    tokens = texts.str.lower().str.findall(TOKEN_PATTERN).explode().dropna()
+    doc = tokens.index.to_numpy()
+    tok = tokens.to_numpy(dtype=object)
+    keep = ~tokens.isin(STOPWORDS).to_numpy() & (
+        tokens.str.len().to_numpy() >= MIN_TOKEN_LEN
+    )
+    # Bigramme : jeton suivant du même avis, les deux conservés
+    pair = keep & np.roll(keep, -1) & (np.roll(doc, -1) == doc)
+    if len(pair):
+        pair[-1] = False
+    terms = pd.DataFrame(
+        {
+            "term": np.concatenate(
+                [tok[keep], tok[pair] + " " + np.roll(tok, -1)[pair]]
+            ),
+            "ngram": np.repeat([1, 2], [keep.sum(), pair.sum()]),
+            "bucket": np.concatenate([buckets[doc[keep]], buckets[doc[pair]]]),
+        }
+    )
+    both = pd.concat([terms, terms.assign(bucket=ALL_BUCKET)], ignore_index=True)
+    return both.groupby(["term", "ngram", "bucket"]).size().rename("n").reset_index()
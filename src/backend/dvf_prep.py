@@ -0,0 +1,116 @@
+# File: src/backend/dvf_prep.py
+# Normalisation des transactions DVF, faite une seule fois à l'ingestion et au
+# chargement : valeur foncière numérique, code postal sur 5 caractères, prix au
+# m² et code département précalculés (colonnes indexables côté base), plus une
+# empreinte de la clé naturelle de chaque mutation pour les rechargements.
+
+import glob
+import os
+
+import pandas as pd
+
+from backend.geo_codes import dept_from_postal
+
+# CSV traités par millésime, écrits par ingest_valeursfoncieres
+PROCESSED_PATTERN = "transactions_[0-9][0-9][0-9][0-9].csv"
+
+# Types de lecture des CSV traités (transactions_<année>.csv)
+PROCESSED_DTYPES = {
+    "nature_mutation": str,
+    "valeur_fonciere": str,
+    "code_postal": str,
+    "commune": str,
+    "type_local": str,
+    "surface_reelle_bati": "float64",
+    "nombre_pieces_principales": "float64",
+}
+
+# Clé naturelle d'une mutation (mêmes colonnes que le dédoublonnage DVF)
+FINGERPRINT_COLS = [
+    "date_mutation",
+    "nature_mutation",
+    "valeur_fonciere",
+    "code_postal",
+    "commune",
+    "type_local",
+    "surface_reelle_bati",
+    "nombre_pieces_principales",
+]
+NUMERIC_KEY_COLS = [
+    "valeur_fonciere",
+    "surface_reelle_bati",
+    "nombre_pieces_principales",
+]
+
+
+def parse_valeur(valeur: pd.Series) -> pd.Series:
+    """Convertit '123 456,78' (format DVF) ou un float en float."""
+    if valeur.dtype != object and not pd.api.types.is_string_dtype(valeur):
+        return valeur.astype(float)
+    return pd.to_numeric(
+        valeur.str.replace(" ", "", regex=False).str.replace(",", ".", regex=False),
+        errors="coerce",
+    )
+
+
+def normalize_code_postal(code_postal: pd.Series) -> pd.Series:
+    """'1000.0', 1000.0 ou '01000' → '01000'."""
+    return (
+        code_postal.astype("string")
+        .str.strip()
+        .str.replace(r"\.0$", "", regex=True)
+        .str.zfill(5)
+    )
+
+
+def transaction_fingerprint(df: pd.DataFrame) -> pd.Series:
+    """
+    Empreinte 64 bits (signée, pour un INTEGER SQL) de la clé naturelle.
+    Les valeurs sont d'abord mises sous forme canonique texte, pour que la même
+    mutation donne la même empreinte quelle que soit la source (CSV, Parquet).
+    """
+    key = pd.DataFrame(index=df.index)
+    for col in FINGERPRINT_COLS:
+        if col == "date_mutation":
+            key[col] = pd.to_datetime(df[col]).dt.strftime("%Y-%m-%d")
+        elif col in NUMERIC_KEY_COLS:
+            key[col] = pd.to_numeric(df[col]).astype("Float64").astype("string")
+        else:
+            key[col] = df[col].astype("string")
+    hashes = pd.util.hash_pandas_object(key.fillna(""), index=False)
+    return pd.Series(hashes.to_numpy().view("int64"), index=df.index)
+
+
+def prepare_transactions(df: pd.DataFrame) -> pd.DataFrame:
+    """
+    Retourne une copie prête pour la base : valeur_fonciere en REAL, code_postal
+    normalisé, prix_m2 (NULL si surface nulle ou absente), dept et fingerprint.
+    """
+    df = df.copy()
+    df["valeur_fonciere"] = parse_valeur(df["valeur_fonciere"])
+    df["code_postal"] = normalize_code_postal(df["code_postal"])
+    surface = pd.to_numeric(df["surface_reelle_bati"], errors="coerce")
+    df["prix_m2"] = (df["valeur_fonciere"] / surface).where(surface > 0)
+    df["dept"] = dept_from_postal(df["code_postal"])
+    df["fingerprint"] = transaction_fingerprint(df)
+    return df
+
+
+def read_processed(path: str, chunksize: int):
+    """Lit un CSV traité par blocs et produit des blocs prêts pour la base."""
+    reader = pd.read_csv(
+        path, parse_dates=["date_mutation"], dtype=PROCESSED_DTYPES, chunksize=chunksize
+    )
+    for chunk in reader:
+        yield prepare_transactions(chunk)
+
+
+def processed_files(directory: str) -> list[str]:
+    """CSV traités transactions_<année>.csv présents, du plus ancien au récent."""
+    return sorted(glob.glob(os.path.join(directory, PROCESSED_PATTERN)))
+
+
+def read_processed_files(paths: list[str], chunksize: int):
+    """Enchaîne read_processed sur plusieurs CSV traités (un par millésime)."""
+    for path in paths:
+        yield from read_processed(path, chunksize)
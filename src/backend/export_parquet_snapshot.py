@@ -0,0 +1,106 @@
+# File: src/backend/export_parquet_snapshot.py
+# Instantané Parquet de homepedia.db pour le moteur DuckDB de l'application :
+# une table SQLite → un fichier <table>.parquet, écrit par blocs avec un schéma
+# Arrow dérivé des types déclarés (stable d'un bloc à l'autre).
+
+import argparse
+import os
+import sqlite3
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from backend.logging_setup import setup_logging
+
+logger = setup_logging()
+
+DB_FILE = os.getenv("DB_PATH", os.path.join("data", "homepedia.db"))
+SNAPSHOT_DIR = os.getenv(
+    "HOMEPEDIA_SNAPSHOT_DIR", os.path.join("data", "processed", "snapshot")
+)
+CHUNK_SIZE = int(os.getenv("SNAPSHOT_CHUNK_SIZE", "200000"))
+# Tri appliqué à l'export : les row groups couvrent des plages de dates
+# disjointes, DuckDB écarte ceux hors du filtre via leurs statistiques min/max
+SORT_KEYS = {"transactions": "date_mutation"}
+
+
+def arrow_type(declared: str) -> pa.DataType:
+    """Type Arrow d'une colonne selon son type SQLite déclaré."""
+    decl = declared.upper()
+    if "DATE" in decl or "TIME" in decl:
+        return pa.timestamp("us")
+    if "INT" in decl:
+        return pa.int64()
+    if any(t in decl for t in ("REAL", "FLOA", "DOUB", "NUMERIC", "DECIMAL")):
+        return pa.float64()
+    return pa.string()
+
+
+def table_schema(conn: sqlite3.Connection, table: str) -> pa.Schema:
+    info = conn.execute(f"PRAGMA table_info('{table}')").fetchall()
+    return pa.schema([(name, arrow_type(decl)) for _, name, decl, *_ in info])
+
+
+def export_table(conn: sqlite3.Connection, table: str, out_dir: str) -> int:
+    """Exporte `table` en Parquet par blocs. Retourne le nombre de lignes."""
+    schema = table_schema(conn, table)
+    dates = [f.name for f in schema if pa.types.is_timestamp(f.type)]
+    order = f" ORDER BY {SORT_KEYS[table]}" if table in SORT_KEYS else ""
+    path = os.path.join(out_dir, f"{table}.parquet")
+    tmp_path = path + ".tmp"
+
+    n_rows = 0
+    with pq.ParquetWriter(tmp_path, schema, compression="zstd") as writer:
+        for chunk in pd.read_sql_query(
+            f"SELECT * FROM {table}{order}", conn, chunksize=CHUNK_SIZE
+        ):
+            for col in dates:
+                chunk[col] = pd.to_datetime(chunk[col], format="mixed")
+            writer.write_table(
+                pa.Table.from_pandas(chunk, schema=schema, preserve_index=False)
+            )
+            n_rows += len(chunk)
+    os.replace(tmp_path, path)
+    logger.info("'%s' → %s (%d lignes)", table, path, n_rows)
+    return n_rows
+
+
+def export_snapshot(
+    db_path: str = DB_FILE, out_dir: str = SNAPSHOT_DIR, tables=None
+) -> dict[str, int]:
+    """Exporte les tables demandées (toutes par défaut) dans `out_dir`."""
+    os.makedirs(out_dir, exist_ok=True)
+    conn = sqlite3.connect(db_path)
+    try:
+        if not tables:
+            tables = [
+                r[0]
+                for r in conn.execute(
+                    "SELECT name FROM sqlite_master "
+                    "WHERE type='table' AND name NOT LIKE 'sqlite_%' ORDER BY name"
+                )
+            ]
+        return {t: export_table(conn, t, out_dir) for t in tables}
+    finally:
+        conn.close()
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Instantané Parquet de homepedia.db (moteur DuckDB)"
+    )
+    parser.add_argument("--db", default=DB_FILE)
+    parser.add_argument("--out", default=SNAPSHOT_DIR)
+    parser.add_argument("--tables", nargs="+", help="tables à exporter (toutes)")
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+    counts = export_snapshot(args.db, args.out, args.tables)
+    logger.info("✅ Instantané Parquet : %d tables dans %s", len(counts), args.out)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,134 @@
+# File: src/backend/geo_codes.py
+# Résolution vectorisée des codes géographiques : commune INSEE / code postal
+# → département → région. Les règles (Corse 2A/2B, DOM sur 3 caractères) sont
+# précalculées une fois dans des tables de correspondance indexées par préfixe ;
+# chaque appel ne traite que les valeurs distinctes (factorize) puis redistribue
+# le résultat, sans boucle Python par ligne.
+
+import os
+from functools import lru_cache
+
+import numpy as np
+import pandas as pd
+
+from backend.logging_setup import setup_logging
+
+logger = setup_logging()
+
+COMMUNES_CSV = os.path.join("data", "raw", "insee", "communes.csv")
+DEPT_REGION_CSV = os.path.join("data", "raw", "insee", "dept_region.csv")
+
+
+def _dept_rule(prefix3: str) -> str:
+    """Département d'un préfixe de 3 caractères (code postal ou INSEE)."""
+    if prefix3[:2] in ("2A", "2B"):
+        return prefix3[:2]
+    if prefix3[:2] == "20":
+        # codes postaux corses : 200xx-201xx → Corse-du-Sud, 202xx-206xx → Haute-Corse
+        return "2A" if prefix3 < "202" else "2B"
+    if prefix3[:2] in ("97", "98"):
+        return prefix3
+    return prefix3[:2]
+
+
+@lru_cache(maxsize=1)
+def prefix_table() -> pd.Series:
+    """Table préfixe (3 caractères) → département, construite une seule fois."""
+    prefixes = [f"{i:03d}" for i in range(1000)]
+    prefixes += [f"2{c}{d}" for c in "AB" for d in range(10)]
+    return pd.Series([_dept_rule(p) for p in prefixes], index=pd.Index(prefixes))
+
+
+def _read_codes_csv(path: str) -> pd.DataFrame:
+    """Lit un CSV INSEE (séparateur ';' ou ',') en texte."""
+    df = pd.read_csv(path, dtype=str, sep=None, engine="python")
+    df.columns = df.columns.str.strip()
+    return df
+
+
+def _dep_reg_pairs(df: pd.DataFrame, path: str) -> pd.DataFrame:
+    """Extrait les colonnes département / région (noms contenant 'dep' / 'reg')."""
+    cols = df.columns.tolist()
+    dep_col = next((c for c in cols if "dep" in c.lower()), None)
+    reg_col = next((c for c in cols if "reg" in c.lower()), None)
+    if not dep_col or not reg_col:
+        raise KeyError(f"Colonnes Dépt/Région introuvables dans {path}: {cols}")
+    pairs = df[[dep_col, reg_col]].dropna()
+    pairs.columns = ["dept", "region"]
+    pairs["dept"] = pairs["dept"].str.strip().str.upper().str.zfill(2)
+    pairs["region"] = pairs["region"].str.strip().str.zfill(2)
+    return pairs
+
+
+def build_region_table(
+    dept_region_csv: str = DEPT_REGION_CSV, communes_csv: str = COMMUNES_CSV
+) -> pd.Series:
+    """
+    Table département → région. dept_region.csv fait foi ; les couples
+    (DEP, REG) distincts de communes.csv complètent les départements absents.
+    """
+    frames = []
+    for path in (dept_region_csv, communes_csv):
+        if os.path.exists(path):
+            frames.append(_dep_reg_pairs(_read_codes_csv(path), path))
+        else:
+            logger.warning("Référentiel géographique absent : %s", path)
+    if not frames:
+        return pd.Series(dtype=object)
+    pairs = pd.concat(frames).drop_duplicates("dept", keep="first")
+    return pd.Series(pairs["region"].to_numpy(), index=pd.Index(pairs["dept"]))
+
+
+@lru_cache(maxsize=1)
+def region_table() -> pd.Series:
+    """Table département → région par défaut (chargée une fois par processus)."""
+    return build_region_table()
+
+
+def _lookup(codes: pd.Series, keys, table: pd.Series) -> pd.Series:
+    """
+    Résout `codes` via `table` : `keys(uniques)` calcule la clé de chaque valeur
+    distincte, le résultat est redistribué sur toutes les lignes par indices.
+    """
+    codes = pd.Series(codes)
+    idx, uniques = pd.factorize(codes)
+    pos = table.index.get_indexer(keys(pd.Index(uniques).astype(str)))
+    # dernière case = valeur manquante (codes NA ou clé inconnue)
+    values = np.append(table.to_numpy(dtype=object), None)
+    resolved = values[np.where(pos >= 0, pos, len(table))]
+    return pd.Series(np.append(resolved, None)[idx], index=codes.index, dtype="string")
+
+
+def _prefix3(uniques: pd.Index) -> pd.Index:
+    """'1000.0' / '01000' / '2a004' → '010' / '010' / '2A0'."""
+    return (
+        uniques.str.strip()
+        .str.upper()
+        .str.replace(r"\.0$", "", regex=True)
+        .str.zfill(5)
+        .str[:3]
+    )
+
+
+def dept_from_postal(code_postal: pd.Series) -> pd.Series:
+    """Code postal → code département ('01', '2A', '971'…)."""
+    return _lookup(code_postal, _prefix3, prefix_table())
+
+
+def dept_from_insee(code_commune: pd.Series) -> pd.Series:
+    """Code commune INSEE ('01001', '2A004', '97101'…) → code département."""
+    return _lookup(code_commune, _prefix3, prefix_table())
+
+
+def region_from_dept(dept: pd.Series, table: pd.Series | None = None) -> pd.Series:
+    """Code département → code région INSEE (2 caractères)."""
+    table = region_table() if table is None else table
+    return _lookup(dept, lambda u: u.str.strip().str.upper().str.zfill(2), table)
+
+
+def region_from_postal(code_postal: pd.Series) -> pd.Series:
+    return region_from_dept(dept_from_postal(code_postal))
+
+
+def region_from_insee(code_commune: pd.Series) -> pd.Series:
+    return region_from_dept(dept_from_insee(code_commune))
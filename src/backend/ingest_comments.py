@@ -1,44 +1,193 @@
+# File: src/backend/ingest_comments.py
+# Ingestion des avis Hotel_Reviews en une seule passe : le CSV brut est lu par
+# blocs et nettoyé une fois ; chaque bloc est ajouté au CSV traité et inséré
+# par lots dans le magasin de commentaires, avec son score de sentiment (pool
+# de processus ; les scores du même moteur sont repris du magasin précédent
+# pour les avis déjà vus) ; les fréquences de mots du bloc sont cumulées dans
+# le magasin et ses signatures MinHash conservées. En fin de lecture, les
+# quasi-doublons sont groupés (LSH) et les fréquences sans doublons dérivées.
+# Les deux sorties sont écrites dans des fichiers temporaires puis remplacées
+# à la fin.
+
+import argparse
 import os
+import time
 
+import numpy as np
 import pandas as pd
 
+from backend.comment_dedup import NearDuplicates
+from backend.comment_store import COMMENTS_DB, CommentStore
+from backend.comment_tokens import count_terms, sentiment_bucket
 from backend.logging_setup import setup_logging
+from backend.sentiment import (
+    ENGINES,
+    SENTIMENT_ENGINE,
+    SENTIMENT_WORKERS,
+    BatchScorer,
+    text_hash,
+)
 
 logger = setup_logging()
 
+RAW = os.path.join("data", "raw", "comments", "Hotel_Reviews.csv")
+OUT = os.path.join("data", "processed", "comments.csv")
+CHUNK_SIZE = int(os.getenv("COMMENTS_CHUNK_SIZE", "100000"))
 
-def main():
-    RAW = os.path.join("data", "raw", "comments", "Hotel_Reviews.csv")
-    OUT = os.path.join("data", "processed", "comments.csv")
-    os.makedirs(os.path.dirname(OUT), exist_ok=True)
 
-    logger.info("Lecture brut commentaires : %s", RAW)
-    # On charge les colonnes neg et pos
-    df = pd.read_csv(
-        RAW,
-        usecols=["Negative_Review", "Positive_Review"],
-        encoding="latin1",
-        low_memory=False,
+def clean(chunk: pd.DataFrame) -> pd.Series:
+    """
+    Avis positif + négatif concaténés (nettoyage d'origine, inchangé : le
+    séparateur ' ' est conservé, si bien qu'aucun avis n'est écarté).
+    """
+    text = (
+        chunk["Positive_Review"].fillna("").str.strip()
+        + " "
+        + chunk["Negative_Review"].fillna("").str.strip()
     )
+    return text[text.str.len() > 0].rename("commentaire")
 
-    # Concaténer positif + négatif
-    df["commentaire"] = (
-        df["Positive_Review"].fillna("").str.strip()
-        + " "
-        + df["Negative_Review"].fillna("").str.strip()
+
+def with_sentiment(
+    comments: pd.Series, scorer: BatchScorer, previous: CommentStore | None
+) -> tuple[pd.DataFrame, int]:
+    """
+    Avis + empreinte + score. Seuls les textes absents du magasin précédent
+    sont évalués (une fois par texte distinct). Retourne aussi ce nombre.
+    """
+    frame = comments.to_frame()
+    frame["text_hash"] = [text_hash(t) for t in comments]
+    known = previous.known_sentiments(frame["text_hash"].unique()) if previous else {}
+    frame["sentiment"] = frame["text_hash"].map(known)
+    todo = frame.loc[frame["sentiment"].isna()].drop_duplicates("text_hash")
+    if len(todo):
+        scores = dict(
+            zip(
+                todo["text_hash"],
+                scorer.score(todo["commentaire"].tolist()),
+                strict=True,
+            )
+        )
+        missing = frame["sentiment"].isna()
+        frame.loc[missing, "sentiment"] = frame.loc[missing, "text_hash"].map(scores)
+    return frame, len(todo)
+
+
+def ingest(
+    raw: str = RAW,
+    out_csv: str = OUT,
+    store_path: str = COMMENTS_DB,
+    chunk_size: int = CHUNK_SIZE,
+    scorer: BatchScorer | None = None,
+) -> int:
+    """
+    Écrit le CSV traité et le magasin en une lecture du CSV brut. Les scores
+    du magasin existant (`store_path`) sont réutilisés.
+    """
+    os.makedirs(os.path.dirname(out_csv), exist_ok=True)
+    tmp_csv, tmp_store = out_csv + ".tmp", store_path + ".tmp"
+    if os.path.exists(tmp_store):
+        os.remove(tmp_store)
+
+    logger.info("Lecture brut commentaires : %s (blocs de %d)", raw, chunk_size)
+    start = time.perf_counter()
+    n = n_scored = 0
+    scorer = scorer or BatchScorer()
+    previous = None
+    if os.path.exists(store_path):
+        previous = CommentStore(store_path, readonly=True)
+        # scores réutilisables s'ils viennent du même moteur
+        if previous.get_meta("sentiment_engine") != scorer.name:
+            previous.close()
+            previous = None
+    store = CommentStore(tmp_store)
+    store.set_meta("sentiment_engine", scorer.name)
+    dedup = NearDuplicates()
+    try:
+        with (
+            scorer,
+            open(tmp_csv, "w", encoding="utf-8", newline="") as csv_file,
+        ):
+            for chunk in pd.read_csv(
+                raw,
+                usecols=["Negative_Review", "Positive_Review"],
+                encoding="latin1",
+                chunksize=chunk_size,
+            ):
+                comments = clean(chunk)
+                comments.to_frame().to_csv(csv_file, index=False, header=n == 0)
+                frame, scored = with_sentiment(comments, scorer, previous)
+                n += store.insert_frame(frame)
+                store.add_term_counts(
+                    count_terms(
+                        frame["commentaire"], sentiment_bucket(frame["sentiment"])
+                    )
+                )
+                dedup.add(frame["commentaire"])
+                n_scored += scored
+                elapsed = time.perf_counter() - start
+                logger.info(
+                    "%d commentaires, %d scores calculés (%.0f lignes/s)",
+                    n,
+                    n_scored,
+                    n / max(elapsed, 1e-9),
+                )
+        # magasin neuf : identifiants consécutifs dans l'ordre d'insertion
+        first_id, _ = store.id_range()
+        ids = np.arange(n) + (first_id or 0)
+        n_dup = store.set_clusters(ids, ids[dedup.clusters()])
+        store.derive_unique_terms(
+            count_terms(dup["commentaire"], sentiment_bucket(dup["sentiment"]))
+            for dup in store.iter_duplicates()
+        )
+        logger.info("%d quasi-doublons rattachés à un représentant", n_dup)
+        store.compact()
+    finally:
+        store.close()
+        if previous is not None:
+            previous.close()
+
+    os.replace(tmp_csv, out_csv)
+    os.replace(tmp_store, store_path)
+    elapsed = time.perf_counter() - start
+    logger.info(
+        "Ingestion commentaires OK : %d avis en %.1f s (%.0f lignes/s) → %s, %s",
+        n,
+        elapsed,
+        n / max(elapsed, 1e-9),
+        out_csv,
+        store_path,
     )
+    return n
 
-    # Filtrer lignes vides
-    df = df[df["commentaire"].str.len() > 0].copy()
 
-    # Conserver seulement la colonne de commentaire
-    df = df[["commentaire"]]
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Ingestion des avis : CSV traité + magasin de commentaires"
+    )
+    parser.add_argument("--raw", default=RAW)
+    parser.add_argument("--csv", default=OUT)
+    parser.add_argument("--store", default=COMMENTS_DB)
+    parser.add_argument("--chunk-size", type=int, default=CHUNK_SIZE)
+    parser.add_argument("--engine", choices=sorted(ENGINES), default=SENTIMENT_ENGINE)
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=SENTIMENT_WORKERS,
+        help="processus de calcul du sentiment",
+    )
+    return parser.parse_args(argv)
 
-    logger.info("Nombre de commentaires à ingérer : %d", len(df))
 
-    # Écriture du CSV traité
-    df.to_csv(OUT, index=False, encoding="utf-8")
-    logger.info("Ingestion commentaires OK → %s", OUT)
+def main(argv=None):
+    args = parse_args(argv)
+    ingest(
+        args.raw,
+        args.csv,
+        args.store,
+        args.chunk_size,
+        BatchScorer(args.engine, workers=args.workers),
+    )
 
 
 if __name__ == "__main__":
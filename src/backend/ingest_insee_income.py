@@ -5,26 +5,12 @@ import sqlite3
 
 import pandas as pd
 
+from backend.geo_codes import dept_from_insee
 from backend.logging_setup import setup_logging
 
 logger = setup_logging()
 
 
-def extract_dept(code_insee: str) -> str:
-    """
-    Extrait le code départemental à partir du code INSEE commune.
-    Gestion particulière :
-    - DOM-TOM commencent par 97 ou 98 → 3 caractères code.
-    - Corse (20) → 2A ou 2B selon le 3ème chiffre.
-    """
-    code5 = str(code_insee).zfill(5)
-    if code5.startswith(("97", "98")):
-        return code5[:3]
-    elif code5[:2] == "20":
-        return "2A" if int(code5[2]) < 2 else "2B"
-    return code5[:2]
-
-
 def main():
     RAW = os.path.join("data", "raw", "insee", "DS_FILOSOFI_CC_2021_data.csv")
     OUT_CSV = os.path.join("data", "processed", "income_dept.csv")
@@ -44,7 +30,8 @@ def main():
         & (df["OBS_VALUE"] != "")
     ].copy()
 
-    df_filt["dept"] = df_filt["GEO"].apply(extract_dept)
+    # Corse (2A/2B) et DOM (971…) gérés par le résolveur vectorisé
+    df_filt["dept"] = dept_from_insee(df_filt["GEO"])
 
     logger.info("Conversion des valeurs en float")
     df_filt["income_median"] = df_filt["OBS_VALUE"].str.replace(",", ".").astype(float)
@@ -5,6 +5,7 @@ import sqlite3
 
 import pandas as pd
 
+from backend.geo_codes import dept_from_insee
 from backend.logging_setup import setup_logging
 
 logger = setup_logging()
@@ -29,7 +30,7 @@ def main():
 
     # 4. Extraction du code département
     logger.info("Extraction du code département à partir de la colonne GEO")
-    df["code"] = df["geo"].str[:2]
+    df["code"] = dept_from_insee(df["geo"])
 
     # 5. Conversion en float + suppression des non numériques
     logger.info(
@@ -1,19 +1,33 @@
+import argparse
 import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from itertools import compress
 
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.dataset as ds
 
+from backend.dvf_prep import normalize_code_postal, parse_valeur
+from backend.geo_codes import dept_from_postal
 from backend.logging_setup import setup_logging
 
 logger = setup_logging()
 
 
-# 1. Chemins
-RAW_DIR = os.path.join("data", "raw", "dvf2024")
+# 1. Chemins (un fichier brut par millésime : data/raw/dvf<année>/...)
+RAW_ROOT = os.path.join("data", "raw")
 OUTPUT_DIR = os.path.join("data", "processed")
 os.makedirs(OUTPUT_DIR, exist_ok=True)
 
-INPUT_FILE = os.path.join(RAW_DIR, "valeursfoncieres-2024.txt")
-OUTPUT_FILE = os.path.join(OUTPUT_DIR, "transactions_2024.csv")
+# Jeu Parquet partitionné Hive : transactions/year=2024/dept=75/part-*.parquet
+DATASET_DIR = os.path.join(OUTPUT_DIR, "transactions")
+
+YEARS = list(range(2019, 2026))
+
+# Nombre de lignes lues à la fois : la mémoire crête dépend de cette valeur,
+# pas de la taille du fichier.
+CHUNK_SIZE = int(os.getenv("DVF_CHUNK_SIZE", "200000"))
 
 # 2. Colonnes cibles en snake_case (avec 'commune' au lieu de 'nom_commune')
 TARGET_COLS = [
@@ -27,16 +41,49 @@ TARGET_COLS = [
     "nombre_pieces_principales",
 ]
 
+# Types explicites (identiques à ceux qu'inférait la lecture complète, pour que
+# le CSV produit reste le même : code postal et surfaces en float, valeur
+# foncière conservée telle quelle avec sa virgule décimale).
+TARGET_DTYPES = {
+    "date_mutation": str,
+    "nature_mutation": str,
+    "valeur_fonciere": str,
+    "code_postal": "float64",
+    "commune": str,
+    "type_local": str,
+    "surface_reelle_bati": "float64",
+    "nombre_pieces_principales": "float64",
+}
+
+# Schéma typé du jeu Parquet (year et dept deviennent des répertoires)
+PARQUET_SCHEMA = pa.schema(
+    [
+        ("date_mutation", pa.date32()),
+        ("nature_mutation", pa.string()),
+        ("valeur_fonciere", pa.float64()),
+        ("code_postal", pa.string()),
+        ("commune", pa.string()),
+        ("type_local", pa.string()),
+        ("surface_reelle_bati", pa.float64()),
+        ("nombre_pieces_principales", pa.int16()),
+        ("year", pa.int16()),
+        ("dept", pa.string()),
+    ]
+)
+
 
-def main():
-    logger.info("Lecture du fichier brut : %s", INPUT_FILE)
+def raw_file(year: int) -> str:
+    return os.path.join(RAW_ROOT, f"dvf{year}", f"valeursfoncieres-{year}.txt")
 
-    # 3. Lecture sans parse_dates
-    df = pd.read_csv(INPUT_FILE, sep="|", low_memory=False)
 
-    # 4. Normaliser les noms de colonnes
-    df.columns = (
-        df.columns.str.strip()
+def csv_file(year: int) -> str:
+    return os.path.join(OUTPUT_DIR, f"transactions_{year}.csv")
+
+
+def normalize_columns(columns: pd.Index) -> pd.Index:
+    """Normalise les en-têtes DVF en snake_case ASCII."""
+    return (
+        columns.str.strip()
         .str.lower()
         .str.replace(" ", "_", regex=False)
         .str.normalize("NFKD")
@@ -44,25 +91,167 @@ def main():
         .str.decode("utf-8")
     )
 
-    # 5. Vérifier la présence des colonnes cibles
-    missing = set(TARGET_COLS) - set(df.columns)
+
+def resolve_raw_columns(path: str) -> dict[str, str]:
+    """Retourne la correspondance {nom brut: nom normalisé} des colonnes cibles."""
+    raw = pd.read_csv(path, sep="|", nrows=0).columns
+    mapping = {
+        r: n
+        for r, n in zip(raw, normalize_columns(raw), strict=True)
+        if n in TARGET_COLS
+    }
+    missing = set(TARGET_COLS) - set(mapping.values())
     if missing:
         logger.error("Colonnes manquantes après normalisation : %s", missing)
         raise KeyError(f"Colonnes manquantes après normalisation : {missing}")
+    return mapping
+
+
+def drop_seen(chunk: pd.DataFrame, seen: set[int]) -> pd.DataFrame:
+    """
+    Supprime les lignes déjà rencontrées (dans ce bloc ou les précédents).
+    `seen`, l'ensemble des empreintes 64 bits des lignes conservées, est
+    complété sur place : coût proportionnel au bloc, pas au fichier.
+    """
+    hashes = pd.util.hash_pandas_object(chunk, index=False).tolist()
+    known = np.fromiter(map(seen.__contains__, hashes), dtype=bool, count=len(hashes))
+    keep = ~pd.Series(hashes).duplicated().to_numpy() & ~known
+    seen.update(compress(hashes, keep))
+    return chunk[keep]
+
+
+def iter_clean_chunks(path: str, chunksize: int = CHUNK_SIZE):
+    """Lit le fichier DVF par blocs et produit des blocs nettoyés et dédoublonnés."""
+    mapping = resolve_raw_columns(path)
+    dtypes = {raw: TARGET_DTYPES[norm] for raw, norm in mapping.items()}
+    seen: set[int] = set()
+
+    reader = pd.read_csv(
+        path, sep="|", usecols=list(mapping), dtype=dtypes, chunksize=chunksize
+    )
+    for chunk in reader:
+        chunk = chunk.rename(columns=mapping)[TARGET_COLS]
+        chunk["date_mutation"] = pd.to_datetime(
+            chunk["date_mutation"], dayfirst=True, errors="coerce"
+        )
+        chunk = drop_seen(chunk, seen)
+        yield chunk.dropna(subset=["date_mutation", "valeur_fonciere", "code_postal"])
+
 
-    # 6. Filtrer et nettoyer
-    logger.info("Filtrage et nettoyage des données DVF 2024")
-    df = df[TARGET_COLS]
-    df["date_mutation"] = pd.to_datetime(
-        df["date_mutation"], dayfirst=True, errors="coerce"
+def to_arrow(chunk: pd.DataFrame, year: int) -> pa.RecordBatch:
+    """Convertit un bloc nettoyé en batch Arrow typé selon PARQUET_SCHEMA."""
+    code_postal = normalize_code_postal(chunk["code_postal"])
+    typed = pd.DataFrame(
+        {
+            "date_mutation": chunk["date_mutation"],
+            "nature_mutation": chunk["nature_mutation"],
+            "valeur_fonciere": parse_valeur(chunk["valeur_fonciere"]),
+            "code_postal": code_postal,
+            "commune": chunk["commune"],
+            "type_local": chunk["type_local"],
+            "surface_reelle_bati": chunk["surface_reelle_bati"],
+            "nombre_pieces_principales": chunk["nombre_pieces_principales"].astype(
+                "Int16"
+            ),
+            "year": year,
+            "dept": dept_from_postal(code_postal),
+        }
     )
-    df = df.drop_duplicates()
-    df = df.dropna(subset=["date_mutation", "valeur_fonciere", "code_postal"])
+    return pa.RecordBatch.from_pandas(
+        typed, schema=PARQUET_SCHEMA, preserve_index=False
+    )
+
+
+def ingest_year(
+    year: int, formats: tuple[str, ...], chunksize: int = CHUNK_SIZE
+) -> tuple[int, int]:
+    """
+    Traite un millésime DVF en une seule passe (exécuté dans un processus fils).
+    Écrit le CSV historique et/ou les partitions year=<année>/dept=*.
+    """
+    path = raw_file(year)
+    logger.info("[%d] Lecture par blocs de %d lignes : %s", year, chunksize, path)
+    n_rows = 0
+    out = (
+        open(csv_file(year), "w", encoding="utf-8", newline="")
+        if "csv" in formats
+        else None
+    )
+
+    def batches():
+        nonlocal n_rows
+        for i, chunk in enumerate(iter_clean_chunks(path, chunksize)):
+            if out is not None:
+                chunk.to_csv(out, index=False, header=(i == 0))
+            n_rows += len(chunk)
+            logger.info("[%d] Bloc %d traité (%d lignes cumulées)", year, i + 1, n_rows)
+            yield to_arrow(chunk, year)
+
+    try:
+        if "parquet" in formats:
+            ds.write_dataset(
+                batches(),
+                DATASET_DIR,
+                schema=PARQUET_SCHEMA,
+                format="parquet",
+                partitioning=["year", "dept"],
+                partitioning_flavor="hive",
+                basename_template=f"part-{year}-{{i}}.parquet",
+                existing_data_behavior="delete_matching",
+                min_rows_per_group=8192,
+                max_rows_per_group=131072,
+            )
+        else:
+            for _ in batches():
+                pass
+    finally:
+        if out is not None:
+            out.close()
+    return year, n_rows
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Ingestion DVF multi-millésimes")
+    parser.add_argument("--years", nargs="+", type=int, default=YEARS)
+    parser.add_argument(
+        "--formats",
+        nargs="+",
+        choices=["csv", "parquet"],
+        default=["csv", "parquet"],
+        help="Sorties : CSV par année et/ou jeu Parquet partitionné year=/dept=",
+    )
+    parser.add_argument("--workers", type=int, default=None)
+    parser.add_argument("--chunksize", type=int, default=CHUNK_SIZE)
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
+    # 3. Millésimes disponibles
+    years = [y for y in args.years if os.path.exists(raw_file(y))]
+    for y in sorted(set(args.years) - set(years)):
+        logger.warning(
+            "Fichier brut absent pour %d : %s — année ignorée.", y, raw_file(y)
+        )
+    if not years:
+        raise FileNotFoundError(f"Aucun fichier DVF trouvé pour {args.years}")
+
+    # 4. Un processus par millésime : lecture, nettoyage, dédoublonnage, écriture
+    workers = args.workers or min(len(years), os.cpu_count() or 1)
+    logger.info("Ingestion DVF %s avec %d processus", years, workers)
+    formats = tuple(args.formats)
+    total = 0
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(ingest_year, y, formats, args.chunksize) for y in years]
+        for fut in as_completed(futures):
+            year, n_rows = fut.result()
+            total += n_rows
+            logger.info("[%d] Terminé : %d lignes", year, n_rows)
 
-    # 7. Export
-    logger.info("Écriture du CSV nettoyé : %s", OUTPUT_FILE)
-    df.to_csv(OUTPUT_FILE, index=False)
-    logger.info("✅ Ingestion DVF terminée avec %d lignes.", len(df))
+    if "parquet" in formats:
+        logger.info("Jeu Parquet partitionné écrit : %s", DATASET_DIR)
+    logger.info("✅ Ingestion DVF terminée avec %d lignes.", total)
 
 
 if __name__ == "__main__":
@@ -1,20 +1,34 @@
+import argparse
 import os
 
-import pandas as pd
 from dotenv import load_dotenv
 from sqlalchemy import (
+    BigInteger,
     Column,
     Date,
+    Float,
+    Index,
     Integer,
     MetaData,
     Numeric,
     String,
     Table,
     create_engine,
+    inspect,
 )
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.engine.url import URL
 
+from backend.dvf_prep import processed_files, read_processed_files
 from backend.logging_setup import setup_logging
+from backend.pg_copy import copy_chunks, swap_tables
+from backend.pg_partitions import (
+    PARTITION_CHOICES,
+    is_partitioned,
+    partition_periods,
+    rename_partitions,
+    with_partitions,
+)
 
 logger = setup_logging()
 
@@ -34,37 +48,279 @@ db_url = URL.create(
 engine = create_engine(db_url)
 metadata = MetaData()
 
-transactions = Table(
-    "transactions",
-    metadata,
-    Column("id", Integer, primary_key=True, autoincrement=True),
-    Column("date_mutation", Date, nullable=False),
-    Column("nature_mutation", String(50), nullable=True),
-    Column("valeur_fonciere", Numeric(12, 2), nullable=False),
-    Column("code_postal", String(10), nullable=False),
-    Column("commune", String(100), nullable=False),
-    Column("type_local", String(50), nullable=True),
-    Column("surface_reelle_bati", Numeric(10, 2), nullable=True),
-    Column("nombre_pieces_principales", Integer, nullable=True),
-)
+# CSV transactions : tous les millésimes transactions_<année>.csv présents
+CSV_DIR = os.path.join("data", "processed")
+CHUNK_SIZE = int(os.getenv("PG_CHUNK_SIZE", "100000"))
+# Table de chargement du mode replace, basculée ensuite sur 'transactions'
+STAGING_TABLE = "transactions_new"
 
 
-def main():
-    # 3. Créer la table si nécessaire
-    metadata.create_all(engine)
+def transactions_table(name: str, md: MetaData, partition: str = "none") -> Table:
+    """
+    Définition de la table des transactions (sans index secondaires). Avec
+    `partition` = year / month, la table est partitionnée par plage de
+    date_mutation : la clé primaire inclut alors la colonne de partition.
+    """
+    partitioned = partition != "none"
+    kwargs = {"postgresql_partition_by": "RANGE (date_mutation)"} if partitioned else {}
+    return Table(
+        name,
+        md,
+        Column("id", Integer, primary_key=True, autoincrement=True),
+        Column("date_mutation", Date, nullable=False, primary_key=partitioned),
+        Column("nature_mutation", String(50), nullable=True),
+        Column("valeur_fonciere", Numeric(12, 2), nullable=False),
+        Column("code_postal", String(10), nullable=False),
+        Column("commune", String(100), nullable=False),
+        Column("type_local", String(50), nullable=True),
+        Column("surface_reelle_bati", Numeric(10, 2), nullable=True),
+        Column("nombre_pieces_principales", Integer, nullable=True),
+        # Précalculés au chargement
+        Column("prix_m2", Float, nullable=True),
+        Column("dept", String(3), nullable=True),
+        # Empreinte de la clé naturelle : rend les rechargements idempotents
+        Column("fingerprint", BigInteger, nullable=False),
+        **kwargs,
+    )
+
+
+def conflict_columns(partition: str) -> list[str]:
+    """
+    Colonnes de l'index unique d'empreinte. Une table partitionnée exige que
+    tout index unique contienne la clé de partition ; la date faisant partie de
+    l'empreinte, (fingerprint, date_mutation) reste équivalent à fingerprint.
+    """
+    return ["fingerprint"] if partition == "none" else ["fingerprint", "date_mutation"]
+
+
+def transactions_indexes(table: Table, partition: str = "none") -> list[Index]:
+    """
+    Index de la table (propagés à chaque partition par Postgres). Partitionnée,
+    la date est indexée en BRIN : les lignes arrivent triées par date, un index
+    de quelques pages suffit à écarter les blocs hors plage.
+    """
+    date_index = (
+        Index(f"idx_{table.name}_date", table.c.date_mutation, postgresql_using="brin")
+        if partition != "none"
+        else Index(f"idx_{table.name}_date", table.c.date_mutation)
+    )
+    return [
+        Index(
+            f"uq_{table.name}_fingerprint",
+            *(table.c[c] for c in conflict_columns(partition)),
+            unique=True,
+        ),
+        date_index,
+        Index(f"idx_{table.name}_dept", table.c.dept),
+        Index(f"idx_{table.name}_type_local", table.c.type_local),
+    ]
+
+
+# Colonnes chargées (toutes sauf l'id auto-incrémenté)
+TX_COLUMNS = [
+    c.name for c in transactions_table("transactions", MetaData()).c if c.name != "id"
+]
+
+
+def insert_ignore_duplicates(partition: str):
+    """Méthode to_sql : INSERT ... ON CONFLICT (<empreinte>) DO NOTHING."""
+
+    def method(table, conn, keys, data_iter) -> int:
+        rows = [dict(zip(keys, row, strict=True)) for row in data_iter]
+        stmt = (
+            pg_insert(table.table)
+            .values(rows)
+            .on_conflict_do_nothing(index_elements=conflict_columns(partition))
+        )
+        return conn.execute(stmt).rowcount
+
+    return method
+
+
+def check_schema(partition: str) -> None:
+    """
+    Refuse de charger dans une table 'transactions' sans colonne fingerprint ou
+    dont le partitionnement (aucun, par année, par mois) diffère de celui
+    demandé : des partitions annuelles et mensuelles se chevaucheraient.
+    """
+    insp = inspect(engine)
+    if not insp.has_table("transactions"):
+        return
+    cols = {c["name"] for c in insp.get_columns("transactions")}
+    missing = set(TX_COLUMNS) - cols
+    if missing:
+        raise RuntimeError(
+            f"Table 'transactions' antérieure au schéma actuel (colonnes manquantes : "
+            f"{sorted(missing)}) : la supprimer ou la migrer avant de recharger."
+        )
+    with engine.connect() as conn:
+        partitioned = is_partitioned(conn, "transactions")
+        periods = partition_periods(conn, "transactions") if partitioned else set()
+    if partitioned != (partition != "none"):
+        raise RuntimeError(
+            f"Table 'transactions' {'déjà' if partitioned else 'non'} partitionnée "
+            f"(--partition {partition} demandé) : recharger avec --mode replace."
+        )
+    if periods - {partition}:
+        raise RuntimeError(
+            f"Table 'transactions' partitionnée par {', '.join(sorted(periods))} "
+            f"(--partition {partition} demandé) : recharger avec --mode replace."
+        )
+
+
+def copy_ready(chunks):
+    """Adapte les blocs au format attendu par COPY (entiers sans '.0')."""
+    for chunk in chunks:
+        chunk["nombre_pieces_principales"] = chunk["nombre_pieces_principales"].astype(
+            "Int64"
+        )
+        yield chunk
+
+
+def load_copy(chunks, mode: str, partition: str) -> tuple[int, int]:
+    """
+    COPY dans une table temporaire puis INSERT ... SELECT dans 'transactions'
+    (doublons ignorés en mode incrémental). Retourne (lues, insérées).
+    """
+    cols = ", ".join(TX_COLUMNS)
+    on_conflict = (
+        f"ON CONFLICT ({', '.join(conflict_columns(partition))}) DO NOTHING"
+        if mode == "incremental"
+        else ""
+    )
+    with engine.begin() as conn:
+        if partition != "none":
+            chunks = with_partitions(conn, "transactions", partition, chunks)
+        conn.exec_driver_sql(
+            "CREATE TEMP TABLE transactions_staging ON COMMIT DROP AS "
+            f"SELECT {cols} FROM transactions WITH NO DATA"
+        )
+        n_read = copy_chunks(conn, "transactions_staging", TX_COLUMNS, chunks)
+        result = conn.exec_driver_sql(
+            f"INSERT INTO transactions ({cols}) "
+            f"SELECT {cols} FROM transactions_staging {on_conflict}"
+        )
+    return n_read, result.rowcount
+
+
+def load_replace(chunks, partition: str) -> int:
+    """
+    Recharge complète : COPY dans une table neuve sans index, création des
+    index après le chargement, puis bascule atomique sur 'transactions'.
+    """
+    staging = transactions_table(STAGING_TABLE, MetaData(), partition)
+    with engine.begin() as conn:
+        staging.drop(conn, checkfirst=True)
+        staging.create(conn)
+        if partition != "none":
+            chunks = with_partitions(conn, STAGING_TABLE, partition, chunks)
+        n_read = copy_chunks(conn, STAGING_TABLE, TX_COLUMNS, chunks)
+
+        logger.info("Création des index sur '%s'", STAGING_TABLE)
+        indexes = transactions_indexes(staging, partition)
+        for idx in indexes:
+            idx.create(conn)
+        conn.exec_driver_sql(f"ANALYZE {STAGING_TABLE}")
+
+        swap_tables(conn, STAGING_TABLE, "transactions", [i.name for i in indexes])
+        rename_partitions(conn, STAGING_TABLE, "transactions")
+    return n_read
+
+
+def load_insert(chunks, mode: str, partition: str) -> tuple[int, int]:
+    """Chargement par INSERT paramétrés (to_sql), conservé pour comparaison."""
+    n_read = n_inserted = 0
+    method = insert_ignore_duplicates(partition) if mode == "incremental" else None
+    with engine.begin() as conn:
+        if partition != "none":
+            chunks = with_partitions(conn, "transactions", partition, chunks)
+        for chunk in chunks:
+            inserted = chunk[TX_COLUMNS].to_sql(
+                "transactions",
+                conn,
+                if_exists="append",
+                index=False,
+                chunksize=10_000,
+                method=method,
+            )
+            n_read += len(chunk)
+            n_inserted += len(chunk) if inserted is None else inserted
+    return n_read, n_inserted
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Chargement Postgres Homepedia")
+    parser.add_argument(
+        "--mode",
+        choices=["incremental", "strict", "replace"],
+        default="incremental",
+        help=(
+            "incremental : n'insère que les mutations absentes (ON CONFLICT DO "
+            "NOTHING) ; strict : échoue si une mutation est déjà chargée ; "
+            "replace : recharge complète dans une table neuve puis bascule"
+        ),
+    )
+    parser.add_argument(
+        "--method",
+        choices=["copy", "insert"],
+        default="copy",
+        help="copy : COPY FROM STDIN (par défaut) ; insert : INSERT via to_sql",
+    )
+    parser.add_argument(
+        "--partition",
+        choices=PARTITION_CHOICES,
+        default=os.getenv("PG_PARTITION", "none"),
+        help=(
+            "Partitionnement de 'transactions' par date_mutation : none, year ou "
+            "month (partitions créées à la demande, index BRIN sur la date). "
+            "Changer de schéma sur une table existante demande --mode replace."
+        ),
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
     safe_url = db_url.set(password="***")
-    logger.info("Table 'transactions' prête (DB: %s)", safe_url)
-
-    # 4. Lire le CSV
-    csv_path = os.path.join("data", "processed", "transactions_2024.csv")
-    logger.info("Lecture CSV: %s", csv_path)
-    df = pd.read_csv(csv_path, parse_dates=["date_mutation"])
-    logger.info("%d lignes prêtes à être chargées", len(df))
-
-    # 5. Charger avec to_sql (append + pas d'index)
-    logger.info("Insertion en base (append) dans la table 'transactions'")
-    df.to_sql("transactions", engine, if_exists="append", index=False)
-    logger.info("✅ Import terminé.")
+
+    # 3. Créer la table si nécessaire
+    if args.mode != "replace":
+        check_schema(args.partition)
+        table = transactions_table("transactions", metadata, args.partition)
+        transactions_indexes(table, args.partition)
+        metadata.create_all(engine)
+        logger.info(
+            "Table 'transactions' prête (partition %s, DB: %s)",
+            args.partition,
+            safe_url,
+        )
+
+    # 4. Lire les CSV par blocs (jamais entièrement en mémoire)
+    csv_paths = processed_files(CSV_DIR)
+    if not csv_paths:
+        raise FileNotFoundError(f"Aucun CSV transactions_<année>.csv dans {CSV_DIR}")
+    logger.info("Lecture CSV par blocs de %d lignes : %s", CHUNK_SIZE, csv_paths)
+    chunks = read_processed_files(csv_paths, CHUNK_SIZE)
+
+    # 5. Charger
+    logger.info(
+        "Chargement (mode %s, méthode %s) dans 'transactions' (DB: %s)",
+        args.mode,
+        args.method,
+        safe_url,
+    )
+    if args.mode == "replace":
+        n_read = n_inserted = load_replace(copy_ready(chunks), args.partition)
+    elif args.method == "copy":
+        n_read, n_inserted = load_copy(copy_ready(chunks), args.mode, args.partition)
+    else:
+        n_read, n_inserted = load_insert(chunks, args.mode, args.partition)
+
+    logger.info(
+        "✅ Import terminé : %d lignes insérées, %d déjà présentes ignorées.",
+        n_inserted,
+        n_read - n_inserted,
+    )
 
 
 if __name__ == "__main__":
@@ -1,29 +1,43 @@
 # File: src/backend/load_to_sqlite.py
 
+import argparse
 import os
+import sqlite3
 
 import pandas as pd
 from sqlalchemy import (
+    BigInteger,
     Column,
     Date,
+    Float,
+    Index,
     Integer,
     MetaData,
     Numeric,
     String,
     Table,
     create_engine,
+    inspect,
 )
 
+from backend.dvf_prep import processed_files, read_processed_files
 from backend.logging_setup import setup_logging
+from backend.setup_indexes import create_indexes
+from backend.sqlite_bulk import bulk_load
+from backend.stats_catalog import refresh_catalog
 
 logger = setup_logging()
 
 # 1. Définition des chemins
 DB_FILE = os.path.join("data", "homepedia.db")
-TX_CSV = os.path.join("data", "processed", "transactions_2024.csv")
+# CSV transactions : tous les millésimes transactions_<année>.csv présents
+TX_DIR = os.path.join("data", "processed")
 POP_CSV = os.path.join("data", "processed", "population_dept.csv")
 POV_CSV = os.path.join("data", "processed", "poverty_dept.csv")
 
+# Taille des blocs lus dans le CSV transactions et envoyés via executemany
+BULK_CHUNK_SIZE = int(os.getenv("SQLITE_BULK_CHUNK_SIZE", "100000"))
+
 # 2. Création de l'engine SQLite
 engine = create_engine(f"sqlite:///{DB_FILE}")
 metadata = MetaData()
@@ -35,12 +49,18 @@ transactions = Table(
     Column("id", Integer, primary_key=True, autoincrement=True),
     Column("date_mutation", Date, nullable=False),
     Column("nature_mutation", String, nullable=True),
-    Column("valeur_fonciere", Numeric(12, 2), nullable=False),
+    Column("valeur_fonciere", Float, nullable=False),
     Column("code_postal", String(10), nullable=False),
     Column("commune", String(100), nullable=False),
     Column("type_local", String(50), nullable=True),
     Column("surface_reelle_bati", Numeric(10, 2), nullable=True),
     Column("nombre_pieces_principales", Integer, nullable=True),
+    # Précalculés au chargement (indexés, cf. setup_indexes)
+    Column("prix_m2", Float, nullable=True),
+    Column("dept", String(3), nullable=True),
+    # Empreinte de la clé naturelle : rend les rechargements idempotents
+    Column("fingerprint", BigInteger, nullable=False),
+    Index("uq_transactions_fingerprint", "fingerprint", unique=True),
 )
 
 population = Table(
@@ -58,31 +78,71 @@ poverty = Table(
 )
 
 
-def main():
+def check_schema() -> None:
+    """
+    Refuse de charger dans une table 'transactions' antérieure aux colonnes
+    précalculées (prix_m2, dept, fingerprint) : elle n'est jamais supprimée
+    d'office, ses lignes seraient perdues.
+    """
+    insp = inspect(engine)
+    if not insp.has_table("transactions"):
+        return
+    cols = {c["name"] for c in insp.get_columns("transactions")}
+    missing = {c.name for c in transactions.columns} - cols
+    if missing:
+        raise RuntimeError(
+            f"Table 'transactions' antérieure au schéma actuel (colonnes manquantes : "
+            f"{sorted(missing)}) : la supprimer ou la migrer avant de recharger "
+            f"({DB_FILE})."
+        )
+
+
+def parse_args(argv=None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Chargement SQLite Homepedia")
+    parser.add_argument(
+        "--mode",
+        choices=["incremental", "strict"],
+        default="incremental",
+        help=(
+            "incremental : n'insère que les mutations absentes (INSERT OR IGNORE) ; "
+            "strict : échoue sans rien insérer si une mutation est déjà chargée"
+        ),
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv=None):
+    args = parse_args(argv)
+
     # 4. Création de la base et des tables
     os.makedirs(os.path.dirname(DB_FILE), exist_ok=True)
+    check_schema()
     metadata.create_all(engine)
     logger.info("Base SQLite prête et tables créées : %s", DB_FILE)
 
     # 5. Chargement des CSV
-    # Transactions
-    logger.info("Lecture et chargement du CSV transactions : %s", TX_CSV)
-    df_tx = pd.read_csv(
-        TX_CSV, parse_dates=["date_mutation"], dtype={"code_postal": str}
+    # Transactions : lecture par blocs de chaque millésime, normalisation
+    # (valeur_fonciere en REAL, code postal, prix_m2, dept) puis chargement massif
+    tx_csvs = processed_files(TX_DIR)
+    if not tx_csvs:
+        raise FileNotFoundError(f"Aucun CSV transactions_<année>.csv dans {TX_DIR}")
+    logger.info(
+        "Lecture et chargement des CSV transactions (mode %s) : %s", args.mode, tx_csvs
     )
-    # Conversion colonne valeur_fonciere si nécessaire
-    if df_tx["valeur_fonciere"].dtype == object:
-        logger.info(
-            "Conversion de 'valeur_fonciere' en float (nettoyage espaces et virgules)."
+    tx_columns = [c.name for c in transactions.columns if c.name != "id"]
+    with sqlite3.connect(DB_FILE) as conn:
+        n_read, n_inserted = bulk_load(
+            conn,
+            "transactions",
+            tx_columns,
+            read_processed_files(tx_csvs, BULK_CHUNK_SIZE),
+            ignore_duplicates=args.mode == "incremental",
         )
-        df_tx["valeur_fonciere"] = (
-            df_tx["valeur_fonciere"]
-            .str.replace(" ", "")
-            .str.replace(",", ".", regex=False)
-            .astype(float)
-        )
-    df_tx.to_sql("transactions", engine, if_exists="append", index=False)
-    logger.info("Table 'transactions' chargée avec %d lignes.", len(df_tx))
+    logger.info(
+        "Table 'transactions' : %d lignes insérées, %d déjà présentes ignorées.",
+        n_inserted,
+        n_read - n_inserted,
+    )
 
     # Population
     logger.info("Lecture et chargement du CSV population : %s", POP_CSV)
@@ -95,8 +155,14 @@ def main():
     logger.info("Lecture et chargement du CSV pauvreté : %s", POV_CSV)
     df_pov = pd.read_csv(POV_CSV, dtype={"code": str})
     df_pov["code"] = df_pov["code"].str.zfill(2)
-    df_pov.to_sql("poverty", engine, if_exists="append", index=False)
-    logger.info("Table 'poverty' chargée avec %d lignes.", len(df_pov))
+    df_pov.to_sql("poverty", engine, if_exists="replace", index=False)
+    logger.info("Table 'poverty' chargée (replace) avec %d lignes.", len(df_pov))
+
+    # 6. Index (dont prix_m2 et dept pour les filtres de l'application), puis
+    #    catalogue de statistiques lu par les filtres de l'application
+    with sqlite3.connect(DB_FILE) as conn:
+        create_indexes(conn)
+        refresh_catalog(conn)
 
     logger.info("✅ Chargement dans SQLite terminé.")
 
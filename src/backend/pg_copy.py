@@ -0,0 +1,70 @@
+# File: src/backend/pg_copy.py
+# Chargement Postgres par COPY FROM STDIN : chaque bloc pandas est sérialisé en
+# CSV dans un tampon mémoire et envoyé tel quel au serveur, sans INSERT
+# paramétrés ni matérialisation du fichier complet.
+
+import io
+import time
+from collections.abc import Iterable
+
+import pandas as pd
+from sqlalchemy.engine import Connection
+
+from backend.logging_setup import setup_logging
+
+logger = setup_logging()
+
+
+def copy_frame(conn: Connection, table: str, columns: list[str], df: pd.DataFrame):
+    """Envoie un DataFrame dans `table` via COPY (CSV ; champ vide = NULL)."""
+    buf = io.StringIO()
+    df[columns].to_csv(buf, index=False, header=False, date_format="%Y-%m-%d")
+    buf.seek(0)
+    cur = conn.connection.cursor()
+    try:
+        cur.copy_expert(
+            f"COPY {table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)", buf
+        )
+    finally:
+        cur.close()
+
+
+def copy_chunks(
+    conn: Connection, table: str, columns: list[str], chunks: Iterable[pd.DataFrame]
+) -> int:
+    """COPY de tous les blocs dans `table`, dans la transaction de `conn`."""
+    n_rows = 0
+    start = time.perf_counter()
+    for chunk in chunks:
+        copy_frame(conn, table, columns, chunk)
+        n_rows += len(chunk)
+        logger.info("%d lignes copiées dans '%s'", n_rows, table)
+    elapsed = time.perf_counter() - start
+    logger.info(
+        "COPY '%s' : %d lignes en %.1f s (%.0f lignes/s)",
+        table,
+        n_rows,
+        elapsed,
+        n_rows / elapsed if elapsed else float("nan"),
+    )
+    return n_rows
+
+
+def swap_tables(
+    conn: Connection, staging: str, target: str, index_names: list[str]
+) -> None:
+    """
+    Remplace `target` par `staging` (DDL transactionnelle : le basculement est
+    atomique pour les lecteurs) puis renomme index, séquence et clé primaire.
+    """
+    conn.exec_driver_sql(f"DROP TABLE IF EXISTS {target}")
+    conn.exec_driver_sql(f"ALTER TABLE {staging} RENAME TO {target}")
+    for name in index_names:
+        conn.exec_driver_sql(
+            f"ALTER INDEX {name} RENAME TO {name.replace(staging, target)}"
+        )
+    conn.exec_driver_sql(f"ALTER SEQUENCE {staging}_id_seq RENAME TO {target}_id_seq")
+    conn.exec_driver_sql(
+        f"ALTER TABLE {target} RENAME CONSTRAINT {staging}_pkey TO {target}_pkey"
+    )
+    logger.info("Table '%s' remplacée par '%s'", target, staging)
@@ -0,0 +1,130 @@
+# File: src/backend/pg_partitions.py
+# Partitionnement Postgres de la table des transactions par plage de
+# date_mutation (mois ou année). Les partitions sont créées à la demande au fil
+# du chargement : une nouvelle période ajoute une table sans toucher aux
+# partitions existantes (pas de partition DEFAULT, qu'il faudrait rescanner).
+
+import re
+from collections.abc import Iterable
+
+import pandas as pd
+from sqlalchemy.engine import Connection
+
+from backend.logging_setup import setup_logging
+
+logger = setup_logging()
+
+PARTITION_CHOICES = ["none", "year", "month"]
+
+# Borne d'une partition telle que rendue par pg_get_expr(relpartbound)
+BOUND_RE = re.compile(r"FROM \('(\d{4}-\d{2}-\d{2})'\) TO \('(\d{4}-\d{2}-\d{2})'\)")
+
+
+def period_starts(dates: pd.Series, period: str) -> list[pd.Timestamp]:
+    """Débuts de période (1er janvier ou 1er du mois) couverts par `dates`."""
+    freq = "Y" if period == "year" else "M"
+    periods = pd.to_datetime(dates).dropna().dt.to_period(freq).unique()
+    return sorted(p.start_time for p in periods)
+
+
+def partition_name(table: str, period: str, start: pd.Timestamp) -> str:
+    """transactions_y2024 (année) ou transactions_y2024m03 (mois)."""
+    if period == "year":
+        return f"{table}_y{start.year}"
+    return f"{table}_y{start.year}m{start.month:02d}"
+
+
+def partition_bounds(period: str, start: pd.Timestamp) -> tuple[str, str]:
+    """Bornes [début, fin) de la partition, au format SQL."""
+    end = start + (
+        pd.DateOffset(years=1) if period == "year" else pd.DateOffset(months=1)
+    )
+    return start.strftime("%Y-%m-%d"), end.strftime("%Y-%m-%d")
+
+
+def bound_period(bound: str) -> str:
+    """
+    Granularité (year / month) d'une partition d'après sa borne
+    "FOR VALUES FROM ('2024-01-01') TO ('2025-01-01')".
+    """
+    m = BOUND_RE.search(bound)
+    if not m:
+        raise ValueError(f"Borne de partition non reconnue : {bound}")
+    low, high = (pd.Timestamp(d) for d in m.groups())
+    months = (high.year - low.year) * 12 + high.month - low.month
+    if low.day != 1 or months not in (1, 12):
+        raise ValueError(f"Partition ni annuelle ni mensuelle : {bound}")
+    return "year" if months == 12 else "month"
+
+
+def ensure_partitions(
+    conn: Connection, table: str, period: str, dates: pd.Series, known: set[str]
+) -> None:
+    """
+    Crée les partitions manquantes de `table` pour les périodes de `dates`.
+    `known` mémorise les partitions déjà présentes ou créées.
+    """
+    for start in period_starts(dates, period):
+        name = partition_name(table, period, start)
+        if name in known:
+            continue
+        low, high = partition_bounds(period, start)
+        conn.exec_driver_sql(
+            f"CREATE TABLE IF NOT EXISTS {name} PARTITION OF {table} "
+            f"FOR VALUES FROM ('{low}') TO ('{high}')"
+        )
+        known.add(name)
+        logger.info("Partition '%s' créée [%s, %s)", name, low, high)
+
+
+def with_partitions(
+    conn: Connection, table: str, period: str, chunks: Iterable[pd.DataFrame]
+) -> Iterable[pd.DataFrame]:
+    """Crée au passage les partitions nécessaires à chaque bloc avant son envoi."""
+    known = set(list_partitions(conn, table))
+    for chunk in chunks:
+        ensure_partitions(conn, table, period, chunk["date_mutation"], known)
+        yield chunk
+
+
+def list_partitions(conn: Connection, table: str) -> list[str]:
+    """Partitions rattachées à `table` (vide si la table n'est pas partitionnée)."""
+    rows = conn.exec_driver_sql(
+        "SELECT c.relname FROM pg_inherits i "
+        "JOIN pg_class c ON c.oid = i.inhrelid "
+        "JOIN pg_class p ON p.oid = i.inhparent "
+        "WHERE p.relname = %(table)s ORDER BY c.relname",
+        {"table": table},
+    )
+    return [r[0] for r in rows]
+
+
+def partition_periods(conn: Connection, table: str) -> set[str]:
+    """Granularités (year / month) des partitions existantes de `table`."""
+    rows = conn.exec_driver_sql(
+        "SELECT pg_get_expr(c.relpartbound, c.oid) FROM pg_inherits i "
+        "JOIN pg_class c ON c.oid = i.inhrelid "
+        "JOIN pg_class p ON p.oid = i.inhparent "
+        "WHERE p.relname = %(table)s",
+        {"table": table},
+    )
+    return {bound_period(r[0]) for r in rows}
+
+
+def is_partitioned(conn: Connection, table: str) -> bool:
+    return (
+        conn.exec_driver_sql(
+            "SELECT 1 FROM pg_partitioned_table pt "
+            "JOIN pg_class c ON c.oid = pt.partrelid WHERE c.relname = %(table)s",
+            {"table": table},
+        ).first()
+        is not None
+    )
+
+
+def rename_partitions(conn: Connection, old_table: str, new_table: str) -> None:
+    """Après bascule, renomme '<old_table>_y…' en '<new_table>_y…'."""
+    for name in list_partitions(conn, new_table):
+        if name.startswith(f"{old_table}_"):
+            new_name = new_table + name[len(old_table) :]
+            conn.exec_driver_sql(f"ALTER TABLE {name} RENAME TO {new_name}")
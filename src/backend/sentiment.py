@@ -0,0 +1,86 @@
+# File: src/backend/sentiment.py
+# Scores de sentiment calculés une fois, à l'ingestion des avis : les textes
+# sont découpés en lots répartis sur un pool de processus. Chaque texte est
+# identifié par une empreinte, ce qui permet de reprendre les scores déjà
+# connus et de ne calculer que les nouveaux avis.
+
+import hashlib
+import os
+from collections.abc import Callable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+
+SENTIMENT_WORKERS = int(os.getenv("HOMEPEDIA_SENTIMENT_WORKERS", os.cpu_count() or 1))
+SENTIMENT_BATCH = int(os.getenv("HOMEPEDIA_SENTIMENT_BATCH", "2000"))
+# "textblob" (par défaut) ou "lexicon" (src/backend/sentiment_lexicon.py)
+SENTIMENT_ENGINE = os.getenv("HOMEPEDIA_SENTIMENT_ENGINE", "textblob")
+
+
+def text_hash(text: str) -> str:
+    """Empreinte courte (blake2b 64 bits) d'un avis."""
+    return hashlib.blake2b(text.encode("utf-8"), digest_size=8).hexdigest()
+
+
+def textblob_scores(texts: Sequence[str]) -> list[float]:
+    """Polarité TextBlob (-1 à 1) de chaque texte."""
+    from textblob import TextBlob
+
+    return [TextBlob(t).sentiment.polarity for t in texts]
+
+
+def lexicon_scores(texts: Sequence[str]) -> list[float]:
+    """Polarité par produit creux avec le lexique (moteur vectorisé)."""
+    from backend.sentiment_lexicon import default_engine
+
+    return default_engine().score(texts).tolist()
+
+
+ENGINES: dict[str, Callable[[Sequence[str]], list[float]]] = {
+    "textblob": textblob_scores,
+    "lexicon": lexicon_scores,
+}
+
+
+class BatchScorer:
+    """
+    Calcule les scores par lots de `batch` textes sur `workers` processus
+    (calcul dans le processus courant si workers <= 1). À utiliser comme
+    gestionnaire de contexte : le pool sert à toute l'ingestion.
+    """
+
+    def __init__(
+        self,
+        engine: str | Callable[[Sequence[str]], list[float]] = SENTIMENT_ENGINE,
+        workers: int = SENTIMENT_WORKERS,
+        batch: int = SENTIMENT_BATCH,
+    ):
+        if isinstance(engine, str):
+            if engine not in ENGINES:
+                raise ValueError(
+                    f"Moteur de sentiment inconnu : {engine!r} "
+                    f"(choix : {sorted(ENGINES)})"
+                )
+            self.name, engine = engine, ENGINES[engine]
+        else:
+            self.name = engine.__name__
+        self.engine = engine
+        self.workers = workers
+        self.batch = batch
+        self._pool: Executor | None = None
+
+    def __enter__(self) -> "BatchScorer":
+        if self.workers > 1:
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        if self._pool is not None:
+            self._pool.shutdown(cancel_futures=True)
+            self._pool = None
+
+    def score(self, texts: Sequence[str]) -> list[float]:
+        batches = [texts[i : i + self.batch] for i in range(0, len(texts), self.batch)]
+        if self._pool is None or len(batches) <= 1:
+            results = map(self.engine, batches)
+        else:
+            results = self._pool.map(self.engine, batches)
+        return [score for part in results for score in part]
@@ -0,0 +1,140 @@
+# File: src/backend/sentiment_lexicon.py
+# Moteur de sentiment vectorisé : un lot d'avis est découpé en jetons (pandas,
+# sans boucle par avis) puis projeté sur une matrice creuse documents ×
+# variables. Les variables sont les mots du lexique de polarité, plus les
+# bigrammes « négation + mot » et « intensifieur + mot » ; le score de tous les
+# avis est obtenu par deux produits matrice-vecteur.
+#
+# Règles reprises de TextBlob (PatternAnalyzer) : moyenne des polarités des
+# mots reconnus, négation = polarité × -0,5, intensifieur = polarité × son
+# intensité. Les bigrammes portent la correction à appliquer au mot seul, ce
+# qui garde le calcul linéaire.
+
+import csv
+import functools
+import os
+import xml.etree.ElementTree as ET
+from collections import defaultdict
+from collections.abc import Sequence
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+from scipy import sparse
+
+from backend.comment_tokens import TOKEN_PATTERN
+
+# Lexique CSV (word,polarity[,intensity]) ; à défaut, celui livré avec TextBlob
+LEXICON_PATH = os.getenv("HOMEPEDIA_SENTIMENT_LEXICON")
+NEGATIONS = ["no", "not", "never", "n't"]
+NEGATION_FACTOR = -0.5
+
+
+def _mean(values: dict[str, list[float]]) -> dict[str, float]:
+    return {k: float(np.mean(v)) for k, v in values.items()}
+
+
+def textblob_lexicon() -> tuple[dict[str, float], dict[str, float]]:
+    """Polarités et intensifieurs du lexique en-sentiment.xml de TextBlob."""
+    import textblob
+
+    path = Path(textblob.__file__).parent / "en" / "en-sentiment.xml"
+    polarity, intensity = defaultdict(list), defaultdict(list)
+    for word in ET.parse(path).getroot().iter("word"):
+        form = word.get("form", "").lower()
+        polarity[form].append(float(word.get("polarity", 0)))
+        if word.get("pos", "").startswith("RB"):
+            intensity[form].append(float(word.get("intensity", 1)))
+    modifiers = {k: v for k, v in _mean(intensity).items() if v != 1.0}
+    return _mean(polarity), modifiers
+
+
+def csv_lexicon(path: str) -> tuple[dict[str, float], dict[str, float]]:
+    """Lexique CSV : colonnes word, polarity et, facultative, intensity."""
+    polarity, modifiers = {}, {}
+    with open(path, encoding="utf-8", newline="") as f:
+        for row in csv.DictReader(f):
+            word = row["word"].lower()
+            polarity[word] = float(row["polarity"])
+            if float(row.get("intensity") or 1) != 1.0:
+                modifiers[word] = float(row["intensity"])
+    return polarity, modifiers
+
+
+class LexiconSentiment:
+    """Scores de polarité (-1 à 1) par produit creux avec le lexique."""
+
+    def __init__(
+        self,
+        polarity: dict[str, float],
+        modifiers: dict[str, float] | None = None,
+        negations: Sequence[str] = NEGATIONS,
+    ):
+        self.words = pd.Index(sorted(polarity))
+        self.modifiers = pd.Index(sorted(modifiers or {}))
+        self.negations = list(negations)
+        p = np.array([polarity[w] for w in self.words], dtype=np.float64)
+        intensity = np.array([modifiers[m] for m in self.modifiers], dtype=np.float64)
+        n_words = len(self.words)
+        # Variables : mots | négation + mot | intensifieur m + mot
+        self.weights = np.concatenate(
+            [p, (NEGATION_FACTOR - 1) * p, np.outer(intensity - 1, p).ravel()]
+        )
+        # Seuls les mots comptent dans la moyenne (les bigrammes corrigent)
+        self.counts = np.zeros_like(self.weights)
+        self.counts[:n_words] = 1.0
+
+    def matrix(self, texts: Sequence[str]) -> sparse.csr_matrix:
+        """Matrice creuse documents × variables (nombre d'occurrences)."""
+        tokens = (
+            pd.Series(list(texts), dtype=object)
+            .str.lower()
+            .str.findall(TOKEN_PATTERN)
+            .explode()
+        )
+        doc = tokens.index.to_numpy()
+        # Propriétés calculées une fois par jeton distinct, puis diffusées
+        codes, uniques = pd.factorize(tokens.to_numpy(dtype=object))
+        uniques = pd.Index(uniques, dtype=object)
+        is_word = np.append(self.words.get_indexer(uniques), -1)
+        is_negation = np.append(
+            uniques.isin(self.negations) | uniques.str.endswith("n't"), False
+        )
+        is_modifier = np.append(self.modifiers.get_indexer(uniques), -1)
+        word = is_word[codes]  # code -1 (avis sans jeton) → dernière case
+        same_doc = np.roll(doc, 1) == doc
+        if len(doc):
+            same_doc[0] = False
+        negated = same_doc & np.roll(is_negation[codes], 1)
+        modifier = np.where(same_doc & ~negated, np.roll(is_modifier[codes], 1), -1)
+
+        n_words = len(self.words)
+        hit = word >= 0
+        neg = hit & negated
+        mod = hit & (modifier >= 0)
+        rows = np.concatenate([doc[hit], doc[neg], doc[mod]])
+        cols = np.concatenate(
+            [
+                word[hit],
+                n_words + word[neg],
+                2 * n_words + modifier[mod] * n_words + word[mod],
+            ]
+        )
+        return sparse.csr_matrix(
+            (np.ones(len(rows), dtype=np.float64), (rows, cols)),
+            shape=(len(texts), len(self.weights)),
+        )
+
+    def score(self, texts: Sequence[str]) -> np.ndarray:
+        x = self.matrix(texts)
+        total, n = x @ self.weights, x @ self.counts
+        out = np.divide(total, n, out=np.zeros(len(texts)), where=n > 0)
+        return np.clip(out, -1.0, 1.0)
+
+
+@functools.lru_cache(maxsize=1)
+def default_engine() -> LexiconSentiment:
+    """Moteur du processus (lexique CSV configuré, sinon celui de TextBlob)."""
+    if LEXICON_PATH:
+        return LexiconSentiment(*csv_lexicon(LEXICON_PATH))
+    return LexiconSentiment(*textblob_lexicon())
@@ -5,9 +5,9 @@ import sqlite3
 import matplotlib.pyplot as plt
 import pandas as pd
 import streamlit as st
-from textblob import TextBlob
 from wordcloud import WordCloud
 
+from backend.comment_store import CommentStore
 from backend.logging_setup import setup_logging
 
 logger = setup_logging()
@@ -58,16 +58,12 @@ try:
         st.subheader("Aperçu des commentaires")
         st.dataframe(df_comments.head(10))
 
-        # 4. Sentiment analysis
-        def sentiment_score(text):
-            return TextBlob(text).sentiment.polarity
-
-        logger.info("Calcul des scores de sentiment")
-        df_comments["sentiment"] = (
-            df_comments["commentaire"].astype(str).apply(sentiment_score)
-        )
+        # 4. Sentiment : scores précalculés à l'ingestion (magasin de commentaires)
+        logger.info("Lecture des scores de sentiment précalculés")
+        store = CommentStore(readonly=True)
         st.subheader("Sentiment des commentaires")
-        st.write(df_comments[["commentaire", "sentiment"]].head(10))
+        st.write(store.page(0, 10)[["commentaire", "sentiment"]])
+        store.close()
 
         # 5. Word Cloud
         logger.info("Génération du Word Cloud")
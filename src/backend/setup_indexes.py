@@ -26,6 +26,23 @@ def safe_index(cur, table: str, column: str, suffix: str):
         )
 
 
+def drop_indexes(conn: sqlite3.Connection, table: str) -> list[str]:
+    """Supprime les index 'idx_*' d'une table (avant un chargement massif)."""
+    names = [
+        row[0]
+        for row in conn.execute(
+            "SELECT name FROM sqlite_master "
+            "WHERE type = 'index' AND tbl_name = ? AND name LIKE 'idx%'",
+            (table,),
+        )
+    ]
+    for name in names:
+        conn.execute(f"DROP INDEX IF EXISTS {name}")
+    conn.commit()
+    logger.info("Index supprimés sur '%s' : %s", table, names)
+    return names
+
+
 def create_indexes(conn: sqlite3.Connection) -> None:
     """Crée tous les index nécessaires sur la base SQLite."""
     logger.info("Création des index dans la base SQLite.")
@@ -34,6 +51,9 @@ def create_indexes(conn: sqlite3.Connection) -> None:
     # ---- DVF transactions ----
     safe_index(c, "transactions", "date_mutation", "date")
     safe_index(c, "transactions", "commune", "commune")
+    # colonnes précalculées au chargement : filtres prix/m² et département
+    safe_index(c, "transactions", "prix_m2", "prix_m2")
+    safe_index(c, "transactions", "dept", "dept")
 
     # composite : date_mutation + type_local + valeur_fonciere
     logger.info(
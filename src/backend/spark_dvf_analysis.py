@@ -2,8 +2,7 @@ import os
 import sqlite3
 
 from pyspark.sql import SparkSession
-from pyspark.sql.functions import avg, col, count, regexp_replace, substring
-from pyspark.sql.types import DoubleType
+from pyspark.sql.functions import avg, col, count
 
 from backend.logging_setup import setup_logging
 
@@ -14,28 +13,26 @@ logger.info("Initialisation de la session Spark pour 'DVF Spark Analysis'")
 spark = SparkSession.builder.appName("DVF Spark Analysis").getOrCreate()
 
 # 2. Chemins
-CSV_PATH = os.path.join("data", "processed", "transactions_2024.csv")
+DATASET_DIR = os.path.join("data", "processed", "transactions")
 DB_PATH = os.path.join("data", "homepedia.db")
-logger.info("Chemins utilisés - CSV: %s | DB: %s", CSV_PATH, DB_PATH)
-
-# 3. Lire le CSV dans un DataFrame Spark
-logger.info("Lecture du CSV dans Spark DataFrame")
-df = spark.read.csv(CSV_PATH, header=True, sep=",", inferSchema=False)
-
-# 4. Nettoyer et caster
-logger.info(
-    "Nettoyage et typage des colonnes (valeur_fonciere, surface_reelle_bati, prix_m2, dept)"
-)
-df = df.withColumn(
-    "valeur_fonciere_num",
-    regexp_replace(regexp_replace(col("valeur_fonciere"), " ", ""), ",", ".").cast(
-        DoubleType()
-    ),
-)
-df = df.withColumn("surf_bati_num", col("surface_reelle_bati").cast(DoubleType()))
-df = df.filter(col("surf_bati_num") > 0)
-df = df.withColumn("prix_m2", col("valeur_fonciere_num") / col("surf_bati_num"))
-df = df.withColumn("dept", substring(col("code_postal"), 1, 2))
+# Millésimes à analyser (ex. "2023,2024") ; vide = tous les millésimes présents
+YEARS = [int(y) for y in os.getenv("DVF_YEARS", "").split(",") if y.strip()]
+logger.info("Chemins utilisés - Parquet: %s | DB: %s", DATASET_DIR, DB_PATH)
+
+# 3. Lire le jeu Parquet partitionné (year=/dept=) : colonnes déjà typées
+logger.info("Lecture du jeu Parquet partitionné dans Spark DataFrame")
+# Pas d'inférence de type sur les partitions : "01" doit rester "01", pas 1
+spark.conf.set("spark.sql.sources.partitionColumnTypeInference.enabled", "false")
+df = spark.read.parquet(DATASET_DIR)
+if YEARS:
+    # Filtre sur la colonne de partition : Spark ne lit que les répertoires year=
+    logger.info("Restriction aux millésimes %s", YEARS)
+    df = df.filter(col("year").isin([str(y) for y in YEARS]))
+
+# 4. Calcul du prix au m²
+logger.info("Calcul du prix au m² (surface_reelle_bati > 0)")
+df = df.filter(col("surface_reelle_bati") > 0)
+df = df.withColumn("prix_m2", col("valeur_fonciere") / col("surface_reelle_bati"))
 
 # 5. Agrégations
 logger.info("Calcul des agrégats par département (nb_transactions, prix_m2_moyen)")
@@ -0,0 +1,137 @@
+# File: src/backend/sqlite_bulk.py
+# Chargement massif dans SQLite : PRAGMA de chargement, executemany par blocs
+# dans de grosses transactions, index supprimés pendant l'insertion puis
+# reconstruits en une passe.
+
+import sqlite3
+import time
+from collections.abc import Iterable
+from contextlib import contextmanager
+
+import pandas as pd
+
+from backend.logging_setup import setup_logging
+from backend.setup_indexes import create_indexes, drop_indexes
+
+logger = setup_logging()
+
+# PRAGMA appliqués le temps du chargement uniquement
+LOAD_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "OFF",
+    "cache_size": -512_000,  # en KiB (~500 Mo)
+    "temp_store": "MEMORY",
+}
+# PRAGMA restaurés à la fin (valeurs par défaut de SQLite)
+RESTORE_PRAGMAS = {
+    "journal_mode": "DELETE",
+    "synchronous": "FULL",
+    "cache_size": -2000,
+    "temp_store": "DEFAULT",
+}
+
+# Nombre de lignes par transaction (COMMIT) en mode incrémental
+ROWS_PER_TRANSACTION = 500_000
+
+
+@contextmanager
+def load_pragmas(conn: sqlite3.Connection):
+    """
+    Active les PRAGMA de chargement puis restaure les valeurs par défaut. En
+    cas d'erreur, la transaction en cours est annulée (jamais validée).
+    """
+    for name, value in LOAD_PRAGMAS.items():
+        conn.execute(f"PRAGMA {name}={value}")
+    logger.info("PRAGMA de chargement actifs : %s", LOAD_PRAGMAS)
+    try:
+        yield conn
+    except BaseException:
+        conn.rollback()
+        raise
+    else:
+        conn.commit()
+    finally:
+        for name, value in RESTORE_PRAGMAS.items():
+            conn.execute(f"PRAGMA {name}={value}")
+
+
+def to_rows(df: pd.DataFrame) -> Iterable[tuple]:
+    """Lignes prêtes pour executemany : NaN/NA → NULL, dates au format de to_sql."""
+    df = df.copy()
+    for col in df.select_dtypes(include="datetime").columns:
+        df[col] = df[col].dt.strftime("%Y-%m-%d %H:%M:%S.%f")
+    df = df.astype(object).where(df.notna(), None)
+    return df.itertuples(index=False, name=None)
+
+
+def insert_chunks(
+    conn: sqlite3.Connection,
+    table: str,
+    columns: list[str],
+    chunks: Iterable[pd.DataFrame],
+    ignore_duplicates: bool = False,
+) -> tuple[int, int]:
+    """
+    Insère les blocs via executemany. Avec `ignore_duplicates`, les lignes
+    violant un index UNIQUE sont ignorées (INSERT OR IGNORE) et un COMMIT est
+    fait toutes les ROWS_PER_TRANSACTION lignes : un rechargement reprend là
+    où il s'est arrêté. Sinon (mode strict), tout le chargement tient en une
+    transaction, annulée entièrement au premier doublon. Retourne (lignes
+    lues, lignes insérées).
+    """
+    verb = "INSERT OR IGNORE" if ignore_duplicates else "INSERT"
+    sql = (
+        f"{verb} INTO {table} ({', '.join(columns)}) "
+        f"VALUES ({', '.join('?' * len(columns))})"
+    )
+    n_read = 0
+    changes_before = conn.total_changes
+    pending = 0
+    conn.execute("BEGIN")
+    for chunk in chunks:
+        conn.executemany(sql, to_rows(chunk[columns]))
+        n_read += len(chunk)
+        pending += len(chunk)
+        if ignore_duplicates and pending >= ROWS_PER_TRANSACTION:
+            conn.execute("COMMIT")
+            conn.execute("BEGIN")
+            pending = 0
+        logger.info("%d lignes envoyées dans '%s'", n_read, table)
+    conn.execute("COMMIT")
+    return n_read, conn.total_changes - changes_before
+
+
+def bulk_load(
+    conn: sqlite3.Connection,
+    table: str,
+    columns: list[str],
+    chunks: Iterable[pd.DataFrame],
+    ignore_duplicates: bool = False,
+) -> tuple[int, int]:
+    """
+    Chargement massif : suppression des index 'idx_*' de `table` (les index
+    UNIQUE sont conservés), insertion sous PRAGMA de chargement, reconstruction
+    des index, y compris si l'insertion échoue. Retourne (lues, insérées).
+    """
+    drop_indexes(conn, table)
+
+    start = time.perf_counter()
+    try:
+        with load_pragmas(conn):
+            n_read, n_inserted = insert_chunks(
+                conn, table, columns, chunks, ignore_duplicates
+            )
+        elapsed = time.perf_counter() - start
+        logger.info(
+            "'%s' : %d lignes insérées, %d ignorées en %.1f s (%.0f lignes/s)",
+            table,
+            n_inserted,
+            n_read - n_inserted,
+            elapsed,
+            n_read / elapsed if elapsed else float("nan"),
+        )
+    finally:
+        start = time.perf_counter()
+        create_indexes(conn)
+        logger.info("Index reconstruits en %.1f s", time.perf_counter() - start)
+    return n_read, n_inserted
@@ -0,0 +1,104 @@
+# File: src/backend/stats_catalog.py
+# Catalogue de statistiques de 'transactions' (bornes de dates, valeurs
+# distinctes, min/max et percentiles de prix, effectifs par département),
+# recalculé à chaque chargement. L'application y lit les bornes de ses filtres
+# en une requête sur une petite table, sans parcourir les transactions.
+
+import json
+import sqlite3
+from datetime import UTC, datetime
+from pathlib import Path
+
+from backend.logging_setup import setup_logging
+
+logger = setup_logging()
+
+CATALOG_TABLE = "stats_catalog"
+CATEGORICAL_COLS = ["type_local", "nature_mutation"]
+PRICE_PERCENTILES = [0.01, 0.05, 0.25, 0.5, 0.75, 0.95, 0.99]
+
+
+def _percentiles(conn: sqlite3.Connection, col: str) -> dict[str, float]:
+    """Percentiles (rang le plus proche), un saut d'index par valeur."""
+    (n,) = conn.execute(f"SELECT COUNT({col}) FROM transactions").fetchone()
+    out = {}
+    for p in PRICE_PERCENTILES:
+        if n:
+            (value,) = conn.execute(
+                f"SELECT {col} FROM transactions WHERE {col} IS NOT NULL "
+                f"ORDER BY {col} LIMIT 1 OFFSET ?",
+                (round(p * (n - 1)),),
+            ).fetchone()
+        else:
+            value = None
+        out[f"p{round(p * 100):02d}"] = value
+    return out
+
+
+def compute_catalog(conn: sqlite3.Connection) -> dict:
+    """Statistiques de 'transactions' (requêtes servies par les index)."""
+    date_min, date_max, n_rows = conn.execute(
+        "SELECT MIN(date_mutation), MAX(date_mutation), COUNT(*) FROM transactions"
+    ).fetchone()
+    prix_min, prix_max = conn.execute(
+        "SELECT MIN(prix_m2), MAX(prix_m2) FROM transactions"
+    ).fetchone()
+    catalog = {
+        "rows": n_rows,
+        "date_min": date_min[:10] if date_min else None,
+        "date_max": date_max[:10] if date_max else None,
+        "prix_m2_min": prix_min,
+        "prix_m2_max": prix_max,
+        "prix_m2_percentiles": _percentiles(conn, "prix_m2"),
+        "rows_by_dept": dict(
+            conn.execute(
+                "SELECT dept, COUNT(*) FROM transactions "
+                "WHERE dept IS NOT NULL GROUP BY dept ORDER BY dept"
+            ).fetchall()
+        ),
+        "refreshed_at": datetime.now(UTC).isoformat(timespec="seconds"),
+    }
+    for col in CATEGORICAL_COLS:
+        catalog[f"distinct_{col}"] = [
+            r[0]
+            for r in conn.execute(
+                f"SELECT DISTINCT {col} FROM transactions "
+                f"WHERE {col} IS NOT NULL ORDER BY 1"
+            )
+        ]
+    return catalog
+
+
+def refresh_catalog(conn: sqlite3.Connection) -> dict:
+    """Recalcule le catalogue et remplace la table (clé → valeur JSON)."""
+    catalog = compute_catalog(conn)
+    with conn:
+        conn.execute(
+            f"CREATE TABLE IF NOT EXISTS {CATALOG_TABLE} "
+            "(key TEXT PRIMARY KEY, value TEXT NOT NULL)"
+        )
+        conn.execute(f"DELETE FROM {CATALOG_TABLE}")
+        conn.executemany(
+            f"INSERT INTO {CATALOG_TABLE} (key, value) VALUES (?, ?)",
+            [(k, json.dumps(v, ensure_ascii=False)) for k, v in catalog.items()],
+        )
+    logger.info(
+        "Catalogue '%s' rafraîchi : %d transactions, %s → %s",
+        CATALOG_TABLE,
+        catalog["rows"],
+        catalog["date_min"],
+        catalog["date_max"],
+    )
+    return catalog
+
+
+def parse_catalog(rows) -> dict:
+    """Lignes (key, value) de la table → dictionnaire."""
+    return {key: json.loads(value) for key, value in rows}
+
+
+if __name__ == "__main__":
+    db = Path(__file__).resolve().parents[2] / "data" / "homepedia.db"
+    logger.info("Connexion à la base SQLite : %s", db)
+    with sqlite3.connect(db) as conn:
+        refresh_catalog(conn)
@@ -0,0 +1,31 @@
+import numpy as np
+import pandas as pd
+
+from backend.comment_dedup import NearDuplicates, signatures
+
+BASE = "Great location and friendly staff the room was clean and quiet at night"
+
+
+def test_near_duplicates_cluster_across_chunks():
+    texts = pd.Series(
+        [
+            BASE,
+            "Breakfast was cold and the shower leaked every morning",
+            BASE.upper() + "!",  # même texte, casse et ponctuation près
+            "Cher",
+            BASE + " thanks",  # un bigramme de plus : Jaccard 13/14
+            "Cher",
+            "Great location and friendly staff but the room was small and noisy",
+        ]
+    )
+    dedup = NearDuplicates()
+    dedup.add(texts.iloc[:3])
+    dedup.add(texts.iloc[3:])
+    assert dedup.clusters().tolist() == [0, 1, 0, 3, 0, 3, 6]
+
+
+def test_signatures_are_deterministic():
+    texts = pd.Series(["Staff was friendly", "", "Staff was friendly"])
+    sig = signatures(texts)
+    assert sig.shape == (3, 64) and sig.dtype == np.uint32
+    assert (sig[0] == sig[2]).all() and (sig[0] != sig[1]).any()
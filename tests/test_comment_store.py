@@ -0,0 +1,68 @@
+from backend.comment_store import CommentStore
+
+
+def test_keyset_pages_and_sample(tmp_path):
+    path = str(tmp_path / "comments.db")
+    writer = CommentStore(path)
+    assert writer.insert_many((f"avis {i}" for i in range(1, 101)), batch=30) == 100
+    writer.conn.execute("DELETE FROM comments WHERE id % 10 = 0")  # trous
+    writer.conn.commit()
+    writer.close()
+
+    store = CommentStore(path, readonly=True)
+    assert store.count() == 90
+
+    page = store.page(1, 25)
+    assert page["id"].tolist() == [i for i in range(1, 28) if i % 10][:25]
+    nxt = store.page(int(page["id"].iloc[-1]) + 1, 25)
+    assert nxt["id"].iloc[0] == 28
+    prev = store.page_before(int(nxt["id"].iloc[0]), 25)
+    assert prev["id"].tolist() == page["id"].tolist()
+
+    # 90 avis = 3 pages pleines de 30 : pas de 4e page vide annoncée
+    start, pages = 0, []
+    while True:
+        df, has_next = store.page_with_next(start, 30)
+        pages.append(len(df))
+        if not has_next:
+            break
+        start = int(df["id"].iloc[-1]) + 1
+    assert pages == [30, 30, 30]
+    df, has_next = store.page_with_next(start, 45)
+    assert len(df) == 30 and not has_next
+
+    sample = store.sample(60, seed=1)
+    assert len(sample) == 60 and sample["id"].is_unique
+    assert (sample["id"] % 10 != 0).all()
+    assert len(store.sample(500)) == 90
+
+
+def test_full_text_search(tmp_path):
+    path = str(tmp_path / "comments.db")
+    writer = CommentStore(path)
+    writer.insert_many(
+        [
+            "Great breakfast and friendly staff",
+            "Breakfast was cold, breakfast room noisy",
+            "Room <small> but clean",
+            "Nothing to say",
+        ]
+    )
+    writer.compact()
+    writer.close()
+
+    store = CommentStore(path, readonly=True)
+    assert store.has_search()
+    assert store.search_count("breakfast") == 2
+    assert store.search_count("breakfast staff") == 1
+    assert store.search_count("break*") == 2
+    assert store.search_count('"unbalanced AND (') == 0
+
+    hits = store.search("breakfast")
+    assert hits["id"].tolist() == [2, 1]  # deux occurrences : mieux classé
+    assert "\x02Breakfast\x03" in hits["extrait"].iloc[0]
+    assert store.search("breakfast", limit=1, offset=1)["id"].tolist() == [1]
+    assert store.search("").empty
+    # magasin sans groupes de doublons : tout avis est conservé
+    assert store.search_count("breakfast", unique=True) == 2
+    assert len(store.page(0, 10, unique=True)) == store.count(unique=True) == 4
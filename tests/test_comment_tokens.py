@@ -0,0 +1,29 @@
+import pandas as pd
+
+from backend.comment_store import CommentStore
+from backend.comment_tokens import count_terms, sentiment_bucket
+
+
+def test_counts_accumulate_per_bucket(tmp_path):
+    texts = pd.Series(
+        ["Great breakfast, great staff", "Breakfast was cold coffee", "No Negative"],
+        index=[10, 11, 12],
+    )
+    buckets = sentiment_bucket(pd.Series([0.8, -0.6, 0.0], index=texts.index))
+    assert buckets.tolist() == ["pos", "neg", "neu"]
+
+    counts = count_terms(texts, buckets).set_index(["term", "ngram", "bucket"])["n"]
+    assert counts[("great", 1, "pos")] == 2
+    assert counts[("breakfast", 1, "all")] == 2
+    assert counts[("great breakfast", 2, "pos")] == 1
+    # mots vides exclus, pas de bigramme à cheval sur deux avis
+    assert ("was", 1, "neg") not in counts and ("negative", 1, "neu") not in counts
+    assert ("staff breakfast", 2, "all") not in counts
+
+    store = CommentStore(str(tmp_path / "comments.db"))
+    store.add_term_counts(count_terms(texts, buckets))
+    store.add_term_counts(count_terms(texts.iloc[:1], buckets.iloc[:1]))
+    store.compact()
+    assert store.term_frequencies("pos", limit=2) == {"great": 4, "breakfast": 2}
+    assert store.term_frequencies("all", (1, 2), limit=1) == {"great": 4}
+    assert store.term_frequencies("neg", (2,)) == {"cold coffee": 1}
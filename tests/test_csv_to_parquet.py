@@ -0,0 +1,67 @@
+import importlib.util
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+SCRIPT = Path(__file__).resolve().parents[1] / "scripts" / "csv_to_parquet.py"
+spec = importlib.util.spec_from_file_location("csv_to_parquet", SCRIPT)
+csv_to_parquet = importlib.util.module_from_spec(spec)
+spec.loader.exec_module(csv_to_parquet)
+
+TX_CSV = """date_mutation,nature_mutation,valeur_fonciere,code_postal,commune,\
+type_local,surface_reelle_bati,nombre_pieces_principales
+2024-01-05,Vente,"150 000,00",1000.0,BOURG,Maison,100.0,4.0
+2024-02-10,Vente,"98500,50",75001.0,PARIS 1,Appartement,25.0,1.0
+2024-03-15,Echange,320000,20000.0,AJACCIO,,,
+"""
+
+
+def test_convert_transactions(tmp_path):
+    """Schéma déclaré, codes en dictionnaire et conversions de fix_batch."""
+    csv = tmp_path / "transactions_2024.csv"
+    csv.write_text(TX_CSV, encoding="utf-8")
+
+    out, n_rows = csv_to_parquet.convert(str(csv))
+    assert (out, n_rows) == (str(tmp_path / "transactions_2024.parquet"), 3)
+    assert not (tmp_path / "transactions_2024.parquet.tmp").exists()
+
+    table = pq.read_table(out)
+    assert table.schema == pa.schema(
+        [
+            ("date_mutation", pa.date32()),
+            ("nature_mutation", csv_to_parquet.CODE),
+            ("valeur_fonciere", pa.float64()),
+            ("code_postal", pa.string()),
+            ("commune", pa.string()),
+            ("type_local", csv_to_parquet.CODE),
+            ("surface_reelle_bati", pa.float64()),
+            ("nombre_pieces_principales", pa.int16()),
+        ]
+    )
+    assert table.column("nature_mutation").chunk(0).dictionary.to_pylist() == [
+        "Vente",
+        "Echange",
+    ]
+    df = table.to_pandas()
+    assert df["valeur_fonciere"].tolist() == [150000.0, 98500.5, 320000.0]
+    assert df["code_postal"].tolist() == ["01000", "75001", "20000"]
+    assert df["nombre_pieces_principales"].tolist()[:2] == [4, 1]
+    assert df["type_local"].isna().tolist() == [False, False, True]
+
+
+def test_convert_keeps_codes_as_text(tmp_path):
+    """Sans schéma déclaré : '01' reste un code texte encodé en dictionnaire."""
+    csv = tmp_path / "region_analysis.csv"
+    csv.write_text("code_region,prix_m2_moyen\n01,2500.5\n84,3100\n", encoding="utf-8")
+    assert csv_to_parquet.schema_for(str(csv)) is None
+
+    table = pq.read_table(csv_to_parquet.convert(str(csv))[0])
+    assert table.schema.field("code_region").type == csv_to_parquet.CODE
+    assert table.column("code_region").to_pylist() == ["01", "84"]
+    assert table.schema.field("prix_m2_moyen").type == pa.float64()
+
+
+def test_fix_batch_leaves_other_columns():
+    batch = pa.RecordBatch.from_pydict({"code": ["01"], "population": [656955]})
+    assert csv_to_parquet.fix_batch(batch).equals(batch)
@@ -0,0 +1,68 @@
+import json
+from pathlib import Path
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+
+from app.geo_assets import layer_geojson, level_for_zoom, load_assets
+
+DEPARTEMENTS = (
+    Path(__file__).resolve().parents[1] / "data/raw/geo/departements_simplifie.geojson"
+)
+
+
+def coordinates(value) -> list[float]:
+    """Coordonnées (x et y) à plat d'un tableau GeoJSON imbriqué."""
+    if isinstance(value, list):
+        return [x for v in value for x in coordinates(v)]
+    return [value]
+
+
+def test_layer_geojson_by_zoom(tmp_path):
+    path = tmp_path / "geo_assets.parquet"
+    pq.write_table(
+        pa.table(
+            {
+                "layer": ["departements", "departements", "regions"],
+                "level": ["low", "high", "medium"],
+                "geojson": ['{"low": 1}', '{"high": 1}', '{"medium": 1}'],
+            }
+        ),
+        path,
+    )
+    assets = load_assets(str(path))
+
+    assert [level_for_zoom(z) for z in (5, 7, 12)] == ["low", "medium", "high"]
+    assert layer_geojson(assets, "departements", 5) == '{"low": 1}'
+    # niveau medium absent : repli sur le plus détaillé
+    assert layer_geojson(assets, "departements", 7) == '{"high": 1}'
+    assert layer_geojson(assets, "regions", 12) == '{"medium": 1}'
+
+
+def test_build_assets_on_bundled_departements(tmp_path):
+    """Trois niveaux, coordonnées arrondies, aucune entité perdue."""
+    pytest.importorskip("geopandas")
+    from backend.build_geo_assets import LEVELS, build_assets
+
+    out = tmp_path / "geo_assets.parquet"
+    assert build_assets({"departements": str(DEPARTEMENTS)}, str(out)) == len(LEVELS)
+
+    source = json.loads(DEPARTEMENTS.read_text(encoding="utf-8"))["features"]
+    codes = sorted(str(f["properties"]["code"]) for f in source)
+    rows = pq.read_table(out).to_pylist()
+    assert [(r["layer"], r["level"]) for r in rows] == [
+        ("departements", level) for level in LEVELS
+    ]
+    for row in rows:
+        features = json.loads(row["geojson"])["features"]
+        assert row["n_features"] == len(features) == len(source)
+        assert sorted(f["properties"]["code"] for f in features) == codes
+        decimals = LEVELS[row["level"]][1]
+        for f in features:
+            assert all(
+                round(c, decimals) == c
+                for c in coordinates(f["geometry"]["coordinates"])
+            )
+    sizes = [len(r["geojson"]) for r in rows]
+    assert sizes == sorted(sizes)
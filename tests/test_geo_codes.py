@@ -0,0 +1,35 @@
+import pandas as pd
+
+from backend.geo_codes import (
+    build_region_table,
+    dept_from_insee,
+    dept_from_postal,
+    region_from_dept,
+)
+
+
+def test_dept_from_postal_corse_dom():
+    """Corse (2A/2B), DOM sur 3 caractères et codes postaux lus en float."""
+    cp = pd.Series(["75001", "1000.0", 20000.0, "20200", "97100", None])
+    assert dept_from_postal(cp).tolist() == ["75", "01", "2A", "2B", "971", pd.NA]
+
+
+def test_dept_from_insee():
+    codes = pd.Series(["01001", "2A004", "2b033", "97101", "1053"])
+    assert dept_from_insee(codes).tolist() == ["01", "2A", "2B", "971", "01"]
+
+
+def test_region_from_dept(tmp_path):
+    """dept_region.csv fait foi, communes.csv complète les départements absents."""
+    dep_reg = tmp_path / "dept_region.csv"
+    dep_reg.write_text("DEP;REG\n1;84\n75;11\n", encoding="utf-8")
+    communes = tmp_path / "communes.csv"
+    communes.write_text(
+        "code;libelle;DEP;code_region\n2A004;Ajaccio;2A;94\n75056;Paris;75;99\n",
+        encoding="utf-8",
+    )
+    table = build_region_table(str(dep_reg), str(communes))
+    depts = pd.Series(["01", "75", "2A", "971"], index=[10, 11, 12, 13])
+    regions = region_from_dept(depts, table)
+    assert regions.tolist() == ["84", "11", "94", pd.NA]
+    assert regions.index.tolist() == [10, 11, 12, 13]
@@ -0,0 +1,68 @@
+import pandas as pd
+
+from backend.comment_store import CommentStore
+from backend.ingest_comments import ingest
+from backend.sentiment import BatchScorer
+
+SCORED: list[str] = []
+
+
+def fake_scores(texts):
+    """Score déterministe (longueur) ; mémorise les textes évalués."""
+    SCORED.extend(texts)
+    return [len(t) / 100 for t in texts]
+
+
+def test_single_pass_writes_csv_and_store(tmp_path):
+    raw = tmp_path / "Hotel_Reviews.csv"
+    reviews = pd.DataFrame(
+        {
+            "Hotel_Name": ["A"] * 7,
+            "Negative_Review": ["Bruyant", None, " ", "Cher", "", "Froid", "Cher"],
+            "Positive_Review": ["Calme", "Propre", " ", None, "", "Très bien", None],
+        }
+    )
+    reviews.to_csv(raw, index=False, encoding="latin1")
+    out_csv, store_path = tmp_path / "comments.csv", tmp_path / "comments.db"
+
+    scorer = BatchScorer(fake_scores, workers=1, batch=2)
+    n = ingest(str(raw), str(out_csv), str(store_path), chunk_size=3, scorer=scorer)
+
+    # nettoyage d'origine : parties nettoyées, séparateur ' ' toujours présent
+    expected = [
+        "Calme Bruyant",
+        "Propre ",
+        " ",
+        " Cher",
+        " ",
+        "Très bien Froid",
+        " Cher",
+    ]
+    assert n == 7
+    lines = out_csv.read_text(encoding="utf-8").splitlines()
+    assert lines == ["commentaire", *expected]
+    store = CommentStore(str(store_path), readonly=True)
+    page = store.page(0, 10)
+    assert page["commentaire"].tolist() == expected
+    assert page["sentiment"].tolist() == [len(t) / 100 for t in expected]
+    # " " et " Cher" en double : rattachés au premier, écartés des lectures
+    # sans doublons
+    assert page["id"].tolist() == [1, 2, 3, 4, 5, 6, 7]
+    assert store.count(unique=True) == 5
+    assert store.page(0, 10, unique=True)["id"].tolist() == [1, 2, 3, 4, 6]
+    assert store.term_frequencies()["cher"] == 2
+    assert store.term_frequencies(unique=True)["cher"] == 1
+    store.close()
+
+    # Réingestion : seuls les nouveaux avis sont évalués
+    SCORED.clear()
+    reviews.loc[len(reviews)] = ["A", "Sale", "Bien situé"]
+    reviews.to_csv(raw, index=False, encoding="latin1")
+    assert ingest(str(raw), str(out_csv), str(store_path), 3, scorer) == 8
+    assert SCORED == ["Bien situé Sale"]
+
+
+def test_process_pool_keeps_order():
+    texts = [f"avis {'x' * i}" for i in range(50)]
+    with BatchScorer(fake_scores, workers=2, batch=7) as scorer:
+        assert scorer.score(texts) == [len(t) / 100 for t in texts]
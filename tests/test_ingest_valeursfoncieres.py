@@ -0,0 +1,119 @@
+import numpy as np
+import pandas as pd
+import pyarrow.dataset as ds
+import pytest
+
+from backend import ingest_valeursfoncieres as ivf
+from backend.dvf_prep import processed_files, read_processed_files
+
+# Fichier DVF brut (séparateur '|'), dont une colonne ignorée ; <an> : millésime
+RAW_LINES = [
+    "No disposition|Date mutation|Nature mutation|Valeur fonciere|Code postal|"
+    "Commune|Type local|Surface reelle bati|Nombre pieces principales",
+    "1|05/01/<an>|Vente|150000,00|1000|BOURG|Maison|100|4",
+    "1|10/02/<an>|Vente|98500,50|75001|PARIS 1|Appartement|25|1",
+    "1|15/03/<an>|Vente|210000,00|20000|AJACCIO|Maison|90|3",
+    # doublon de la 1re mutation, dans un autre bloc
+    "1|05/01/<an>|Vente|150000,00|1000|BOURG|Maison|100|4",
+    # sans valeur foncière : écartée
+    "1|20/04/<an>|Vente||75002|PARIS 2|Appartement|40|2",
+    "1|25/05/<an>|Vente|320000,00|75002|PARIS 2|Appartement|60|3",
+]
+
+
+@pytest.fixture
+def dvf_dirs(tmp_path, monkeypatch):
+    """Arborescence data/raw + data/processed isolée dans tmp_path."""
+    raw_root, out = tmp_path / "raw", tmp_path / "processed"
+    out.mkdir()
+    monkeypatch.setattr(ivf, "RAW_ROOT", str(raw_root))
+    monkeypatch.setattr(ivf, "OUTPUT_DIR", str(out))
+    monkeypatch.setattr(ivf, "DATASET_DIR", str(out / "transactions"))
+    for year in (2023, 2024):
+        path = raw_root / f"dvf{year}" / f"valeursfoncieres-{year}.txt"
+        path.parent.mkdir(parents=True)
+        text = "\n".join(RAW_LINES)
+        path.write_text(text.replace("<an>", str(year)) + "\n", encoding="utf-8")
+    return out
+
+
+def test_ingest_year_writes_csv_and_hive_partitions(dvf_dirs):
+    """Un millésime : CSV dédoublonné et partitions year=/dept= typées."""
+    year, n_rows = ivf.ingest_year(2024, ("csv", "parquet"), chunksize=2)
+    assert (year, n_rows) == (2024, 4)
+
+    df_csv = pd.read_csv(ivf.csv_file(2024))
+    assert len(df_csv) == 4
+    assert not df_csv.duplicated().any()
+    assert df_csv["valeur_fonciere"].notna().all()
+
+    root = dvf_dirs / "transactions" / "year=2024"
+    assert sorted(p.name for p in root.iterdir()) == ["dept=01", "dept=2A", "dept=75"]
+
+    table = ds.dataset(ivf.DATASET_DIR, format="parquet", partitioning="hive").to_table(
+        filter=ds.field("year") == 2024
+    )
+    df = table.to_pandas().sort_values("date_mutation", ignore_index=True)
+    assert df["dept"].tolist() == ["01", "75", "2A", "75"]
+    assert df["code_postal"].tolist() == ["01000", "75001", "20000", "75002"]
+    assert df["valeur_fonciere"].tolist() == [150000.0, 98500.5, 210000.0, 320000.0]
+
+
+def test_rerun_replaces_year_partitions_only(dvf_dirs):
+    """Réingérer un millésime remplace ses partitions sans toucher aux autres."""
+    for year in (2023, 2024):
+        ivf.ingest_year(year, ("parquet",), chunksize=2)
+    ivf.ingest_year(2024, ("parquet",), chunksize=3)
+
+    df = ds.dataset(ivf.DATASET_DIR, format="parquet", partitioning="hive").to_table()
+    assert df.to_pandas()["year"].value_counts().to_dict() == {2023: 4, 2024: 4}
+
+
+def test_loaders_read_every_year(dvf_dirs):
+    """Les chargeurs lisent tous les CSV transactions_<année>.csv présents."""
+    for year in (2024, 2023):
+        ivf.ingest_year(year, ("csv",), chunksize=2)
+    (dvf_dirs / "transactions_2024_old.csv").write_text("ignoré\n")
+
+    paths = processed_files(str(dvf_dirs))
+    assert [p.rsplit("_", 1)[1] for p in paths] == ["2023.csv", "2024.csv"]
+    df = pd.concat(read_processed_files(paths, 3))
+    assert df["date_mutation"].dt.year.value_counts().to_dict() == {2023: 4, 2024: 4}
+    assert df["fingerprint"].is_unique
+
+
+def test_chunked_dedup_matches_full_read(tmp_path):
+    """Blocs + drop_seen = lecture complète + drop_duplicates (ancienne ingestion)."""
+    rng = np.random.default_rng(0)
+    n = 500
+    raw = pd.DataFrame(
+        {
+            "No disposition": 1,
+            "Date mutation": rng.choice(["05/01/2024", "10/02/2024", None], n),
+            "Nature mutation": "Vente",
+            "Valeur fonciere": rng.choice(["150000,00", "98500,50", None], n),
+            "Code postal": rng.choice([1000.0, 75001.0, 20000.0, None], n),
+            "Commune": rng.choice(["BOURG", "PARIS 1", "AJACCIO"], n),
+            "Type local": rng.choice(["Maison", "Appartement", None], n),
+            "Surface reelle bati": rng.choice([25.0, 100.0, None], n),
+            "Nombre pieces principales": rng.choice([1.0, 4.0, None], n),
+        }
+    )
+    path = tmp_path / "valeursfoncieres-2024.txt"
+    raw.to_csv(path, sep="|", index=False)
+
+    chunked = pd.concat(ivf.iter_clean_chunks(str(path), chunksize=37))
+
+    full = pd.read_csv(path, sep="|", low_memory=False)
+    full.columns = ivf.normalize_columns(full.columns)
+    full = full[ivf.TARGET_COLS]
+    full["date_mutation"] = pd.to_datetime(
+        full["date_mutation"], dayfirst=True, errors="coerce"
+    )
+    full = full.drop_duplicates()
+    full = full.dropna(subset=["date_mutation", "valeur_fonciere", "code_postal"])
+
+    assert len(chunked) < n / 2
+    pd.testing.assert_frame_equal(
+        chunked.reset_index(drop=True), full.reset_index(drop=True)
+    )
@@ -0,0 +1,77 @@
+import pandas as pd
+import pytest
+
+from backend.pg_partitions import (
+    bound_period,
+    partition_bounds,
+    partition_name,
+    period_starts,
+)
+
+DATES = pd.Series(["2023-12-31", "2024-01-15", "2024-01-02", None, "2024-03-01"])
+
+
+def test_period_starts():
+    """Débuts de période distincts, triés, dates manquantes ignorées."""
+    assert period_starts(DATES, "year") == [
+        pd.Timestamp("2023-01-01"),
+        pd.Timestamp("2024-01-01"),
+    ]
+    assert period_starts(DATES, "month") == [
+        pd.Timestamp("2023-12-01"),
+        pd.Timestamp("2024-01-01"),
+        pd.Timestamp("2024-03-01"),
+    ]
+    assert period_starts(pd.Series([None, None]), "month") == []
+
+
+@pytest.mark.parametrize(
+    "period,start,name,bounds",
+    [
+        ("year", "2024-01-01", "transactions_y2024", ("2024-01-01", "2025-01-01")),
+        (
+            "month",
+            "2024-12-01",
+            "transactions_y2024m12",
+            ("2024-12-01", "2025-01-01"),
+        ),
+        (
+            "month",
+            "2024-02-01",
+            "transactions_y2024m02",
+            ("2024-02-01", "2024-03-01"),
+        ),
+    ],
+)
+def test_partition_name_and_bounds(period, start, name, bounds):
+    start = pd.Timestamp(start)
+    assert partition_name("transactions", period, start) == name
+    assert partition_bounds(period, start) == bounds
+
+
+def test_partition_bounds_tile_the_dates():
+    """Chaque date tombe dans la borne [début, fin) de sa période."""
+    dates = pd.to_datetime(DATES).dropna()
+    for period in ("year", "month"):
+        ranges = [partition_bounds(period, s) for s in period_starts(dates, period)]
+        for d in dates.dt.strftime("%Y-%m-%d"):
+            assert sum(low <= d < high for low, high in ranges) == 1
+
+
+@pytest.mark.parametrize("period", ["year", "month"])
+def test_bound_period_roundtrip(period):
+    low, high = partition_bounds(period, pd.Timestamp("2024-12-01"))
+    assert bound_period(f"FOR VALUES FROM ('{low}') TO ('{high}')") == period
+
+
+@pytest.mark.parametrize(
+    "bound",
+    [
+        "FOR VALUES FROM ('2024-01-01') TO ('2024-07-01')",
+        "FOR VALUES FROM ('2024-01-15') TO ('2024-02-15')",
+        "DEFAULT",
+    ],
+)
+def test_bound_period_rejects_unknown_granularity(bound):
+    with pytest.raises(ValueError):
+        bound_period(bound)
@@ -0,0 +1,67 @@
+import sqlite3
+
+import pandas as pd
+import pytest
+
+from app.query_backend import DuckDBBackend, SQLiteBackend, open_duckdb
+from app.sqlite_pool import SQLitePool
+from backend.export_parquet_snapshot import export_snapshot
+
+
+def test_duckdb_snapshot_matches_sqlite(tmp_path):
+    """Même requête filtrée/agrégée sur SQLite et sur l'instantané Parquet."""
+    db_path = tmp_path / "homepedia.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute(
+        "CREATE TABLE transactions (id INTEGER PRIMARY KEY, date_mutation DATE, "
+        "type_local VARCHAR(50), prix_m2 FLOAT, dept VARCHAR(3))"
+    )
+    conn.executemany(
+        "INSERT INTO transactions (date_mutation, type_local, prix_m2, dept) "
+        "VALUES (?, ?, ?, ?)",
+        [
+            ("2024-01-05 00:00:00.000000", "Maison", 2500.0, "01"),
+            ("2024-03-10 00:00:00.000000", "Appartement", 4000.0, "75"),
+            ("2024-06-01 00:00:00.000000", "Appartement", 6000.0, "75"),
+            ("2025-02-01 00:00:00.000000", "Maison", None, "2A"),
+        ],
+    )
+    conn.commit()
+    conn.close()
+    export_snapshot(str(db_path), str(tmp_path / "snapshot"))
+
+    sql = (
+        "SELECT dept, COUNT(*) AS n, AVG(prix_m2) AS prix FROM transactions "
+        "WHERE date_mutation BETWEEN ? AND ? AND prix_m2 BETWEEN ? AND ? "
+        "GROUP BY dept ORDER BY dept"
+    )
+    params = ["2024-01-01", "2024-12-31", 0, 10_000]
+    results = []
+    for backend in (
+        SQLiteBackend(SQLitePool(str(db_path))),
+        DuckDBBackend(open_duckdb(tmp_path / "snapshot")),
+    ):
+        results.append(backend.query(sql, params))
+        assert backend.fetchone("SELECT COUNT(*) FROM transactions")[0] == 4
+    pd.testing.assert_frame_equal(*results, check_dtype=False)
+
+
+def test_sqlite_pool_read_only_and_reused(tmp_path):
+    db_path = tmp_path / "homepedia.db"
+    conn = sqlite3.connect(db_path)
+    conn.execute("CREATE TABLE t (x INTEGER)")
+    conn.commit()
+    conn.close()
+
+    pool = SQLitePool(str(db_path), size=2)
+    for _ in range(5):
+        with pool.connection() as c:
+            assert c.execute("SELECT COUNT(*) FROM t").fetchone() == (0,)
+    with pool.connection() as c, pytest.raises(sqlite3.OperationalError):
+        c.execute("INSERT INTO t VALUES (1)")
+
+    stats = pool.stats()
+    assert stats["created"] == 1
+    assert stats["acquired"] == 6
+    assert stats["in_use"] == 0
+    pool.close()
@@ -0,0 +1,42 @@
+import numpy as np
+import pandas as pd
+
+from app.render_cache import RenderCache, fingerprint
+
+
+def test_fingerprint_follows_data_and_style():
+    df = pd.DataFrame({"code": ["01", "02"], "taux": [7.5, 8.1]})
+    key = fingerprint("choropleth", df, "Taux (%)", {"fill_opacity": 0.7})
+
+    assert key == fingerprint(
+        "choropleth", df.copy(), "Taux (%)", {"fill_opacity": 0.7}
+    )
+    assert key != fingerprint(
+        "choropleth", df.assign(taux=[7.5, 8.2]), "Taux (%)", {"fill_opacity": 0.7}
+    )
+    assert key != fingerprint("choropleth", df, "Taux (%)", {"fill_opacity": 0.5})
+    assert fingerprint(np.arange(3)) != fingerprint(np.arange(3).astype(float))
+
+
+def test_lru_eviction_under_size_cap():
+    cache = RenderCache(max_bytes=10)
+    calls = []
+
+    def render(value):
+        def _render():
+            calls.append(value)
+            return value
+
+        return _render
+
+    assert cache.get_or_render("a", render(b"aaaa")) == b"aaaa"
+    assert cache.get_or_render("b", render("bbbb")) == "bbbb"
+    assert cache.get_or_render("a", render(b"xxxx")) == b"aaaa"  # hit : "a" récent
+    cache.get_or_render("c", render(b"cccc"))  # 12 octets > 10 : "b" évincé
+    cache.get_or_render("big", render(b"z" * 11))  # jamais conservé
+
+    assert calls == [b"aaaa", "bbbb", b"cccc", b"z" * 11]
+    assert cache.get("b") is None and cache.get("a") == b"aaaa"
+    stats = cache.stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"]) == (2, 5, 1)
+    assert (stats["entries"], stats["bytes"]) == (2, 8)
@@ -0,0 +1,80 @@
+import ast
+from pathlib import Path
+
+import pytest
+
+from app.sections import Sections
+
+VIEWS_DIR = Path(__file__).resolve().parents[1] / "src" / "app" / "views"
+
+
+def test_only_selected_section_runs():
+    """Les sections non choisies n'exécutent aucune requête."""
+    queries = []
+    sections = Sections()
+
+    @sections("Carte")
+    def carte(df):
+        queries.append(("carte", df))
+
+    @sections("Corrélations")
+    def correlations(df):
+        queries.append(("corr", df))
+        return "matrice"
+
+    assert sections.labels == ["Carte", "Corrélations"]
+    assert sections.run("Corrélations", "df") == "matrice"
+    assert queries == [("corr", "df")]
+
+    with pytest.raises(ValueError):
+        sections("Carte")(carte)
+    with pytest.raises(KeyError):
+        sections.run("Distribution", "df")
+
+
+def registered_sections(path: Path) -> list[str]:
+    """Libellés des fonctions décorées @sections("…"), dans l'ordre du module."""
+    labels = []
+    for node in ast.parse(path.read_text(encoding="utf-8")).body:
+        if isinstance(node, ast.FunctionDef):
+            labels += [
+                deco.args[0].value
+                for deco in node.decorator_list
+                if isinstance(deco, ast.Call) and ast.unparse(deco.func) == "sections"
+            ]
+    return labels
+
+
+@pytest.mark.parametrize(
+    "module,labels",
+    [
+        (
+            "socio_eco",
+            [
+                "Chômage",
+                "Revenu médian",
+                "Population",
+                "Pauvreté",
+                "Corrélation",
+                "Matrice corrélations",
+            ],
+        ),
+        ("region", ["Carte", "Distribution", "Population vs prix", "Corrélations"]),
+    ],
+)
+def test_views_dispatch_through_sections(module, labels):
+    """Chaque section est une fonction enregistrée ; render ne fait que choisir."""
+    path = VIEWS_DIR / f"{module}.py"
+    assert registered_sections(path) == labels
+
+    tree = ast.parse(path.read_text(encoding="utf-8"))
+    render = next(
+        n for n in tree.body if isinstance(n, ast.FunctionDef) and n.name == "render"
+    )
+    assert not any(isinstance(n, ast.If) for n in ast.walk(render))
+    calls = [
+        n.func.attr
+        for n in ast.walk(render)
+        if isinstance(n, ast.Call) and isinstance(n.func, ast.Attribute)
+    ]
+    assert calls.count("run") == 1
@@ -0,0 +1,30 @@
+import numpy as np
+
+from backend.sentiment_lexicon import LexiconSentiment
+
+ENGINE = LexiconSentiment(
+    {"good": 0.7, "bad": -0.7, "clean": 0.4, "very": 0.2}, {"very": 1.3}
+)
+
+
+def test_scores_match_textblob_rules():
+    scores = ENGINE.score(
+        [
+            "Good room",
+            "not good",  # négation : × -0,5
+            "Room wasn't clean",
+            "very bad",  # intensifieur : × 1,3 (et « very » compte pour 0,2)
+            "good. Not bad at all",
+            "",
+            "nothing to say",
+        ]
+    )
+    expected = [0.7, -0.35, -0.2, (0.2 - 0.91) / 2, (0.7 + 0.35) / 2, 0.0, 0.0]
+    assert np.allclose(scores, expected)
+
+
+def test_matrix_is_one_row_per_review():
+    x = ENGINE.matrix(["good good", "", "not good"])
+    assert x.shape == (3, len(ENGINE.weights))
+    assert x.getnnz(axis=1).tolist() == [1, 0, 2]
+    assert x.sum() == 4
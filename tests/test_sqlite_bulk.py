@@ -0,0 +1,155 @@
+import sqlite3
+
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine
+
+from backend import load_to_sqlite, sqlite_bulk
+from backend.dvf_prep import prepare_transactions, read_processed
+from backend.load_to_sqlite import metadata, transactions
+from backend.sqlite_bulk import bulk_load
+
+TX_COLUMNS = [c.name for c in transactions.columns if c.name != "id"]
+
+
+def sample_raw() -> pd.DataFrame:
+    """Mutations au format des CSV traités (transactions_<année>.csv)."""
+    return pd.DataFrame(
+        {
+            "date_mutation": pd.to_datetime(
+                ["2024-01-05", "2024-02-10", "2024-03-15", "2024-04-20"]
+            ),
+            "nature_mutation": ["Vente", "Vente", "Echange", "Vente"],
+            "valeur_fonciere": ["150 000,00", "98 500,50", "320000", "75 000,00"],
+            "code_postal": ["1000.0", "75001", "20000", "13001"],
+            "commune": ["BOURG", "PARIS 1", "AJACCIO", "MARSEILLE 1"],
+            "type_local": ["Maison", "Appartement", None, "Appartement"],
+            "surface_reelle_bati": [100.0, 25.0, None, 0.0],
+            "nombre_pieces_principales": [4.0, 1.0, None, 2.0],
+        }
+    )
+
+
+def sample_transactions() -> pd.DataFrame:
+    return prepare_transactions(sample_raw())
+
+
+def new_db(path) -> str:
+    metadata.create_all(create_engine(f"sqlite:///{path}"))
+    return str(path)
+
+
+def dump(path) -> list[tuple]:
+    with sqlite3.connect(path) as conn:
+        return conn.execute("SELECT * FROM transactions ORDER BY id").fetchall()
+
+
+def index_names(conn: sqlite3.Connection) -> set[str]:
+    return {
+        row[0]
+        for row in conn.execute(
+            "SELECT name FROM sqlite_master "
+            "WHERE type = 'index' AND tbl_name = 'transactions'"
+        )
+    }
+
+
+def test_bulk_load_matches_to_sql(tmp_path):
+    """Le chargement massif produit la même table que l'ancien to_sql."""
+    df = sample_transactions()
+
+    old = new_db(tmp_path / "to_sql.db")
+    df.to_sql(
+        "transactions",
+        create_engine(f"sqlite:///{old}"),
+        if_exists="append",
+        index=False,
+    )
+
+    new = new_db(tmp_path / "bulk.db")
+    with sqlite3.connect(new) as conn:
+        n_read, n_inserted = bulk_load(
+            conn, "transactions", TX_COLUMNS, [df.iloc[:2], df.iloc[2:]]
+        )
+
+    assert (n_read, n_inserted) == (4, 4)
+    assert dump(new) == dump(old)
+
+
+def test_bulk_load_failure_rolls_back_and_restores_indexes(tmp_path):
+    """Échec en cours de chargement : aucune ligne gardée, index reconstruits."""
+    df = sample_transactions()
+    db = new_db(tmp_path / "homepedia.db")
+    with sqlite3.connect(db) as conn:
+        bulk_load(conn, "transactions", TX_COLUMNS, [df.iloc[:1]])
+        indexes = index_names(conn)
+        assert "idx_transactions_dept" in indexes
+
+        # la 1re ligne est déjà chargée : le bloc viole l'index UNIQUE
+        with pytest.raises(sqlite3.IntegrityError):
+            bulk_load(conn, "transactions", TX_COLUMNS, [df.iloc[1:], df.iloc[:1]])
+
+        assert conn.execute("SELECT COUNT(*) FROM transactions").fetchone() == (1,)
+        assert index_names(conn) == indexes
+        assert not conn.in_transaction
+
+
+def test_reload_is_idempotent(tmp_path, monkeypatch):
+    """Rechargement du même CSV : 0 ligne ; CSV étendu : seules les nouvelles."""
+    monkeypatch.setattr(sqlite_bulk, "ROWS_PER_TRANSACTION", 2)
+    raw = sample_raw()
+    csv = tmp_path / "transactions_2024.csv"
+    db = new_db(tmp_path / "homepedia.db")
+
+    def load(mode: str) -> tuple[int, int]:
+        with sqlite3.connect(db) as conn:
+            return bulk_load(
+                conn,
+                "transactions",
+                TX_COLUMNS,
+                read_processed(str(csv), 2),
+                ignore_duplicates=mode == "incremental",
+            )
+
+    raw.iloc[:3].to_csv(csv, index=False)
+    assert load("incremental") == (3, 3)
+    assert load("incremental") == (3, 0)
+
+    raw.to_csv(csv, index=False)
+    assert load("incremental") == (4, 1)
+    assert len(dump(db)) == 4
+
+
+def test_strict_mode_is_atomic(tmp_path, monkeypatch):
+    """Mode strict : un doublon dans un bloc tardif n'en laisse aucun chargé."""
+    monkeypatch.setattr(sqlite_bulk, "ROWS_PER_TRANSACTION", 1)
+    df = sample_transactions()
+    db = new_db(tmp_path / "homepedia.db")
+    with sqlite3.connect(db) as conn:
+        bulk_load(conn, "transactions", TX_COLUMNS, [df.iloc[:1]])
+        with pytest.raises(sqlite3.IntegrityError):
+            bulk_load(
+                conn,
+                "transactions",
+                TX_COLUMNS,
+                [df.iloc[1:2], df.iloc[2:], df.iloc[:1]],
+            )
+    assert len(dump(db)) == 1
+
+
+def test_outdated_schema_is_refused(tmp_path, monkeypatch):
+    """Table sans fingerprint : erreur explicite, table et lignes intactes."""
+    db = tmp_path / "homepedia.db"
+    with sqlite3.connect(db) as conn:
+        conn.execute("CREATE TABLE transactions (id INTEGER, date_mutation DATE)")
+        conn.execute("INSERT INTO transactions VALUES (1, '2024-01-05')")
+    monkeypatch.setattr(load_to_sqlite, "engine", create_engine(f"sqlite:///{db}"))
+
+    with pytest.raises(RuntimeError, match="fingerprint"):
+        load_to_sqlite.check_schema()
+    with sqlite3.connect(db) as conn:
+        assert conn.execute("SELECT COUNT(*) FROM transactions").fetchone() == (1,)
+
+    other = new_db(tmp_path / "current.db")
+    monkeypatch.setattr(load_to_sqlite, "engine", create_engine(f"sqlite:///{other}"))
+    load_to_sqlite.check_schema()
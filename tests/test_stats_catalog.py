@@ -0,0 +1,31 @@
+import sqlite3
+
+from backend.stats_catalog import CATALOG_TABLE, parse_catalog, refresh_catalog
+
+
+def test_refresh_catalog(tmp_path):
+    conn = sqlite3.connect(tmp_path / "homepedia.db")
+    conn.execute(
+        "CREATE TABLE transactions (date_mutation DATE, nature_mutation TEXT, "
+        "type_local TEXT, prix_m2 FLOAT, dept TEXT)"
+    )
+    conn.executemany(
+        "INSERT INTO transactions VALUES (?, 'Vente', ?, ?, ?)",
+        [
+            ("2023-05-02 00:00:00.000000", "Maison", 1000.0, "01"),
+            ("2024-11-30 00:00:00.000000", "Appartement", 3000.0, "75"),
+            ("2024-01-15 00:00:00.000000", None, None, "75"),
+        ],
+    )
+    refresh_catalog(conn)
+    # un second rafraîchissement remplace le premier
+    refresh_catalog(conn)
+
+    cat = parse_catalog(conn.execute(f"SELECT key, value FROM {CATALOG_TABLE}"))
+    assert cat["rows"] == 3
+    assert (cat["date_min"], cat["date_max"]) == ("2023-05-02", "2024-11-30")
+    assert cat["distinct_type_local"] == ["Appartement", "Maison"]
+    assert (cat["prix_m2_min"], cat["prix_m2_max"]) == (1000.0, 3000.0)
+    assert cat["prix_m2_percentiles"]["p50"] in (1000.0, 3000.0)
+    assert cat["rows_by_dept"] == {"01": 1, "75": 2}
+    conn.close()
@@ -0,0 +1,91 @@
+import gzip
+import io
+import os
+import sqlite3
+import tempfile
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+
+from app.query_backend import SQLiteBackend
+from app.sqlite_pool import SQLitePool
+from app.tx_export import ExportTooLarge, export_transactions
+from app.tx_queries import TxFilter
+
+
+@pytest.fixture
+def db(tmp_path):
+    path = tmp_path / "homepedia.db"
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            "CREATE TABLE transactions (date_mutation TIMESTAMP, type_local TEXT, "
+            "nombre_pieces_principales INTEGER, prix_m2 REAL)"
+        )
+        conn.executemany(
+            "INSERT INTO transactions VALUES (?, ?, ?, ?)",
+            [
+                (
+                    f"2024-01-{d:02d} 00:00:00",
+                    "Maison",
+                    None if d % 3 else d,
+                    1000.0 + d,
+                )
+                for d in range(1, 31)
+            ],
+        )
+    return SQLiteBackend(SQLitePool(str(path)))
+
+
+FLT = TxFilter("2024-01-01", "2024-01-20", "Tous", 0, 5000)
+
+
+# Types acceptés par st.download_button (marshall_file de streamlit) ; tout
+# autre objet fichier lève RuntimeError("Invalid binary data format")
+DOWNLOAD_TYPES = (str, bytes, io.BytesIO, io.BufferedReader, io.RawIOBase)
+
+
+def test_export_csv_and_parquet_by_chunks(db):
+    with export_transactions(db, FLT, "csv", chunk_rows=7) as csv:
+        df = pd.read_csv(gzip.open(csv.file))
+    assert csv.rows == len(df) == 20 and csv.file_name.endswith(".csv.gz")
+    assert not os.path.exists(csv.path)
+
+    with export_transactions(db, FLT, "parquet", chunk_rows=7) as parquet:
+        table = pq.read_table(parquet.file)
+    assert parquet.rows == table.num_rows == 20
+    # schéma stable malgré les blocs sans aucune valeur entière
+    assert str(table.schema.field("nombre_pieces_principales").type) == "int64"
+    assert str(table.schema.field("date_mutation").type) == "timestamp[us]"
+
+
+@pytest.mark.parametrize("fmt", ["csv", "parquet"])
+def test_export_file_is_accepted_by_download_button(db, fmt):
+    """L'objet passé à st.download_button est d'un type que streamlit sait lire."""
+    with export_transactions(db, FLT, fmt) as export:
+        assert isinstance(export.file, DOWNLOAD_TYPES)
+        assert export.file.tell() == 0
+        assert len(export.file.read()) == export.size
+
+
+def test_export_through_streamlit_marshall_file(db):
+    button = pytest.importorskip("streamlit.elements.widgets.button")
+    from streamlit.proto.DownloadButton_pb2 import DownloadButton
+
+    with export_transactions(db, FLT, "parquet") as export:
+        button.marshall_file(
+            "export", export.file, DownloadButton(), export.mime, export.file_name
+        )
+
+
+def test_export_budgets(db, tmp_path, monkeypatch):
+    monkeypatch.setattr(tempfile, "tempdir", str(tmp_path / "tmp"))
+    (tmp_path / "tmp").mkdir()
+    with pytest.raises(ExportTooLarge):
+        export_transactions(db, FLT, "csv", max_rows=10)
+    with pytest.raises(ExportTooLarge):
+        export_transactions(db, FLT, "parquet", max_bytes=100, chunk_rows=5)
+    # fichier temporaire de l'export abandonné supprimé
+    assert os.listdir(tmp_path / "tmp") == []
+    # la connexion empruntée pour la lecture par blocs est rendue au pool
+    assert db.stats()["in_use"] == 0
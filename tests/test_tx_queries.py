@@ -0,0 +1,54 @@
+import sqlite3
+
+import numpy as np
+import pandas as pd
+
+from app.query_backend import SQLiteBackend
+from app.sqlite_pool import SQLitePool
+from app.tx_queries import TxFilter, dept_means, histogram, kpis, type_quartiles
+
+
+def test_aggregates_match_pandas(tmp_path):
+    """KPI, histogramme, quartiles et moyennes SQL = calcul pandas sur les lignes."""
+    rng = np.random.default_rng(0)
+    n = 5000
+    df = pd.DataFrame(
+        {
+            "date_mutation": pd.to_datetime("2024-01-01")
+            + pd.to_timedelta(rng.integers(0, 365, n), unit="D"),
+            "type_local": rng.choice(["Maison", "Appartement", "Local"], n),
+            "prix_m2": rng.lognormal(8, 0.5, n),
+            "surface_reelle_bati": rng.integers(10, 200, n).astype(float),
+            "dept": rng.choice(["01", "75", "2A"], n),
+        }
+    )
+    db_path = tmp_path / "homepedia.db"
+    with sqlite3.connect(db_path) as conn:
+        df.assign(
+            date_mutation=df["date_mutation"].dt.strftime("%Y-%m-%d %H:%M:%S.%f")
+        ).to_sql("transactions", conn, index=False)
+
+    flt = TxFilter("2024-02-01", "2024-10-31", "Tous", 1000, 8000)
+    sel = df[
+        df["date_mutation"].between("2024-02-01", "2024-10-31")
+        & df["prix_m2"].between(1000, 8000)
+    ]
+    db = SQLiteBackend(SQLitePool(str(db_path)))
+
+    k = kpis(db, flt)
+    assert k["n"] == len(sel)
+    assert np.isclose(k["prix_m2_moyen"], sel["prix_m2"].mean())
+    assert k["surface_mediane"] == sel["surface_reelle_bati"].median()
+
+    _, counts = histogram(db, flt)
+    expected, _ = np.histogram(sel["prix_m2"], bins=len(counts), range=(1000, 8000))
+    assert (counts == expected).all()
+
+    for s in type_quartiles(db, flt):
+        x = sel.loc[sel["type_local"] == s["label"], "prix_m2"].to_numpy()
+        q1, med, q3 = np.percentile(x, [25, 50, 75])
+        assert np.allclose([s["q1"], s["med"], s["q3"]], [q1, med, q3])
+        assert s["whishi"] == x[x <= q3 + 1.5 * (q3 - q1)].max()
+
+    means = dept_means(db, flt).set_index("code")["prix_m2_moyen"]
+    assert np.allclose(means.sort_index(), sel.groupby("dept")["prix_m2"].mean())
@@ -0,0 +1,42 @@
+import ast
+import importlib.util
+import subprocess
+import sys
+from pathlib import Path
+
+from app.views import VIEWS
+
+APP = Path(__file__).resolve().parents[1] / "src" / "app"
+# Chargés seulement par la fonction qui s'en sert (tracé, export)
+LAZY = {"folium", "wordcloud", "seaborn", "scipy", "pyarrow", "textblob", "tinydb"}
+
+
+def top_level_imports(path: Path) -> set[str]:
+    names = set()
+    for node in ast.parse(path.read_text(encoding="utf-8")).body:
+        if isinstance(node, ast.Import):
+            names.update(alias.name.split(".")[0] for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module:
+            names.add(node.module.split(".")[0])
+    return names
+
+
+def test_registry_is_light_and_complete():
+    code = "import sys, app.views; print(sorted(sys.modules))"
+    out = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        check=True,
+        env={"PYTHONPATH": str(APP.parent)},
+    ).stdout
+    assert "streamlit" not in out and "matplotlib" not in out
+    for module in VIEWS.values():
+        assert importlib.util.find_spec(f"app.views.{module}") is not None
+
+
+def test_heavy_dependencies_are_not_imported_at_module_level():
+    shell = {APP / "streamlit_app.py", APP / "views" / "common.py"}
+    for path in shell | set((APP / "views").glob("*.py")):
+        heavy = LAZY | ({"matplotlib"} if path in shell else set())
+        assert not top_level_imports(path) & heavy, path.name